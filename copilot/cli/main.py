@@ -2,17 +2,22 @@ import typer
 import json
 from rich.console import Console
 from rich.table import Table
+from rich.live import Live
+from rich.progress import Progress
 from rich.panel import Panel
 from rich.markdown import Markdown
+from rich.markup import escape
 from typing import List, Optional, Dict
 import os
 from pathlib import Path
-from datetime import datetime
+from datetime import datetime, timedelta, timezone
 
 from ..core.config import ConfigManager
 from ..providers.registry import ProviderRegistry, ScraperCapability
 from ..providers.llm.groq import GroqProvider
 from ..providers.llm.ollama import OllamaProvider
+from ..providers.llm.rate_limit import AIMDRateLimiter, RateLimitedLLMProvider
+from ..providers.llm.cache import LLMResponseCache, CachedLLMProvider
 from ..providers.scrapers.reddit import RedditScraper
 from ..providers.scrapers.hackernews import HackerNewsScraper
 from ..providers.scrapers.apify_g2 import ApifyG2Scraper
@@ -20,7 +25,8 @@ from ..providers.scrapers.apify_capterra import ApifyCapterraScraper
 from ..providers.scrapers.producthunt import ProductHuntScraper
 from ..providers.storage.sqlite_provider import SQLiteProvider
 from ..providers.storage.base import StorageProvider
-from ..modules.discovery import DiscoveryModule
+from ..modules.discovery import DiscoveryModule, new_run_id
+from ..modules.prefilter import LexicalPrefilter, labelled_sample_from_storage
 from ..modules.validation import ValidationModule
 from ..modules.monitor import MonitorModule
 from ..modules.leads import LeadModule
@@ -28,7 +34,7 @@ from ..modules.outreach import OutreachModule
 from ..providers.crm.hubspot_provider import HubSpotProvider
 from ..providers.crm.salesforce_provider import SalesForceProvider
 from ..modules.export import ExportModule
-from ..modules.scoring import ScoringModule
+from ..modules.scoring import ScoringModule, resolve_weights
 from ..modules.persona import PersonaModule
 
 app = typer.Typer(help="Founder Co-Pilot CLI - Discovery and Validation Engine.")
@@ -36,12 +42,37 @@ console = Console()
 config_manager = ConfigManager()
 
 
+def get_llm_cache() -> LLMResponseCache:
+    cache_path = config_manager.get("llm_cache_path") or str(
+        Path(config_manager.get("db_path")).parent / "llm_cache.db"
+    )
+    return LLMResponseCache(
+        db_path=cache_path,
+        ttl_seconds=float(config_manager.get("llm_cache_ttl_days", 30)) * 86400,
+        max_entries=int(config_manager.get("llm_cache_max_entries", 100000)),
+    )
+
+
+def _print_cache_stats(llm) -> None:
+    if isinstance(llm, CachedLLMProvider):
+        stats = llm.stats()
+        console.print(
+            f"[dim]LLM cache: {stats['hits']} hits, {stats['misses']} misses "
+            f"({stats['hit_rate']:.0%} hit rate)[/dim]"
+        )
+
+
 def get_registry() -> ProviderRegistry:
     registry = ProviderRegistry()
 
     # --- Storage (always SQLite for now) ---
     db_path = config_manager.get("db_path")
-    storage = SQLiteProvider(db_path=db_path)
+    storage = SQLiteProvider(
+        db_path=db_path,
+        busy_timeout=config_manager.get("sqlite_busy_timeout", 5.0),
+        cache_size_kb=config_manager.get("sqlite_cache_size_kb", 65536),
+        mmap_size_mb=config_manager.get("sqlite_mmap_size_mb", 256),
+    )
     storage.initialize()
     registry.register_storage(storage)
 
@@ -51,7 +82,6 @@ def get_registry() -> ProviderRegistry:
         api_key = config_manager.get("groq_api_key") or os.getenv("GROQ_API_KEY")
         llm = GroqProvider()
         llm.configure({"api_key": api_key})
-        registry.register_llm(llm)
     elif llm_name == "ollama":
         llm = OllamaProvider()
         llm.configure(
@@ -60,16 +90,28 @@ def get_registry() -> ProviderRegistry:
                 "model": config_manager.get("ollama_model", "llama3"),
             }
         )
-        registry.register_llm(llm)
     elif llm_name == "mock":
         from ..providers.llm.mock import MockLLMProvider
 
         llm = MockLLMProvider()
         llm.configure({})
-        registry.register_llm(llm)
     else:
         raise ValueError(f"Unsupported LLM: {llm_name}. Available: groq, ollama, mock")
 
+    limiter = AIMDRateLimiter(
+        rate_per_minute=float(config_manager.get("llm_rate_per_minute", 30)),
+        max_rate_per_minute=float(config_manager.get("llm_max_rate_per_minute", 600)),
+        burst=int(config_manager.get("llm_concurrency", 4)),
+    )
+    llm = RateLimitedLLMProvider(llm, limiter)
+    if config_manager.get("llm_cache_enabled", True) not in (False, "false", "0"):
+        llm = CachedLLMProvider(
+            llm,
+            get_llm_cache(),
+            prompt_version=str(config_manager.get("llm_prompt_version", "1")),
+        )
+    registry.register_llm(llm)
+
     # --- CRM ---
     crm_name = config_manager.get("crm_provider")
     if crm_name == "hubspot":
@@ -212,6 +254,37 @@ def _build_targets_dict(
     return result
 
 
+def _stream_opportunities(stream, scoring_module, min_score, sentiment, render):
+    """Score discovery results as they arrive, re-rendering a live table.
+
+    All scores are saved in one bulk upsert once the stream ends. Returns the
+    number of signals received and the (score, post, pain) rows that passed
+    the score and sentiment filters.
+    """
+    signal_count = 0
+    rows = []
+    scores = []
+    with Live(render(rows), console=console, transient=True) as live:
+        for post, pain in stream:
+            signal_count += 1
+            try:
+                score = scoring_module.compute_score(post, pain)
+            except Exception as e:
+                console.print(f"[red]Error scoring post {post.id}: {e}[/red]")
+                continue
+            scores.append(score)
+            if score.final_score < min_score:
+                continue
+            if sentiment != "all" and pain.sentiment_label != sentiment:
+                continue
+            rows.append((score, post, pain))
+            live.update(render(rows))
+    # Every score is kept, not just the displayed ones, so later top-N reads
+    # come straight from storage
+    scoring_module.save_scores(scores)
+    return signal_count, rows
+
+
 @app.command()
 def discover(
     subreddits: Optional[List[str]] = typer.Option(
@@ -237,15 +310,30 @@ def discover(
         "--sentiment",
         help="Filter by sentiment: 'frustrated', 'desperate', 'all'",
     ),
+    no_cache: bool = typer.Option(
+        False, "--no-cache", help="Bypass the LLM response cache"
+    ),
+    resume: Optional[str] = typer.Option(
+        None, "--resume", help="Resume an interrupted run by its id (see 'copilot runs')"
+    ),
 ):
     """Discover high-signal pain points from social media."""
     registry = get_registry()
     llm_name = config_manager.get("llm_provider")
     storage = registry.get_storage("sqlite")
+    llm = registry.get_llm(llm_name)
+    if no_cache:
+        llm.bypass = True
 
     # Resolve targets
     targets_dict = {}
-    if target:
+    if resume:
+        run = storage.get_run(resume)
+        if not run:
+            console.print(f"[red]No discovery run '{resume}' found.[/red]")
+            raise typer.Exit(code=1)
+        targets_dict = run["targets"]
+    elif target:
         targets_dict = _build_targets_dict(registry, source, target)
     else:
         # Legacy fallback
@@ -269,47 +357,60 @@ def discover(
 
     discovery_module = DiscoveryModule(
         scraper=relevant_scrapers,
-        llm=registry.get_llm(llm_name),
+        llm=llm,
         storage=storage,
     )
     scoring_module = ScoringModule(storage)
 
-    with console.status("[bold green]Discovering pain points..."):
-        # Discovery returns (post, pain_score)
-        results = discovery_module.discover(
-            targets_dict, min_score=0.0
-        )  # Get all, filter later by OppScore
-
-    if not results:
-        console.print("[yellow]No signals found with current criteria.[/yellow]")
-        return
+    def render(rows, title="Discovered Opportunity Signals"):
+        table = Table(title=title)
+        table.add_column("Score", justify="right", style="cyan")
+        table.add_column("Source", style="blue")
+        table.add_column("Title", style="magenta")
+        table.add_column("Channel", style="green")
+        table.add_column("Pain", justify="right")
+        table.add_column("Engage", justify="right")
+
+        ranked = sorted(rows, key=lambda r: r[0].final_score, reverse=True)
+        for score, post, _ in ranked[: limit * len(targets_dict)]:  # Approximate limit display
+            table.add_row(
+                f"{score.final_score:.2f}",
+                score.source,
+                post.title[:50] + "..." if len(post.title) > 50 else post.title,
+                post.display_channel,
+                f"{score.pain_intensity:.2f}",
+                f"{score.engagement_norm:.2f}",
+            )
+        return table
 
-    # Compute Opportunity Scores
-    with console.status("[bold blue]Computing Opportunity Scores..."):
-        # This saves scores to DB
-        opp_scores = scoring_module.compute_scores_for_posts(results)
+    run_id = resume or new_run_id()
+    console.print(
+        f"[dim]Run {run_id}. If it is interrupted, continue it with: "
+        f"copilot discover --resume {run_id}[/dim]"
+    )
 
-    # Filter & Sort
-    filtered_scores = []
-    for score in opp_scores:
-        if score.final_score < min_score:
-            continue
+    # Discovery yields (post, pain) as each post is scored; filter later by OppScore
+    signal_count, filtered_scores = _stream_opportunities(
+        discovery_module.discover_stream(targets_dict, min_score=0.0, run_id=run_id),
+        scoring_module,
+        min_score,
+        sentiment,
+        lambda rows: render(rows, title="Discovering pain points..."),
+    )
 
-        # Check sentiment filter
-        # Need to fetch the signal to check sentiment label?
-        # Or check if OpportunityScore has it? OpportunityScore has sentiment_intensity
-        # But filter is by label.
-        # We can look up the post/signal from results list or storage.
-        # Optimization: OpportunityScore doesn't store label.
-        # But we have 'results' list which has (post, pain).
-
-        # Find corresponding pain info
-        pain = next((p for post, p in results if post.id == score.post_id), None)
-        if sentiment != "all" and pain:
-            if pain.sentiment_label != sentiment:
-                continue
+    run_stats = discovery_module.last_run_stats
+    console.print(
+        f"[dim]Posts: {run_stats.new} new, {run_stats.changed} changed, "
+        f"{run_stats.reused} reused from previous runs, "
+        f"{run_stats.retried} retried after a failed analysis, "
+        f"{run_stats.duplicates} near-duplicates, "
+        f"{run_stats.resumed} resumed from the checkpoint; "
+        f"{run_stats.prefiltered} skipped by the prefilter (LLM calls saved)[/dim]"
+    )
 
-        filtered_scores.append(score)
+    if not signal_count:
+        console.print("[yellow]No signals found with current criteria.[/yellow]")
+        return
 
     if not filtered_scores:
         console.print(
@@ -317,35 +418,150 @@ def discover(
         )
         return
 
-    table = Table(title="Discovered Opportunity Signals")
-    table.add_column("Score", justify="right", style="cyan")
+    table = render(filtered_scores)
+    console.print(table)
+    console.print(
+        f"\n[bold green]Found {len(filtered_scores)} signals. Data saved to {config_manager.get('db_path')}[/bold green]"
+    )
+    _print_cache_stats(llm)
+
+
+@app.command()
+def runs(
+    limit: int = typer.Option(20, "--limit", "-l", help="Number of runs to show"),
+):
+    """List recent discovery runs and how far they got."""
+    registry = get_registry()
+    storage = registry.get_storage("sqlite")
+
+    table = Table(title="Discovery Runs")
+    table.add_column("Run", style="cyan")
+    table.add_column("Started", style="blue")
+    table.add_column("Status", style="magenta")
+    table.add_column("Targets")
+    table.add_column("Analyzed", justify="right", style="green")
+
+    for run in storage.list_runs(limit=limit):
+        targets = run["targets"]
+        if isinstance(targets, dict):
+            targets = [f"{name}:{t}" for name, ts in targets.items() for t in ts]
+        table.add_row(
+            run["run_id"],
+            (run["created_at"] or "")[:19],
+            run["status"],
+            ", ".join(targets),
+            f"{run['analyzed'] or 0}/{run['posts']}",
+        )
+    console.print(table)
+
+
+@app.command()
+def trends(
+    days: int = typer.Option(30, "--days", help="Compare the last N days to the N before"),
+    source: str = typer.Option("all", "--source", help="Source filter"),
+    top: int = typer.Option(10, "--top", help="Terms to show per source"),
+    min_count: int = typer.Option(
+        3, "--min-count", help="Minimum mentions in the recent window"
+    ),
+    backfill: bool = typer.Option(
+        False, "--backfill", help="Rebuild the daily term rollups first"
+    ),
+):
+    """Show the fastest-rising terms per source from the daily term rollups."""
+    registry = get_registry()
+    storage = registry.get_storage("sqlite")
+
+    if backfill:
+        with console.status("[bold blue]Rebuilding term rollups..."):
+            rows = storage.rebuild_term_rollups()
+        console.print(f"[green]Rebuilt {rows} daily term counts.[/green]")
+
+    src_filter = None if source == "all" else source
+    rising = storage.get_rising_terms(
+        days=days, source=src_filter, limit=top, min_count=min_count
+    )
+    if not rising:
+        console.print("[yellow]No rising terms yet. Run discover first.[/yellow]")
+        return
+
+    table = Table(title=f"Rising Terms: last {days} days vs the {days} before")
     table.add_column("Source", style="blue")
-    table.add_column("Title", style="magenta")
-    table.add_column("Channel", style="green")
-    table.add_column("Pain", justify="right")
-    table.add_column("Engage", justify="right")
-
-    for score in filtered_scores[
-        : limit * len(targets_dict)
-    ]:  # Approximate limit display
-        # Fetch post title/channel for display
-        post = storage.get_post_by_id(score.post_id)
-        if not post:
-            continue
+    table.add_column("Term", style="magenta")
+    table.add_column("Recent", justify="right", style="green")
+    table.add_column("Previous", justify="right")
+    table.add_column("Growth", justify="right", style="cyan")
 
+    for row in rising:
         table.add_row(
-            f"{score.final_score:.2f}",
-            score.source,
-            post.title[:50] + "..." if len(post.title) > 50 else post.title,
-            post.display_channel,
-            f"{score.pain_intensity:.2f}",
-            f"{score.engagement_norm:.2f}",
+            row["source"],
+            row["term"],
+            str(row["recent"]),
+            str(row["previous"]),
+            f"{row['growth']:.1f}x",
+        )
+    console.print(table)
+
+
+def _parse_since(value: str) -> str:
+    """ISO date for ``--since``: either a date/datetime or a number of days like 7d."""
+    if value[:-1].isdigit() and value[-1].lower() == "d":
+        return (datetime.now(timezone.utc) - timedelta(days=int(value[:-1]))).date().isoformat()
+    return datetime.fromisoformat(value).isoformat()
+
+
+@app.command()
+def search(
+    query: str = typer.Argument(
+        ..., help='Full-text query: words, "exact phrases", OR, NOT, prefix*'
+    ),
+    source: str = typer.Option("all", "--source", help="Source filter"),
+    since: Optional[str] = typer.Option(
+        None, "--since", help="Only posts since a date (2025-01-31) or N days ago (7d)"
+    ),
+    limit: int = typer.Option(20, "--limit", "-l", help="Max results"),
+    recent: bool = typer.Option(
+        False, "--recent", help="Newest first instead of most relevant first"
+    ),
+):
+    """Search stored posts and their analysis, ranked by relevance (BM25)."""
+    registry = get_registry()
+    storage = registry.get_storage("sqlite")
+
+    src_filter = None if source == "all" else source
+    try:
+        since_filter = _parse_since(since) if since else None
+        results = storage.search_posts(
+            query,
+            source=src_filter,
+            since=since_filter,
+            limit=limit,
+            order="recent" if recent else "rank",
         )
+    except ValueError as e:
+        console.print(f"[red]Error: {e}[/red]")
+        raise typer.Exit(code=1)
+
+    if not results:
+        console.print(f"[yellow]No posts match '{query}'.[/yellow]")
+        return
+
+    table = Table(title=f"Search: '{query}'")
+    table.add_column("Rank", justify="right", style="cyan")
+    table.add_column("Source", style="blue")
+    table.add_column("Date", style="green")
+    table.add_column("Title", style="magenta")
+    table.add_column("Match")
 
+    for result in results:
+        post = result["post"]
+        table.add_row(
+            f"{result['rank']:.2f}",
+            post.source,
+            post.created_at.date().isoformat(),
+            post.title[:60],
+            escape(result["snippet"] or ""),
+        )
     console.print(table)
-    console.print(
-        f"\n[bold green]Found {len(filtered_scores)} signals. Data saved to {config_manager.get('db_path')}[/bold green]"
-    )
 
 
 @app.command()
@@ -385,60 +601,45 @@ def scan(
     # Build targets: {scraper_name: [query]}
     targets_dict = {s.name: [query] for s in scrapers}
 
-    with console.status(
-        f"[bold green]Scanning {len(scrapers)} platforms for '{query}'...[/bold green]"
-    ):
-        results = discovery_module.discover(targets_dict, min_score=0.0)
+    sort_keys = {
+        "recency": lambda r: r[0].recency,
+        "engagement": lambda r: r[0].engagement_norm,
+    }
+    sort_key = sort_keys.get(sort, lambda r: r[0].final_score)  # score
+
+    def render(rows, title=f"Scan Results: '{query}'"):
+        table = Table(title=title)
+        table.add_column("Score", justify="right", style="cyan")
+        table.add_column("Source", style="blue")
+        table.add_column("Title", style="magenta")
+        table.add_column("Sentiment", style="yellow")
+
+        for score, post, pain in sorted(rows, key=sort_key, reverse=True)[
+            : limit * len(scrapers)
+        ]:
+            table.add_row(
+                f"{score.final_score:.2f}",
+                score.source,
+                post.title[:60] + "...",
+                pain.sentiment_label or "N/A",
+            )
+        return table
+
+    signal_count, filtered = _stream_opportunities(
+        discovery_module.discover_stream(targets_dict, min_score=0.0),
+        scoring_module,
+        min_score,
+        sentiment,
+        lambda rows: render(
+            rows, title=f"Scanning {len(scrapers)} platforms for '{query}'..."
+        ),
+    )
 
-    if not results:
+    if not signal_count:
         console.print("[yellow]No results found.[/yellow]")
         return
 
-    with console.status("[bold blue]Computing Scores..."):
-        opp_scores = scoring_module.compute_scores_for_posts(results)
-
-    # Filter
-    filtered = []
-    for score in opp_scores:
-        if score.final_score < min_score:
-            continue
-
-        pain = next((p for post, p in results if post.id == score.post_id), None)
-        if sentiment != "all" and pain and pain.sentiment_label != sentiment:
-            continue
-
-        filtered.append(score)
-
-    # Sort
-    if sort == "recency":
-        filtered.sort(key=lambda x: x.recency, reverse=True)
-    elif sort == "engagement":
-        filtered.sort(key=lambda x: x.engagement_norm, reverse=True)
-    else:  # score
-        filtered.sort(key=lambda x: x.final_score, reverse=True)
-
-    # Display
-    table = Table(title=f"Scan Results: '{query}'")
-    table.add_column("Score", justify="right", style="cyan")
-    table.add_column("Source", style="blue")
-    table.add_column("Title", style="magenta")
-    table.add_column("Sentiment", style="yellow")
-
-    for score in filtered[: limit * len(scrapers)]:
-        post = storage.get_post_by_id(score.post_id)
-        pain = storage.get_signal(score.post_id)
-        if not post:
-            continue
-
-        sent_label = pain.sentiment_label if pain else "N/A"
-
-        table.add_row(
-            f"{score.final_score:.2f}",
-            score.source,
-            post.title[:60] + "...",
-            sent_label,
-        )
-
+    table = render(filtered)
     console.print(table)
 
 
@@ -481,31 +682,91 @@ def rank(
     limit: int = typer.Option(500, "--limit", help="Max posts to re-rank"),
     top: int = typer.Option(20, "--top", help="Show top N results"),
     source: str = typer.Option("all", "--source", help="Source filter"),
+    persist: bool = typer.Option(
+        False,
+        "--persist",
+        help="Rescore every analyzed post in the DB (ignores --limit)",
+    ),
+    chunk_size: int = typer.Option(
+        500, "--chunk-size", help="Posts scored and saved per chunk with --persist"
+    ),
+    workers: Optional[int] = typer.Option(
+        None,
+        "--workers",
+        "-w",
+        help="Processes scoring chunks in parallel with --persist (default: scoring_workers config)",
+    ),
+    weights: Optional[str] = typer.Option(
+        None,
+        "--weights",
+        help="Re-rank stored scores with a weight profile: a name (default, pain, "
+        "traction, trending, buyer or one from weight_profiles) or a JSON file",
+    ),
 ):
-    """Re-compute Opportunity Scores for stored posts."""
+    """Re-compute Opportunity Scores for stored posts and save them.
+
+    With --weights, stored scores are re-ranked from their saved dimensions
+    instead, without rescoring anything.
+    """
     registry = get_registry()
     storage = registry.get_storage("sqlite")
     scoring = ScoringModule(storage)
 
     src_filter = None if source == "all" else source
-    posts = storage.get_posts(limit=limit, source=src_filter)
 
-    results = []
-    for post in posts:
-        pain = storage.get_signal(post.id)
-        if pain:
-            results.append((post, pain))
+    if weights:
+        try:
+            profile = resolve_weights(
+                weights, config_manager.get("weight_profiles", {})
+            )
+        except (ValueError, OSError) as e:
+            console.print(f"[red]Error: {e}[/red]")
+            raise typer.Exit(code=1)
 
-    with console.status(f"[bold blue]Re-ranking {len(results)} posts..."):
-        scores = scoring.compute_scores_for_posts(results)
+    if persist:
+        workers = workers or config_manager.get("scoring_workers", 1)
+        with Progress(console=console, transient=True) as progress:
+            task = progress.add_task(
+                f"[bold blue]Rescoring with {workers} worker(s)...", total=None
+            )
+            total = scoring.rescore_all(
+                chunk_size=chunk_size,
+                source=src_filter,
+                workers=workers,
+                progress=lambda done, count: progress.update(
+                    task, completed=done, total=count
+                ),
+            )
+        console.print(f"[dim]Saved {total} opportunity scores.[/dim]")
 
-    table = Table(title=f"Top {top} Re-Ranked Opportunities")
+    if weights:
+        scores = scoring.get_top_opportunities(
+            limit=top, weights=profile, source=src_filter
+        )
+        posts_by_id = storage.get_posts_by_ids([score.post_id for score in scores])
+    elif persist:
+        view = storage.get_scored_view(limit=top, source=src_filter)
+        scores = [score for score, _, _ in view]
+        posts_by_id = {post.id: post for _, post, _ in view}
+    else:
+        posts = storage.get_posts(limit=limit, source=src_filter)
+        signals = storage.get_signals([post.id for post in posts])
+        results = [(post, signals[post.id]) for post in posts if post.id in signals]
+
+        with console.status(f"[bold blue]Re-ranking {len(results)} posts..."):
+            scores = scoring.compute_scores_for_posts(results)
+        posts_by_id = {post.id: post for post, _ in results}
+
+    title = f"Top {top} Re-Ranked Opportunities"
+    if weights:
+        title += f" ({weights} weights)"
+    table = Table(title=title)
     table.add_column("Score", style="cyan")
     table.add_column("Source", style="blue")
     table.add_column("Title", style="magenta")
 
     for score in scores[:top]:
-        post = storage.get_post_by_id(score.post_id)
+        post = posts_by_id.get(score.post_id)
         if post:
             table.add_row(f"{score.final_score:.2f}", score.source, post.title[:60])
 
@@ -519,10 +780,16 @@ def sentiment(
     force: bool = typer.Option(
         False, "--force", help="Re-analyze even if sentiment exists"
     ),
+    no_cache: bool = typer.Option(
+        False, "--no-cache", help="Bypass the LLM response cache"
+    ),
 ):
     """Run sentiment analysis on stored posts."""
     registry = get_registry()
     storage = registry.get_storage("sqlite")
+    llm = registry.get_llm(config_manager.get("llm_provider"))
+    if no_cache:
+        llm.bypass = True
     # Need discovery module to use analyze_pain_intensity (or extract just that part)
     # Ideally should use DiscoveryModule but bypass scraping.
     # However DiscoveryModule.analyze_pain_intensity is what we need.
@@ -531,37 +798,121 @@ def sentiment(
     src_filter = None if source == "all" else source
     posts = storage.get_posts(limit=limit, source=src_filter)
 
-    count = 0
-    with console.status("[bold green]Analyzing sentiment..."):
-        for post in posts:
-            signal = storage.get_signal(post.id)
+    stored_signals = storage.get_signals([post.id for post in posts])
+    pending = []
+    for post in posts:
+        signal = stored_signals.get(post.id)
 
-            # Skip if signal exists and has sentiment, unless forced
-            if signal and not force and signal.sentiment_label:
-                continue
+        # Skip if signal exists and has sentiment, unless forced
+        if signal and not force and signal.sentiment_label:
+            continue
+        pending.append((post, signal))
 
-            # Re-analyze using LLM
-            new_pain = discovery.analyze_pain_intensity(post)
+    count = 0
+    with console.status("[bold green]Analyzing sentiment..."):
+        # Re-analyze using LLM (batched when llm_batch_size > 1)
+        new_pains = discovery.analyze_posts([post for post, _ in pending])
 
+        signals = {}
+        for (post, signal), new_pain in zip(pending, new_pains):
             if signal:
                 # Update existing signal
                 signal.sentiment_label = new_pain.sentiment_label
                 signal.sentiment_intensity = new_pain.sentiment_intensity
-                storage.save_signal(post.id, signal)
+                signals[post.id] = signal
             else:
                 # Create new signal (backfill)
-                storage.save_signal(post.id, new_pain)
+                signals[post.id] = new_pain
 
             # Also update post table
             post.sentiment_label = new_pain.sentiment_label
             post.sentiment_intensity = new_pain.sentiment_intensity
-            storage.save_post(post)
 
             count += 1
 
+        with storage.transaction():
+            storage.save_signals(signals)
+            storage.save_posts([post for post, _ in pending])
+
     console.print(
         f"[bold green]Successfully analyzed and updated {count} posts.[/bold green]"
     )
+    _print_cache_stats(llm)
+
+
+@app.command()
+def cache(
+    command: Optional[str] = typer.Argument(
+        "stats", help="Subcommand: stats, purge, clear"
+    ),
+):
+    """Inspect or clear the persistent LLM response cache."""
+    llm_cache = get_llm_cache()
+
+    if command == "stats":
+        console.print(f"LLM cache: {llm_cache.db_path}")
+        console.print(f"Entries: {len(llm_cache)}")
+    elif command == "purge":
+        removed = llm_cache.purge_expired()
+        console.print(f"[green]Removed {removed} expired cache entries.[/green]")
+    elif command == "clear":
+        removed = llm_cache.clear()
+        console.print(f"[green]Removed {removed} cache entries.[/green]")
+    else:
+        console.print(f"[red]Unknown cache command '{command}'.[/red]")
+        raise typer.Exit(code=1)
+    llm_cache.close()
+
+
+@app.command()
+def prefilter(
+    command: Optional[str] = typer.Argument(
+        "report", help="Subcommand: report, calibrate"
+    ),
+    target_recall: Optional[float] = typer.Option(
+        None, "--target-recall", help="Share of real pain points to keep (calibrate)"
+    ),
+    sample: int = typer.Option(
+        1000, "--sample", help="Stored, analyzed posts used as the labelled sample"
+    ),
+):
+    """Calibrate or evaluate the local prefilter that runs before the LLM."""
+    registry = get_registry()
+    storage = registry.get_storage("sqlite")
+    lexical = LexicalPrefilter(config_manager.get("prefilter_thresholds", {}))
+    labelled = labelled_sample_from_storage(storage, limit=sample)
+
+    if not labelled:
+        console.print("[yellow]No analyzed posts stored yet. Run discover first.[/yellow]")
+        return
+
+    if command == "calibrate":
+        recall = target_recall or config_manager.get("prefilter_target_recall", 0.95)
+        lexical.calibrate(labelled, target_recall=recall)
+        config_manager.set("prefilter_thresholds", lexical.thresholds)
+        console.print(
+            f"[green]Calibrated prefilter thresholds for {recall:.0%} recall.[/green]"
+        )
+    elif command != "report":
+        console.print(f"[red]Unknown prefilter command '{command}'.[/red]")
+        raise typer.Exit(code=1)
+
+    table = Table(title=f"Prefilter on {len(labelled)} labelled posts")
+    table.add_column("Source", style="blue")
+    table.add_column("Threshold", justify="right", style="cyan")
+    table.add_column("Posts", justify="right")
+    table.add_column("LLM calls saved", justify="right", style="green")
+    table.add_column("Est. recall loss", justify="right", style="red")
+
+    for report in lexical.evaluate(labelled):
+        table.add_row(
+            report.source,
+            f"{report.threshold:.3f}",
+            str(report.sample_size),
+            f"{report.skipped} ({report.calls_saved_rate:.0%})",
+            f"{report.missed_positives}/{report.positives} ({report.recall_loss:.1%})",
+        )
+    console.print(table)
 
 
 @app.command()
@@ -627,7 +978,9 @@ def monitor(
 ):
     """Monitor subreddits for new signals and competitor mentions."""
     subs = subreddits or config_manager.get("subreddits")
-    comps = competitors or ["OpenAI", "Anthropic", "Cursor", "Windsurf"]  # Defaults
+    comps = competitors or config_manager.get(
+        "monitor_competitors", ["OpenAI", "Anthropic", "Cursor", "Windsurf"]
+    )
 
     registry = get_registry()
     discovery = get_discovery_module(registry)
@@ -896,6 +1249,39 @@ def persona(
     )
 
 
+db_app = typer.Typer(name="db", help="Database diagnostics.")
+
+
+@db_app.command("explain")
+def db_explain(
+    strict: bool = typer.Option(
+        False, "--strict", help="Exit with code 1 if any query scans or sorts a table"
+    ),
+):
+    """Show the query plans of the storage and dashboard hot queries."""
+    registry = get_registry()
+    storage = registry.get_storage("sqlite")
+
+    results = storage.explain_queries()
+    table = Table(title="Query Plans")
+    table.add_column("Query", style="cyan")
+    table.add_column("Plan", style="white")
+    table.add_column("Status")
+    for result in results:
+        status = "[red]full scan[/red]" if result["full_scan"] else "[green]indexed[/green]"
+        table.add_row(result["name"], "\n".join(result["plan"]), status)
+    console.print(table)
+
+    scans = [result["name"] for result in results if result["full_scan"]]
+    if scans:
+        console.print(f"[yellow]{len(scans)} queries scan or sort a table: {', '.join(scans)}[/yellow]")
+        if strict:
+            raise typer.Exit(code=1)
+
+
+app.add_typer(db_app, name="db")
+
+
 crm_app = typer.Typer(name="crm", help="CRM Integrations and OAuth management.")
 
 
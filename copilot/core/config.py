@@ -56,17 +56,37 @@ class ConfigManager:
     def _default_config(self) -> Dict[str, Any]:
         return {
             "llm_provider": "groq",
-            "llm_request_delay": 2,
+            "llm_concurrency": 4,
+            "llm_batch_size": 1,
+            "llm_rate_per_minute": 30,
+            "llm_max_rate_per_minute": 600,
+            "scraper_concurrency": 2,
+            "scrape_deadline": 300,
+            "stream_queue_size": 64,
+            "prefilter_thresholds": {},
+            "prefilter_target_recall": 0.95,
+            "near_duplicate_threshold": 0.8,
             "active_scrapers": ["reddit"],
             "default_scraper": "reddit",
             "storage_provider": "sqlite",
             "db_path": str(Path.home() / ".founder_copilot" / "founder_copilot.db"),
+            "sqlite_busy_timeout": 5.0,
+            "sqlite_cache_size_kb": 65536,
+            "sqlite_mmap_size_mb": 256,
+            "llm_cache_enabled": True,
+            "llm_cache_path": str(Path.home() / ".founder_copilot" / "llm_cache.db"),
+            "llm_cache_ttl_days": 30,
+            "llm_cache_max_entries": 100000,
+            "llm_prompt_version": "1",
             "groq_api_key": os.getenv("GROQ_API_KEY", ""),
             "tavily_api_key": os.getenv("TAVILY_API_KEY", ""),
             "reddit_client_id": os.getenv("REDDIT_CLIENT_ID", ""),
             "reddit_client_secret": os.getenv("REDDIT_CLIENT_SECRET", ""),
             "reddit_user_agent": "FounderCopilot/1.1.0",
             "subreddits": ["saas", "entrepreneur", "startups"],
+            "monitor_competitors": ["OpenAI", "Anthropic", "Cursor", "Windsurf"],
+            "weight_profiles": {},
+            "scoring_workers": 1,
             "ollama_host": "http://localhost:11434",
             "ollama_model": "llama3",
             "apify_api_token": os.getenv("APIFY_API_TOKEN", ""),
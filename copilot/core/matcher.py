@@ -0,0 +1,86 @@
+import re
+from functools import lru_cache
+from typing import Dict, Iterable, Iterator, List, Mapping, NamedTuple, Set, Tuple
+
+
+class KeywordMatch(NamedTuple):
+    keyword: str  # As configured, not as written in the text
+    tier: str
+    start: int
+    end: int
+
+
+class KeywordMatcher:
+    """Matches many keywords in one pass with a single compiled regex.
+
+    Keywords are grouped into tiers (e.g. SAAS_INTENT_KEYWORDS' high/medium/low,
+    or a single "competitor" tier). Matching is case-insensitive on whole words,
+    so "vs" does not match inside "canvas". Where keywords overlap, the longest
+    one wins.
+    """
+
+    def __init__(self, tiers: Mapping[str, Iterable[str]]):
+        self._keywords: Dict[str, List[Tuple[str, str]]] = {}
+        for tier, keywords in tiers.items():
+            for keyword in keywords:
+                if keyword.strip():
+                    self._keywords.setdefault(keyword.lower(), []).append((keyword, tier))
+
+        alternatives = sorted(self._keywords, key=len, reverse=True)
+        self._pattern = (
+            re.compile(
+                r"(?<!\w)(?:" + "|".join(re.escape(k) for k in alternatives) + r")(?!\w)",
+                re.IGNORECASE,
+            )
+            if alternatives
+            else None
+        )
+
+    def finditer(self, text: str) -> Iterator[KeywordMatch]:
+        """Every keyword occurrence in ``text``, in order of position."""
+        if self._pattern is None:
+            return
+        for match in self._pattern.finditer(text):
+            for keyword, tier in self._keywords[match.group().lower()]:
+                yield KeywordMatch(keyword, tier, match.start(), match.end())
+
+    def search(self, text: str) -> bool:
+        """True if any keyword occurs in ``text``."""
+        return self._pattern is not None and self._pattern.search(text) is not None
+
+    def matched_keywords(self, text: str) -> Dict[str, Set[str]]:
+        """Distinct keywords found in ``text``, by tier."""
+        found: Dict[str, Set[str]] = {}
+        for match in self.finditer(text):
+            found.setdefault(match.tier, set()).add(match.keyword)
+        return found
+
+
+@lru_cache(maxsize=32)
+def _cached_matcher(frozen: Tuple[Tuple[str, Tuple[str, ...]], ...]) -> KeywordMatcher:
+    return KeywordMatcher(dict(frozen))
+
+
+def keyword_matcher(tiers: Mapping[str, Iterable[str]]) -> KeywordMatcher:
+    """Shared matcher for ``tiers``; only recompiled when the keywords change."""
+    return _cached_matcher(
+        tuple((tier, tuple(keywords)) for tier, keywords in tiers.items())
+    )
+
+
+def fts_any_of(keywords: Iterable[str], columns: Iterable[str] = ()) -> str:
+    """FTS5 query matching any of ``keywords`` as a whole phrase.
+
+    With ``columns``, only those columns of the full-text index are searched;
+    otherwise every indexed column is, including the stored analysis text.
+    Like KeywordMatcher, matching is case-insensitive on whole words, but FTS5
+    ignores punctuation between the words of a phrase, so it can find a few
+    posts that KeywordMatcher would not.
+    """
+    query = " OR ".join(
+        '"' + keyword.replace('"', '""') + '"' for keyword in keywords if keyword.strip()
+    )
+    columns = list(columns)
+    if columns:
+        return "{" + " ".join(columns) + "}: (" + query + ")"
+    return query
@@ -4,11 +4,18 @@ from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
 from pydantic import BaseModel
 from typing import List, Optional
-import uvicorn
 from pathlib import Path
-from datetime import datetime
+from copilot.core.config import ConfigManager
+from copilot.modules.scoring import WEIGHTS, resolve_weights
+from copilot.providers.storage.sqlite_provider import (
+    DASHBOARD_HIGH_SCORES_SQL,
+    DASHBOARD_LEADS_SQL,
+    DASHBOARD_PERSONAS_SQL,
+    SQLiteProvider,
+)
 
 app = FastAPI(title="Founder Co-Pilot Dashboard API")
+config_manager = ConfigManager()
 
 app.add_middleware(
     CORSMiddleware,
@@ -24,11 +31,45 @@ DB_PATH = os.getenv(
 
 
 def get_db_connection():
-    conn = sqlite3.connect(DB_PATH)
+    # The CLI keeps the database in WAL mode, so these reads never wait on a
+    # running discovery; the timeout only covers checkpoints and schema changes
+    conn = sqlite3.connect(DB_PATH, timeout=5.0)
     conn.row_factory = sqlite3.Row
     return conn
 
 
+_storage: Optional[SQLiteProvider] = None
+
+
+def get_storage() -> SQLiteProvider:
+    """Read-only storage shared by the endpoints that reuse its queries."""
+    global _storage
+    if _storage is None:
+        _storage = SQLiteProvider(DB_PATH, read_only=True)
+    return _storage
+
+
+def score_expression(weights: Optional[str]):
+    """SQL for the final score, re-weighted from the stored dimensions if asked.
+
+    ``weights`` is a built-in or configured (``weight_profiles``) profile name,
+    or an inline JSON object of dimension weights. File paths are refused.
+    """
+    if not weights:
+        return "os.final_score", []
+    try:
+        profile = resolve_weights(
+            weights, config_manager.get("weight_profiles", {}), allow_files=False
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    terms = " + ".join(f"? * COALESCE(os.{name}, 0.0)" for name in WEIGHTS)
+    return (
+        f"MAX(0.0, MIN(1.0, {terms} + COALESCE(os.cross_source_bonus, 0.0)))",
+        [profile[name] for name in WEIGHTS],
+    )
+
+
 @app.get("/")
 async def root():
     return {"status": "ok", "message": "Founder Co-Pilot API is running"}
@@ -40,13 +81,15 @@ async def get_signals(
     min_score: float = 0.5,
     source: Optional[str] = None,
     sentiment: Optional[str] = None,
+    weights: Optional[str] = None,
 ):
+    score_sql, score_params = score_expression(weights)
     try:
         conn = get_db_connection()
         cursor = conn.cursor()
 
-        where_conditions = ["os.final_score >= ?"]
-        params = [min_score]
+        where_conditions = [f"{score_sql} >= ?"]
+        params = score_params + [min_score]
 
         if source:
             where_conditions.append("os.source = ?")
@@ -59,18 +102,19 @@ async def get_signals(
         where_clause = " AND ".join(where_conditions)
 
         query = f"""
-        SELECT os.*, p.title, p.url, p.author, p.display_channel, p.sentiment_label as post_sentiment,
+        SELECT os.*, {score_sql} AS ranked_score,
+               p.title, p.url, p.author, p.channel AS display_channel, p.sentiment_label as post_sentiment,
                s.sentiment_label as signal_sentiment, s.sentiment_intensity, s.reasoning
         FROM opportunity_scores os
         JOIN raw_posts p ON os.post_id = p.id
         LEFT JOIN signals s ON os.post_id = s.post_id
         WHERE {where_clause}
-        ORDER BY os.final_score DESC
+        ORDER BY ranked_score DESC
         LIMIT ?
         """
 
         params.append(limit)
-        cursor.execute(query, tuple(params))
+        cursor.execute(query, tuple(score_params + params))
         rows = cursor.fetchall()
         conn.close()
 
@@ -80,7 +124,7 @@ async def get_signals(
                 {
                     "post_id": row["post_id"],
                     "source": row["source"],
-                    "final_score": row["final_score"],
+                    "final_score": row["ranked_score"],
                     "pain_intensity": row["pain_intensity"],
                     "engagement_norm": row["engagement_norm"],
                     "validation_evidence": row["validation_evidence"],
@@ -110,23 +154,11 @@ async def get_personas(limit: int = 10, persona_type: Optional[str] = None):
         conn = get_db_connection()
         cursor = conn.cursor()
 
-        where_conditions = []
-        params = []
-
-        if persona_type:
-            where_conditions.append("persona_type = ?")
-            params.append(persona_type)
-
-        where_clause = " AND ".join(where_conditions) if where_conditions else "1=1"
+        where = "WHERE persona_type = ?" if persona_type else ""
+        params = [persona_type] if persona_type else []
 
         cursor.execute(
-            f"""
-            SELECT * FROM personas
-            WHERE {where_clause}
-            ORDER BY generated_at DESC
-            LIMIT ?
-        """,
-            tuple(params + [limit]),
+            DASHBOARD_PERSONAS_SQL.format(where=where), tuple(params + [limit])
         )
 
         rows = cursor.fetchall()
@@ -164,25 +196,34 @@ async def get_personas(limit: int = 10, persona_type: Optional[str] = None):
 
 
 @app.get("/opportunities")
-async def get_opportunities(limit: int = 50, min_score: float = 0.5):
+async def get_opportunities(
+    limit: int = 50, min_score: float = 0.5, weights: Optional[str] = None
+):
+    score_sql, score_params = score_expression(weights)
     try:
         conn = get_db_connection()
         cursor = conn.cursor()
 
-        query = """
-        SELECT os.*, p.title, p.url, p.author, p.display_channel
+        query = f"""
+        SELECT os.*, {score_sql} AS ranked_score,
+               p.title, p.url, p.author, p.channel AS display_channel
         FROM opportunity_scores os
         JOIN raw_posts p ON os.post_id = p.id
-        WHERE os.final_score >= ?
-        ORDER BY os.final_score DESC
+        WHERE ranked_score >= ?
+        ORDER BY ranked_score DESC
         LIMIT ?
         """
 
-        cursor.execute(query, (min_score, limit))
+        cursor.execute(query, tuple(score_params + [min_score, limit]))
         rows = cursor.fetchall()
         conn.close()
 
-        return [dict(row) for row in rows]
+        results = []
+        for row in rows:
+            result = dict(row)
+            result["final_score"] = result.pop("ranked_score")
+            results.append(result)
+        return results
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -193,9 +234,7 @@ async def get_leads(limit: int = 50):
         conn = get_db_connection()
         cursor = conn.cursor()
 
-        cursor.execute(
-            "SELECT * FROM leads ORDER BY intent_score DESC LIMIT ?", (limit,)
-        )
+        cursor.execute(DASHBOARD_LEADS_SQL, (limit,))
         rows = cursor.fetchall()
         conn.close()
 
@@ -204,6 +243,66 @@ async def get_leads(limit: int = 50):
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@app.get("/trends")
+async def get_trends(
+    days: int = 30,
+    source: Optional[str] = None,
+    limit: int = 10,
+    min_count: int = 3,
+):
+    try:
+        rows = get_storage().get_rising_terms(
+            days=days, source=source, limit=limit, min_count=min_count
+        )
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+    trends = {}
+    for row in rows:
+        trends.setdefault(row["source"], []).append(
+            {
+                "term": row["term"],
+                "recent": row["recent"],
+                "previous": row["previous"],
+                "growth": row["growth"],
+            }
+        )
+    return trends
+
+
+@app.get("/search")
+async def search(
+    q: str,
+    source: Optional[str] = None,
+    since: Optional[str] = None,
+    limit: int = 20,
+    order: str = "rank",
+):
+    try:
+        results = get_storage().search_posts(
+            q, source=source, since=since, limit=limit, order=order
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+    return [
+        {
+            "id": result["post"].id,
+            "source": result["post"].source,
+            "title": result["post"].title,
+            "url": result["post"].url,
+            "author": result["post"].author,
+            "created_at": result["post"].created_at.isoformat(),
+            "display_channel": result["post"].display_channel,
+            "rank": result["rank"],
+            "snippet": result["snippet"],
+        }
+        for result in results
+    ]
+
+
 @app.get("/stats")
 async def get_stats():
     try:
@@ -214,9 +313,7 @@ async def get_stats():
         cursor.execute("SELECT COUNT(*) FROM raw_posts")
         stats["total_posts"] = cursor.fetchone()[0]
 
-        cursor.execute(
-            "SELECT COUNT(*) FROM opportunity_scores WHERE final_score > 0.7"
-        )
+        cursor.execute(DASHBOARD_HIGH_SCORES_SQL, (0.7,))
         stats["high_signal_opportunities"] = cursor.fetchone()[0]
 
         cursor.execute("SELECT COUNT(*) FROM leads")
@@ -232,4 +329,6 @@ async def get_stats():
 
 
 if __name__ == "__main__":
+    import uvicorn
+
     uvicorn.run(app, host="0.0.0.0", port=8000)
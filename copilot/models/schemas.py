@@ -1,8 +1,14 @@
+import hashlib
 from pydantic import BaseModel, Field
 from typing import Optional, Dict, Any, List
 from datetime import datetime
 
 
+def compute_content_hash(title: str, body: Optional[str]) -> str:
+    """Stable hash of a post's title + body, used to detect edited posts."""
+    return hashlib.sha1(f"{title}\n{body or ''}".encode("utf-8")).hexdigest()
+
+
 class ScrapedPost(BaseModel):
     """Unified representation of a post scraped from any source."""
 
@@ -39,6 +45,11 @@ class ScrapedPost(BaseModel):
             return f"r/{self.subreddit}"
         return self.source
 
+    @property
+    def content_hash(self) -> str:
+        """Stable hash of title + body, used to detect edited posts."""
+        return compute_content_hash(self.title, self.body)
+
 
 class PainScore(BaseModel):
     """Model for pain point intensity scoring."""
@@ -58,6 +69,42 @@ class PainScore(BaseModel):
     sentiment_label: Optional[str] = None
     sentiment_intensity: float = Field(default=0.0, ge=0, le=1)
 
+    # Placeholder for an analysis the LLM failed; never reused or trusted
+    failed: bool = False
+
+
+class DiscoveryRunStats(BaseModel):
+    """Counters reported by a discovery run."""
+
+    run_id: Optional[str] = None  # Pass to ``discover --resume`` if the run dies
+    scraped: int = 0
+    new: int = 0  # Never analyzed before
+    changed: int = 0  # Analyzed before, but title/body changed since
+    reused: int = 0  # Unchanged; stored PainScore reused without an LLM call
+    retried: int = 0  # Unchanged, but their last analysis failed; sent to the LLM again
+    prefiltered: int = 0  # Rejected by the local prefilter; LLM calls saved
+    duplicates: int = 0  # New/changed posts that reuse a near-duplicate's PainScore
+    resumed: int = 0  # Analyzed before an interrupted run stopped; not re-analyzed
+
+
+class PrefilterReport(BaseModel):
+    """How a per-source prefilter threshold performs on a labelled sample."""
+
+    source: str
+    threshold: float
+    sample_size: int = 0
+    positives: int = 0  # Posts the LLM judged to be real pain points
+    skipped: int = 0  # Posts below the threshold, i.e. LLM calls saved
+    missed_positives: int = 0  # Positives that the threshold would drop
+
+    @property
+    def calls_saved_rate(self) -> float:
+        return self.skipped / self.sample_size if self.sample_size else 0.0
+
+    @property
+    def recall_loss(self) -> float:
+        return self.missed_positives / self.positives if self.positives else 0.0
+
 
 class OpportunityScore(BaseModel):
     """Unified cross-platform opportunity ranking score."""
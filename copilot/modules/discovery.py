@@ -1,12 +1,18 @@
 import json
 import logging
+import queue
+import threading
 import time
+import uuid
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from datetime import datetime, timezone
-from typing import List, Optional, Union, Dict
+from typing import Any, List, Optional, Union, Dict, Iterator
 from ..providers.base import ScraperProvider, LLMProvider
 from ..providers.storage.base import StorageProvider
-from ..models.schemas import ScrapedPost, PainScore
+from ..models.schemas import ScrapedPost, PainScore, DiscoveryRunStats
 from ..core.config import ConfigManager, SAAS_INTENT_KEYWORDS
+from ..core.text import NearDuplicateIndex, content_minhash
+from .prefilter import LexicalPrefilter
 
 SENTIMENT_SCORES = {
     "frustrated": 0.7,
@@ -16,9 +22,26 @@ SENTIMENT_SCORES = {
     "positive": 0.1,
 }
 
+PAIN_RESULT_FIELDS = """
+        - score: A float between 0.0 and 1.0 (0 = no pain, 1 = high intensity/frequent problem)
+        - reasoning: A brief explanation of why you gave this score.
+        - detected_problems: A list of strings identifying specific problems.
+        - suggested_solutions: A list of strings (not objects) describing potential solutions.
+        - validation_score: A float between 0.0 and 1.0 (How much validation/evidence of need is in the post?)
+        - sentiment_label: One of "frustrated", "desperate", "curious", "neutral", "positive"
+        - sentiment_intensity: A float between 0.0 and 1.0 indicating emotional intensity (0.0 = casual mention, 0.5 = clear frustration, 0.8 = desperate/urgent, 1.0 = business-critical)
+        """
+
+PAIN_SYSTEM_PROMPT = "You are an expert product researcher specializing in identifying high-signal founder opportunities from social signals. You output strictly valid JSON."
+
 logger = logging.getLogger(__name__)
 
 
+def new_run_id() -> str:
+    """Short random id for a discovery run."""
+    return uuid.uuid4().hex[:12]
+
+
 class DiscoveryModule:
     """Core logic for finding and classifying high-signal pain points.
 
@@ -38,7 +61,17 @@ class DiscoveryModule:
         self.llm = llm
         self.storage = storage
         self.config = ConfigManager()
-        self.llm_request_delay = float(self.config.get("llm_request_delay", 2))
+        self.llm_concurrency = max(1, int(self.config.get("llm_concurrency", 4)))
+        self.llm_batch_size = max(1, int(self.config.get("llm_batch_size", 1)))
+        self.last_run_stats = DiscoveryRunStats()
+        self.scraper_concurrency = max(1, int(self.config.get("scraper_concurrency", 2)))
+        self.scrape_deadline = float(self.config.get("scrape_deadline", 300))
+        self.stream_queue_size = max(1, int(self.config.get("stream_queue_size", 64)))
+        self.prefilter = LexicalPrefilter(self.config.get("prefilter_thresholds", {}))
+        # Estimated Jaccard similarity for near-duplicates; 0 disables the check
+        self.near_duplicate_threshold = float(
+            self.config.get("near_duplicate_threshold", 0.8)
+        )
 
         if self.storage:
             self.storage.initialize()
@@ -57,17 +90,100 @@ class DiscoveryModule:
             self.scrapers.append(value)
 
     def _passes_prefilter(self, post: ScrapedPost) -> bool:
-        """Platform-aware heuristic filtering before LLM."""
+        """Platform-aware heuristic filtering before LLM.
+
+        Engagement floors come first, then the calibrated lexical prefilter.
+        """
         if post.source == "reddit":
-            return post.upvotes >= 5 or post.comments_count >= 2
+            if not (post.upvotes >= 5 or post.comments_count >= 2):
+                return False
         elif post.source == "hackernews":
-            return post.upvotes >= 3 or post.comments_count >= 1
-        return True
+            if not (post.upvotes >= 3 or post.comments_count >= 1):
+                return False
+        return self.prefilter.passes(post)
+
+    def _scrape_jobs(
+        self, targets: List[str] | Dict[str, List[str]]
+    ) -> List[tuple[ScraperProvider, str]]:
+        """Expand legacy (list) or per-scraper (dict) targets into (scraper, target) jobs."""
+        if isinstance(targets, list):
+            return [(scraper, sub) for sub in targets for scraper in self.scrapers]
+        return [
+            (scraper, target)
+            for scraper in self.scrapers
+            for target in targets.get(scraper.name, [])
+        ]
+
+    def iter_fetch(
+        self,
+        targets: List[str] | Dict[str, List[str]],
+        limit_per_target: int = 50,
+        skip: Optional[set] = None,
+    ) -> Iterator[tuple[str, str, List[ScrapedPost]]]:
+        """Scrape all targets concurrently, yielding results as each job finishes.
+
+        Every scraper gets its own worker pool capped at ``scraper_concurrency``,
+        so a slow or failing provider only ties up its own workers. Jobs still
+        running when ``scrape_deadline`` (seconds) expires are abandoned; jobs
+        that finished while the consumer held up the generator are still yielded.
+        (scraper_name, target) pairs in ``skip`` are not scraped.
+
+        Yields:
+            Tuples of (scraper_name, target, posts)
+        """
+        jobs = []
+        for scraper, target in self._scrape_jobs(targets):
+            scraper_name = getattr(scraper, "name", type(scraper).__name__)
+            if not skip or (scraper_name, target) not in skip:
+                jobs.append((scraper, scraper_name, target))
+        if not jobs:
+            return
+
+        pools: Dict[int, ThreadPoolExecutor] = {}
+        futures = {}
+        for scraper, scraper_name, target in jobs:
+            pool = pools.get(id(scraper))
+            if pool is None:
+                pool = ThreadPoolExecutor(max_workers=self.scraper_concurrency)
+                pools[id(scraper)] = pool
+            future = pool.submit(scraper.scrape, target=target, limit=limit_per_target)
+            futures[future] = (scraper_name, target)
+
+        deadline = time.monotonic() + self.scrape_deadline
+        pending = set(futures)
+        try:
+            while pending:
+                # Collect whatever finished while the generator was suspended
+                # first, so the deadline only ever cuts off unfinished jobs
+                done = {future for future in pending if future.done()}
+                if not done:
+                    remaining = deadline - time.monotonic()
+                    if remaining > 0:
+                        done, _ = wait(pending, timeout=remaining, return_when=FIRST_COMPLETED)
+                    if not done:
+                        abandoned = [f"{n}/{t}" for f, (n, t) in futures.items() if f in pending]
+                        logger.warning(
+                            f"Scrape deadline of {self.scrape_deadline:.0f}s reached, "
+                            f"abandoning: {', '.join(abandoned)}"
+                        )
+                        return
+                pending -= done
+                for future in done:
+                    scraper_name, target = futures[future]
+                    try:
+                        posts = future.result()
+                    except Exception as e:
+                        logger.error(f"Error scraping {scraper_name}/{target}: {e}")
+                        continue
+                    yield scraper_name, target, posts
+        finally:
+            for pool in pools.values():
+                pool.shutdown(wait=False, cancel_futures=True)
 
     def fetch_potential_pains(
         self, targets: List[str] | Dict[str, List[str]], limit_per_target: int = 50
     ) -> List[ScrapedPost]:
-        """Fetch posts from multiple sources and targets.
+        """Fetch posts from multiple sources and targets concurrently.
 
         Args:
             targets: Either a list of subreddit names (legacy) or a dict mapping
@@ -75,26 +191,32 @@ class DiscoveryModule:
             limit_per_target: Maximum items to fetch per target
         """
         all_posts = []
+        for _, _, posts in self.iter_fetch(targets, limit_per_target):
+            all_posts.extend(posts)
+        return all_posts
 
-        if isinstance(targets, list):
-            for sub in targets:
-                for scraper in self.scrapers:
-                    try:
-                        posts = scraper.scrape(target=sub, limit=limit_per_target)
-                        all_posts.extend(posts)
-                    except Exception as e:
-                        logger.error(f"Error scraping r/{sub} with {scraper.name}: {e}")
-        else:
-            for scraper in self.scrapers:
-                scraper_targets = targets.get(scraper.name, [])
-                for target in scraper_targets:
-                    try:
-                        posts = scraper.scrape(target=target, limit=limit_per_target)
-                        all_posts.extend(posts)
-                    except Exception as e:
-                        logger.error(f"Error scraping {scraper.name}/{target}: {e}")
+    def _build_pain_score(self, data: Dict) -> PainScore:
+        """Normalize the sentiment fields of a raw LLM result into a PainScore."""
+        sentiment_label = data.get("sentiment_label")
+        sentiment_intensity = data.get("sentiment_intensity", 0.0)
 
-        return all_posts
+        if sentiment_intensity > 0 and not sentiment_label:
+            if sentiment_intensity >= 0.8:
+                sentiment_label = "desperate"
+            elif sentiment_intensity >= 0.6:
+                sentiment_label = "frustrated"
+            elif sentiment_intensity >= 0.4:
+                sentiment_label = "curious"
+            else:
+                sentiment_label = "neutral"
+
+        if sentiment_label and sentiment_intensity == 0.0:
+            sentiment_intensity = SENTIMENT_SCORES.get(sentiment_label, 0.5)
+
+        data["sentiment_label"] = sentiment_label
+        data["sentiment_intensity"] = sentiment_intensity
+
+        return PainScore(**data)
 
     def analyze_pain_intensity(self, post: ScrapedPost) -> PainScore:
         """Use LLM to analyze the intensity of the pain point described in a post."""
@@ -105,51 +227,149 @@ class DiscoveryModule:
         Title: {post.title}
         Body: {post.body or "N/A"}
 
-        Return a JSON object with:
-        - score: A float between 0.0 and 1.0 (0 = no pain, 1 = high intensity/frequent problem)
-        - reasoning: A brief explanation of why you gave this score.
-        - detected_problems: A list of strings identifying specific problems.
-        - suggested_solutions: A list of strings (not objects) describing potential solutions.
-        - validation_score: A float between 0.0 and 1.0 (How much validation/evidence of need is in the post?)
-        - sentiment_label: One of "frustrated", "desperate", "curious", "neutral", "positive"
-        - sentiment_intensity: A float between 0.0 and 1.0 indicating emotional intensity (0.0 = casual mention, 0.5 = clear frustration, 0.8 = desperate/urgent, 1.0 = business-critical)
-        """
-
-        system_prompt = "You are an expert product researcher specializing in identifying high-signal founder opportunities from social signals. You output strictly valid JSON."
+        Return a JSON object with:{PAIN_RESULT_FIELDS}"""
 
         try:
-            time.sleep(self.llm_request_delay)  # Added delay before LLM call
             response_text = self.llm.complete(
                 prompt=prompt,
-                system_prompt=system_prompt,
+                system_prompt=PAIN_SYSTEM_PROMPT,
                 response_format={"type": "json_object"},
             )
 
-            data = json.loads(response_text)
+            return self._build_pain_score(json.loads(response_text))
+        except Exception as e:
+            logger.error(f"Error analyzing post {post.id}: {e}")
+            return PainScore(score=0.0, reasoning=f"Analysis failed: {str(e)}", failed=True)
 
-            sentiment_label = data.get("sentiment_label")
-            sentiment_intensity = data.get("sentiment_intensity", 0.0)
+    def analyze_pain_batch(self, posts: List[ScrapedPost]) -> List[PainScore]:
+        """Analyze several posts in one LLM request via ``complete_batch``.
 
-            if sentiment_intensity > 0 and not sentiment_label:
-                if sentiment_intensity >= 0.8:
-                    sentiment_label = "desperate"
-                elif sentiment_intensity >= 0.6:
-                    sentiment_label = "frustrated"
-                elif sentiment_intensity >= 0.4:
-                    sentiment_label = "curious"
-                else:
-                    sentiment_label = "neutral"
+        Posts missing from the batch response, or whose entry does not parse,
+        are re-analyzed one by one. If the whole batch fails every post falls
+        back to ``analyze_pain_intensity``.
+        """
+        if len(posts) <= 1:
+            return [self.analyze_pain_intensity(post) for post in posts]
 
-            if sentiment_label and sentiment_intensity == 0.0:
-                sentiment_intensity = SENTIMENT_SCORES.get(sentiment_label, 0.5)
+        instructions = f"""
+        Analyze each of the following social media posts to determine if it expresses a 'pain point' (a problem, frustration, or unmet need).
 
-            data["sentiment_label"] = sentiment_label
-            data["sentiment_intensity"] = sentiment_intensity
+        For every post, return an object with:{PAIN_RESULT_FIELDS}"""
+        items = {
+            post.id: f"Title: {post.title}\nBody: {post.body or 'N/A'}"
+            for post in posts
+        }
 
-            return PainScore(**data)
+        try:
+            batch = self.llm.complete_batch(
+                items,
+                instructions,
+                system_prompt=PAIN_SYSTEM_PROMPT,
+                response_format={"type": "json_object"},
+            )
+            if not isinstance(batch, dict):
+                raise ValueError("complete_batch did not return a mapping")
         except Exception as e:
-            logger.error(f"Error analyzing post {post.id}: {e}")
-            return PainScore(score=0.0, reasoning=f"Analysis failed: {str(e)}")
+            logger.warning(
+                f"Batch analysis of {len(posts)} posts failed, falling back to per-post calls: {e}"
+            )
+            batch = {}
+
+        scores = []
+        for post in posts:
+            data = batch.get(post.id)
+            if isinstance(data, dict):
+                try:
+                    scores.append(self._build_pain_score(data))
+                    continue
+                except Exception as e:
+                    logger.warning(f"Invalid batch result for post {post.id}: {e}")
+            scores.append(self.analyze_pain_intensity(post))
+        return scores
+
+    def analyze_posts(self, posts: List[ScrapedPost]) -> List[PainScore]:
+        """Analyze posts with up to ``llm_concurrency`` LLM calls in flight.
+
+        When ``llm_batch_size`` is greater than one, posts are packed into
+        batches of that size and each batch costs a single request. Pacing is
+        left to the provider layer (see RateLimitedLLMProvider). Results are
+        returned in the same order as ``posts``.
+        """
+        size = self.llm_batch_size
+        chunks = [posts[i : i + size] for i in range(0, len(posts), size)]
+
+        if self.llm_concurrency <= 1 or len(chunks) <= 1:
+            results = [self.analyze_pain_batch(chunk) for chunk in chunks]
+        else:
+            with ThreadPoolExecutor(max_workers=self.llm_concurrency) as pool:
+                results = list(pool.map(self.analyze_pain_batch, chunks))
+
+        return [score for chunk in results for score in chunk]
+
+    def _reusable_signals(self, posts: List[ScrapedPost]) -> Dict[str, PainScore]:
+        """Look up, in bulk, stored signals for posts whose content is unchanged.
+
+        Failed analyses are not reused, so those posts go back to the LLM.
+        Updates the new/changed/reused/retried counters of ``last_run_stats``.
+        """
+        stats = self.last_run_stats
+        if not posts or not self.storage or not hasattr(self.storage, "get_content_hashes"):
+            stats.new += len(posts)
+            return {}
+
+        try:
+            known_hashes = self.storage.get_content_hashes([p.id for p in posts])
+            unchanged = [
+                p.id
+                for p in posts
+                if p.id in known_hashes and known_hashes[p.id] == p.content_hash
+            ]
+            signals = self.storage.get_signals(unchanged) if unchanged else {}
+        except Exception as e:
+            logger.error(f"Error looking up known signals: {e}")
+            stats.new += len(posts)
+            return {}
+
+        reusable = {}
+        for post in posts:
+            if post.id in signals and not signals[post.id].failed:
+                reusable[post.id] = signals[post.id]
+                stats.reused += 1
+            elif post.id in signals:
+                stats.retried += 1
+            elif post.id in known_hashes:
+                stats.changed += 1
+            else:
+                stats.new += 1
+        return reusable
+
+    def _near_duplicate_signals(self, posts: List[ScrapedPost]) -> Dict[str, PainScore]:
+        """Copies of the stored PainScores of the canonical posts that ``posts`` near-duplicate."""
+        if (
+            not posts
+            or self.near_duplicate_threshold <= 0
+            or not self.storage
+            or not hasattr(self.storage, "find_near_duplicates")
+        ):
+            return {}
+
+        try:
+            canonical = self.storage.find_near_duplicates(
+                posts, threshold=self.near_duplicate_threshold
+            )
+            canonical_ids = {canonical[p.id] for p in posts if p.id in canonical}
+            signals = self.storage.get_signals(list(canonical_ids)) if canonical_ids else {}
+        except Exception as e:
+            logger.error(f"Error looking up near-duplicates: {e}")
+            return {}
+
+        duplicates = {}
+        for post in posts:
+            signal = signals.get(canonical.get(post.id))
+            if signal is not None and not signal.failed:
+                duplicates[post.id] = signal.model_copy()
+        self.last_run_stats.duplicates += len(duplicates)
+        return duplicates
 
     def calculate_engagement_score(self, post: ScrapedPost) -> float:
         """Calculate engagement score (0-1) based on upvotes and comments."""
@@ -179,6 +399,263 @@ class DiscoveryModule:
             return 0.2
         return 0.0
 
+    def _passes_min_score(
+        self, post: ScrapedPost, pain_info: PainScore, min_score: float
+    ) -> bool:
+        """Fill in the composite metrics; True if the post passes ``min_score``."""
+        pain_info.engagement_score = self.calculate_engagement_score(post)
+        pain_info.recency_score = self.calculate_recency_score(post)
+
+        # Formula: Value = (Pain * 0.4) + (Engagement * 0.25) + (Validation * 0.25) + (Recency * 0.10)
+        pain_info.composite_value = (
+            (pain_info.score * 0.4)
+            + (pain_info.engagement_score * 0.25)
+            + (pain_info.validation_score * 0.25)
+            + (pain_info.recency_score * 0.10)
+        )
+        return pain_info.composite_value >= min_score
+
+    def _persist(self, results: List[tuple[ScrapedPost, PainScore]]) -> None:
+        """Save posts and their signals in one unit of work."""
+        if not self.storage or not results:
+            return
+        try:
+            if hasattr(self.storage, "save_posts"):
+                with self.storage.transaction():
+                    self.storage.save_posts([post for post, _ in results])
+                    self.storage.save_signals(
+                        {post.id: pain_info for post, pain_info in results}
+                    )
+            else:
+                for post, pain_info in results:
+                    self.storage.save_post(post)
+                    self.storage.save_signal(post.id, pain_info)
+        except Exception as e:
+            logger.error(f"Error saving to storage: {e}")
+
+    def _checkpoint(self, method: str, *args) -> Any:
+        """Call a run-checkpoint storage method; checkpoint failures never stop a run."""
+        if not self.storage or not hasattr(self.storage, method):
+            return None
+        try:
+            return getattr(self.storage, method)(*args)
+        except Exception as e:
+            logger.error(f"Error checkpointing discovery run ({method}): {e}")
+            return None
+
+    def discover_stream(
+        self,
+        subreddits_or_targets: List[str] | Dict[str, List[str]],
+        min_score: float = 0.5,
+        limit_per_target: int = 50,
+        run_id: Optional[str] = None,
+    ) -> Iterator[tuple[ScrapedPost, PainScore]]:
+        """Streaming pipeline: scrape -> prefilter -> analyze -> score -> persist.
+
+        A scraper thread prefilters posts as each target finishes while
+        ``llm_concurrency`` workers analyze them, and this generator scores,
+        persists and yields every post as soon as its analysis is back. At most
+        ``stream_queue_size`` posts are in flight between the stages, so a slow
+        LLM throttles scraping instead of letting posts pile up in memory.
+        Storage is only touched from the consuming thread.
+
+        Every run is checkpointed under ``run_id`` (generated when omitted and
+        reported in ``last_run_stats``): finished targets, scraped posts and
+        each post's PainScore. Passing the id of an interrupted run resumes it:
+        finished targets are not scraped again and analyzed posts are not sent
+        back to the LLM, but posts whose analysis failed are.
+
+        Results are yielded in completion order, not sorted.
+        """
+        resuming = bool(run_id and self._checkpoint("get_run", run_id))
+        run_id = run_id or new_run_id()
+        self.last_run_stats = DiscoveryRunStats(run_id=run_id)
+
+        done_targets = set()
+        resumed: List[tuple[ScrapedPost, str, Optional[PainScore]]] = []
+        if resuming:
+            done_targets = set(self._checkpoint("get_run_targets", run_id) or [])
+            resumed = list(self._checkpoint("get_run_posts", run_id) or [])
+            self._checkpoint("set_run_status", run_id, "running")
+            self.last_run_stats.resumed = sum(
+                1 for _, _, pain in resumed if pain and not pain.failed
+            )
+            logger.info(
+                f"Resuming run {run_id}: {len(done_targets)} targets and "
+                f"{len(resumed)} posts already done"
+            )
+        else:
+            self._checkpoint(
+                "create_run", run_id, subreddits_or_targets, min_score, limit_per_target
+            )
+
+        # Both queues are unbounded on their own; the ``slots`` semaphore caps
+        # the posts travelling through them, so neither side can deadlock.
+        events: queue.Queue = queue.Queue()
+        work: queue.Queue = queue.Queue()
+        slots = threading.Semaphore(self.stream_queue_size)
+        stop = threading.Event()
+
+        def scrape_stage() -> None:
+            fetch = self.iter_fetch(subreddits_or_targets, limit_per_target, skip=done_targets)
+            seen_ids = {post.id for post, _, _ in resumed}
+            try:
+                for scraper_name, target, posts in fetch:
+                    self.last_run_stats.scraped += len(posts)
+                    pending = []
+                    for post in posts:
+                        if post.id in seen_ids:
+                            continue
+                        seen_ids.add(post.id)
+                        if not self._passes_prefilter(post):
+                            self.last_run_stats.prefiltered += 1
+                            continue
+                        if not slots.acquire(blocking=False):
+                            # Hand over what we have before waiting for room
+                            if pending:
+                                events.put(("scraped", pending))
+                                pending = []
+                            while not slots.acquire(timeout=0.1):
+                                if stop.is_set():
+                                    return
+                        pending.append(post)
+                    if pending:
+                        events.put(("scraped", pending))
+                    events.put(("target_done", (scraper_name, target)))
+                    if stop.is_set():
+                        return
+            except Exception as e:
+                logger.error(f"Scrape stage failed: {e}")
+            finally:
+                fetch.close()
+                events.put(("scraped_all", None))
+
+        def analyze_stage() -> None:
+            while True:
+                chunk = work.get()
+                if chunk is None:
+                    return
+                if stop.is_set():
+                    continue
+                try:
+                    scores = self.analyze_pain_batch(chunk)
+                except Exception as e:
+                    logger.error(f"Error analyzing batch of {len(chunk)} posts: {e}")
+                    scores = [
+                        PainScore(
+                            score=0.0, reasoning=f"Analysis failed: {str(e)}", failed=True
+                        )
+                        for _ in chunk
+                    ]
+                events.put(("analyzed", list(zip(chunk, scores))))
+
+        size = self.llm_batch_size
+        # Near-duplicates of posts still being analyzed wait for their twin
+        run_index = NearDuplicateIndex(self.near_duplicate_threshold)
+        waiting: Dict[str, List[ScrapedPost]] = {}
+        outstanding = 0
+
+        def admit(posts: List[ScrapedPost]) -> List[tuple[ScrapedPost, PainScore]]:
+            """Queue posts for analysis; return those whose PainScore can be reused."""
+            nonlocal outstanding
+            reused = self._reusable_signals(posts)
+            reused.update(
+                self._near_duplicate_signals([post for post in posts if post.id not in reused])
+            )
+            fresh = []
+            for post in posts:
+                if post.id in reused:
+                    continue
+                signature = (
+                    content_minhash(post.title, post.body)
+                    if self.near_duplicate_threshold > 0
+                    else None
+                )
+                if signature is not None:
+                    twin_id = run_index.find(signature)
+                    if twin_id:
+                        waiting.setdefault(twin_id, []).append(post)
+                        self.last_run_stats.duplicates += 1
+                        outstanding += 1
+                        continue
+                    run_index.add(post.id, signature)
+                fresh.append(post)
+
+            for i in range(0, len(fresh), size):
+                work.put(fresh[i : i + size])
+            outstanding += len(fresh)
+            return [(post, reused[post.id]) for post in posts if post.id in reused]
+
+        workers = [
+            threading.Thread(target=analyze_stage, daemon=True)
+            for _ in range(self.llm_concurrency)
+        ]
+        for thread in [threading.Thread(target=scrape_stage, daemon=True), *workers]:
+            thread.start()
+
+        # Checkpointed posts never took a slot, so they must not give one back
+        unslotted = {post.id for post, _, _ in resumed}
+        # Posts whose analysis failed are analyzed again
+        scored = [(post, pain) for post, _, pain in resumed if pain and not pain.failed]
+        pending = [post for post, _, pain in resumed if not pain or pain.failed]
+        if pending:
+            scored.extend(admit(pending))
+        scraping = True
+        completed = False
+        try:
+            while True:
+                # Failed analyses stay "scraped", so resuming sends them back to the LLM
+                analyzed = [(post, pain_info) for post, pain_info in scored if not pain_info.failed]
+                if analyzed:
+                    self._checkpoint(
+                        "update_run_posts",
+                        run_id,
+                        [(post.id, "analyzed", pain_info) for post, pain_info in analyzed],
+                    )
+                passed = []
+                for post, pain_info in scored:
+                    if post.id in unslotted:
+                        unslotted.discard(post.id)
+                    else:
+                        slots.release()
+                    if self._passes_min_score(post, pain_info, min_score):
+                        passed.append((post, pain_info))
+                self._persist(passed)
+                if analyzed:
+                    self._checkpoint(
+                        "update_run_posts",
+                        run_id,
+                        [(post.id, "done", None) for post, _ in analyzed],
+                    )
+                yield from passed
+
+                if not (scraping or outstanding):
+                    break
+
+                kind, payload = events.get()
+                scored = []
+                if kind == "scraped_all":
+                    scraping = False
+                elif kind == "target_done":
+                    self._checkpoint("mark_run_target_scraped", run_id, *payload)
+                elif kind == "scraped":
+                    self._checkpoint("save_run_posts", run_id, payload)
+                    scored = admit(payload)
+                else:
+                    for post, pain_info in payload:
+                        scored.append((post, pain_info))
+                        for twin in waiting.pop(post.id, []):
+                            scored.append((twin, pain_info.model_copy()))
+                    outstanding -= len(scored)
+            completed = True
+        finally:
+            stop.set()
+            for _ in workers:
+                work.put(None)
+            self._checkpoint(
+                "set_run_status", run_id, "completed" if completed else "interrupted"
+            )
+
     def discover(
         self,
         subreddits_or_targets: List[str] | Dict[str, List[str]],
@@ -187,38 +664,11 @@ class DiscoveryModule:
         """Run full discovery pipeline: scrape -> analyze -> filter.
 
         Supports both legacy (list of subreddits) and new (dict of targets) formats.
+        Posts already analyzed with the same title/body reuse their stored
+        PainScore instead of calling the LLM; see ``last_run_stats``. Use
+        ``discover_stream`` to consume results as they are scored.
         """
-        posts = self.fetch_potential_pains(subreddits_or_targets)
-        results = []
-
-        for post in posts:
-            if not self._passes_prefilter(post):
-                continue
-
-            pain_info = self.analyze_pain_intensity(post)
-
-            # Calculate composite metrics
-            pain_info.engagement_score = self.calculate_engagement_score(post)
-            pain_info.recency_score = self.calculate_recency_score(post)
-
-            # Formula: Value = (Pain * 0.4) + (Engagement * 0.25) + (Validation * 0.25) + (Recency * 0.10)
-            pain_info.composite_value = (
-                (pain_info.score * 0.4)
-                + (pain_info.engagement_score * 0.25)
-                + (pain_info.validation_score * 0.25)
-                + (pain_info.recency_score * 0.10)
-            )
-
-            if pain_info.composite_value >= min_score:
-                results.append((post, pain_info))
-
-                # Persist to storage if available
-                if self.storage:
-                    try:
-                        self.storage.save_post(post)
-                        self.storage.save_signal(post.id, pain_info)
-                    except Exception as e:
-                        logger.error(f"Error saving to storage: {e}")
+        results = list(self.discover_stream(subreddits_or_targets, min_score=min_score))
 
         # Sort by composite value descending
         results.sort(key=lambda x: x[1].composite_value, reverse=True)
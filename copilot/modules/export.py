@@ -1,18 +1,41 @@
 import csv
-from typing import List, Union
+from itertools import chain
+from typing import Iterator, List, Optional, TypeVar, Union
 from pathlib import Path
 from datetime import datetime
 
 from ..models.schemas import Lead, ValidationReport, ScrapedPost, PainScore
 from ..providers.storage.base import StorageProvider
 
+T = TypeVar("T")
+
+
+def _peek(items: Iterator[T]) -> Optional[Iterator[T]]:
+    """``items`` unchanged, or None if it is empty."""
+    first = next(items, None)
+    if first is None:
+        return None
+    return chain([first], items)
+
+
 class ExportModule:
     def __init__(self, storage: StorageProvider):
         self.storage = storage
 
+    def _leads(self) -> Optional[Iterator[Lead]]:
+        # Streamed from storage where supported, so exports run in constant memory
+        if hasattr(self.storage, "iter_leads"):
+            return _peek(self.storage.iter_leads())
+        return _peek(iter(self.storage.get_leads(limit=None)))
+
+    def _reports(self) -> Optional[Iterator[ValidationReport]]:
+        if hasattr(self.storage, "iter_reports"):
+            return _peek(self.storage.iter_reports())
+        return _peek(iter(self.storage.get_reports(limit=None)))
+
     def export_leads_to_csv(self, file_path: Path):
-        leads = self.storage.get_leads(limit=None) # Fetch all leads
-        if not leads:
+        leads = self._leads()
+        if leads is None:
             return 0
         
         with open(file_path, 'w', newline='', encoding='utf-8') as csvfile:
@@ -20,18 +43,18 @@ class ExportModule:
             writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
             
             writer.writeheader()
-            for lead in leads:
+            for count, lead in enumerate(leads, start=1):
                 row = lead.model_dump()
                 # Flatten verified_profiles for CSV
                 if 'verified_profiles' in row and isinstance(row['verified_profiles'], dict):
                     row['verified_profiles'] = '; '.join([f"{k}: {v}" for k, v in row['verified_profiles'].items()])
                 writer.writerow(row)
-        return len(leads)
+        return count
 
     def export_leads_to_hubspot_csv(self, file_path: Path):
         """Export leads in a format compatible with HubSpot Contact Import."""
-        leads = self.storage.get_leads(limit=None)
-        if not leads:
+        leads = self._leads()
+        if leads is None:
             return 0
 
         # HubSpot standard headers for contacts
@@ -54,7 +77,7 @@ class ExportModule:
             writer = csv.DictWriter(csvfile, fieldnames=headers)
             writer.writeheader()
             
-            for lead in leads:
+            for count, lead in enumerate(leads, start=1):
                 # Simple split for name if possible, else use as Last Name
                 name_parts = lead.author.split(' ', 1)
                 first_name = name_parts[0] if len(name_parts) > 1 else ""
@@ -75,12 +98,12 @@ class ExportModule:
                     "Platform": lead.source,
                     "LinkedIn Profile": linkedin
                 })
-        return len(leads)
+        return count
 
     def export_leads_to_salesforce_csv(self, file_path: Path):
         """Export leads in a format compatible with Salesforce Lead Import."""
-        leads = self.storage.get_leads(limit=None)
-        if not leads:
+        leads = self._leads()
+        if leads is None:
             return 0
 
         # Salesforce standard headers for leads
@@ -100,7 +123,7 @@ class ExportModule:
             writer = csv.DictWriter(csvfile, fieldnames=headers)
             writer.writeheader()
             
-            for lead in leads:
+            for count, lead in enumerate(leads, start=1):
                 name_parts = lead.author.split(' ', 1)
                 first_name = name_parts[0] if len(name_parts) > 1 else ""
                 last_name = name_parts[1] if len(name_parts) > 1 else lead.author
@@ -119,11 +142,11 @@ class ExportModule:
                     "Rating": rating,
                     "Description": f"Intent Score: {lead.intent_score:.2f}. Snippet: {lead.content_snippet}"
                 })
-        return len(leads)
+        return count
 
     def export_reports_to_csv(self, file_path: Path):
-        reports = self.storage.get_reports(limit=None) # Fetch all reports
-        if not reports:
+        reports = self._reports()
+        if reports is None:
             return 0
             
         with open(file_path, 'w', newline='', encoding='utf-8') as csvfile:
@@ -131,25 +154,25 @@ class ExportModule:
             writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
             
             writer.writeheader()
-            for report in reports:
+            for count, report in enumerate(reports, start=1):
                 # Flatten complex fields for CSV
                 report_dict = report.model_dump()
                 report_dict['competitors'] = '; '.join([f"{c.get('Name', '')}: {c.get('URL', '')}" for c in report_dict.get('competitors', [])])
                 report_dict['swot_analysis'] = '; '.join([f"{k}: {', '.join(v)}" for k, v in report_dict.get('swot_analysis', {}).items()])
                 report_dict['next_steps'] = '; '.join(report_dict.get('next_steps', []))
                 writer.writerow(report_dict)
-        return len(reports)
+        return count
 
     def export_leads_to_md(self, file_path: Path):
-        leads = self.storage.get_leads(limit=None)
-        if not leads:
+        leads = self._leads()
+        if leads is None:
             return 0
 
         with open(file_path, 'w', encoding='utf-8') as mdfile:
             mdfile.write("# Potential Customer Leads\n\n")
             mdfile.write(f"Export Date: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n")
             
-            for lead in leads:
+            for count, lead in enumerate(leads, start=1):
                 mdfile.write(f"## Lead: {lead.author} (Score: {lead.intent_score:.2f})\n")
                 mdfile.write(f"- **Needs Summary:** {lead.content_snippet}\n")
                 mdfile.write(f"- **Contact URL:** [{lead.contact_url}]({lead.contact_url})\n")
@@ -157,18 +180,18 @@ class ExportModule:
                 mdfile.write(f"- **Post ID:** {lead.post_id}\n")
                 mdfile.write(f"- **Created At:** {lead.created_at.strftime('%Y-%m-%d %H:%M:%S')}\n")
                 mdfile.write("\n---\n\n")
-        return len(leads)
+        return count
 
     def export_reports_to_md(self, file_path: Path):
-        reports = self.storage.get_reports(limit=None)
-        if not reports:
+        reports = self._reports()
+        if reports is None:
             return 0
 
         with open(file_path, 'w', encoding='utf-8') as mdfile:
             mdfile.write("# Validation Reports\n\n")
             mdfile.write(f"Export Date: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n")
             
-            for report in reports:
+            for count, report in enumerate(reports, start=1):
                 mdfile.write(f"## Report for Post ID: {report.post_id}\n")
                 mdfile.write(f"### Idea Summary\n{report.idea_summary}\n\n")
                 mdfile.write(f"### Market Size Estimate\n{report.market_size_estimate}\n\n")
@@ -197,4 +220,4 @@ class ExportModule:
                 
                 mdfile.write(f"Generated At: {report.generated_at.strftime('%Y-%m-%d %H:%M:%S')}\n")
                 mdfile.write("\n---\n\n")
-        return len(reports)
\ No newline at end of file
+        return count
\ No newline at end of file
@@ -1,11 +1,16 @@
 import logging
 import json
-import time
-from typing import List, Optional, Dict
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import closing
+from itertools import islice
+from typing import Iterator, List, Optional, Dict
 from ..providers.base import LLMProvider
 from ..providers.storage.base import StorageProvider
 from ..models.schemas import Lead, ScrapedPost
 from ..core.config import ConfigManager
+from ..core.matcher import fts_any_of, keyword_matcher
+
+LEAD_SYSTEM_PROMPT = "You are a lead generation specialist. Identify users who are actively looking for solutions."
 
 logger = logging.getLogger(__name__)
 
@@ -25,27 +30,123 @@ class LeadModule:
         self.llm = llm
         self.storage = storage
         self.config = ConfigManager()
-        self.llm_request_delay = float(self.config.get("llm_request_delay", 2))
+        self.llm_concurrency = max(1, int(self.config.get("llm_concurrency", 4)))
+        self.llm_batch_size = max(1, int(self.config.get("llm_batch_size", 1)))
 
     def scan_for_leads(self, post_limit: int = 100) -> List[Lead]:
         """Scan stored posts for high-intent leads."""
         if not self.storage:
             return []
 
-        posts = self.storage.get_posts(limit=post_limit)
-        leads = []
+        if hasattr(self.storage, "search_posts"):
+            # The newest posts with an intent keyword in their own text, straight
+            # from the index; the stored LLM analysis must not make a candidate
+            results = self.storage.search_posts(
+                fts_any_of(self.INTENT_KEYWORDS, columns=("title", "body")),
+                limit=post_limit,
+                order="recent",
+            )
+            candidates = [result["post"] for result in results]
+        else:
+            matcher = keyword_matcher({"intent": self.INTENT_KEYWORDS})
+            candidates = [
+                post
+                for post in self._recent_posts(post_limit)
+                if matcher.search(f"{post.title} {post.body or ''}")
+            ]
 
-        for post in posts:
-            content = f"{post.title} {post.body or ''}".lower()
-            if any(kw in content for kw in self.INTENT_KEYWORDS):
-                lead = self.extract_lead_intent(post)
-                if lead and lead.intent_score >= 0.6:
-                    leads.append(lead)
-                    # Note: We need a storage method for leads
-                    self._save_lead(lead)
+        leads = [
+            lead
+            for lead in self.extract_lead_intents(candidates)
+            if lead and lead.intent_score >= 0.6
+        ]
+        self._save_leads(leads)
+
+        return leads
+
+    def _recent_posts(self, limit: int) -> Iterator[ScrapedPost]:
+        """The newest ``limit`` stored posts, streamed where the storage supports it."""
+        if not hasattr(self.storage, "iter_posts"):
+            yield from self.storage.get_posts(limit=limit)
+            return
+        with closing(self.storage.iter_posts()) as posts:
+            yield from islice(posts, limit)
+
+    def extract_lead_intents(self, posts: List[ScrapedPost]) -> List[Optional[Lead]]:
+        """Score several posts with up to ``llm_concurrency`` LLM calls in flight.
+
+        With ``llm_batch_size`` > 1, posts are scored in batches through
+        ``complete_batch``. Results are returned in the same order as ``posts``.
+        """
+        size = self.llm_batch_size
+        chunks = [posts[i : i + size] for i in range(0, len(posts), size)]
+
+        if self.llm_concurrency <= 1 or len(chunks) <= 1:
+            results = [self.extract_lead_intent_batch(chunk) for chunk in chunks]
+        else:
+            with ThreadPoolExecutor(max_workers=self.llm_concurrency) as pool:
+                results = list(pool.map(self.extract_lead_intent_batch, chunks))
+
+        return [lead for chunk in results for lead in chunk]
+
+    def extract_lead_intent_batch(self, posts: List[ScrapedPost]) -> List[Optional[Lead]]:
+        """Score several posts in a single LLM request, falling back to per-post calls."""
+        if len(posts) <= 1:
+            return [self.extract_lead_intent(post) for post in posts]
+
+        instructions = """
+        Analyze each of the following posts for 'purchase intent' or 'problem-solving intent'.
+        The user is looking for a solution, recommendation, or alternative.
+
+        For every post, return:
+            "intent_score": float (0-1),
+            "content_snippet": "short summary of what they need",
+            "reasoning": "why this is a lead"
+        """
+        items = {
+            post.id: f"Post: {post.title}\nContent: {post.body or 'N/A'}"
+            for post in posts
+        }
+
+        try:
+            batch = self.llm.complete_batch(
+                items,
+                instructions,
+                system_prompt=LEAD_SYSTEM_PROMPT,
+                response_format={"type": "json_object"},
+            )
+            if not isinstance(batch, dict):
+                raise ValueError("complete_batch did not return a mapping")
+        except Exception as e:
+            logger.warning(
+                f"Batch lead scoring of {len(posts)} posts failed, falling back to per-post calls: {e}"
+            )
+            batch = {}
 
+        leads = []
+        for post in posts:
+            data = batch.get(post.id)
+            if isinstance(data, dict):
+                try:
+                    leads.append(self._build_lead(post, data))
+                    continue
+                except Exception as e:
+                    logger.warning(f"Invalid batch result for post {post.id}: {e}")
+            leads.append(self.extract_lead_intent(post))
         return leads
 
+    def _build_lead(self, post: ScrapedPost, data: Dict) -> Lead:
+        return Lead(
+            post_id=post.id,
+            author=data.get(
+                "author", post.author
+            ),  # Adjusted to use author from LLM if available, else post.author
+            content_snippet=data.get("content_snippet", post.title[:100]),
+            intent_score=data.get("intent_score", 0.0),
+            contact_url=post.url,
+            status="new",
+        )
+
     def extract_lead_intent(self, post: ScrapedPost) -> Optional[Lead]:
         """Use LLM to score intent and extract details."""
         prompt = f"""
@@ -64,33 +165,27 @@ class LeadModule:
         """
 
         try:
-            time.sleep(self.llm_request_delay)  # Added delay before LLM call
             response = self.llm.complete(
                 prompt=prompt,
-                system_prompt="You are a lead generation specialist. Identify users who are actively looking for solutions.",
+                system_prompt=LEAD_SYSTEM_PROMPT,
                 response_format={"type": "json_object"},
             )
             data = json.loads(response)
 
-            return Lead(
-                post_id=post.id,
-                author=data.get(
-                    "author", post.author
-                ),  # Adjusted to use author from LLM if available, else post.author
-                content_snippet=data.get("content_snippet", post.title[:100]),
-                intent_score=data.get("intent_score", 0.0),
-                contact_url=post.url,
-                status="new",
-            )
+            return self._build_lead(post, data)
         except Exception as e:
             logger.error(f"Error extracting lead from {post.id}: {e}")
             return None
 
-    def _save_lead(self, lead: Lead):
-        """Internal helper to save lead to SQLite."""
-        # This requires adding a save_lead method to the StorageProvider interface and SQLite implementation
-        if hasattr(self.storage, "save_lead"):
-            self.storage.save_lead(lead)
+    def _save_leads(self, leads: List[Lead]):
+        """Internal helper to save leads in one write."""
+        if not leads:
+            return
+        if hasattr(self.storage, "save_leads"):
+            self.storage.save_leads(leads)
+        elif hasattr(self.storage, "save_lead"):
+            for lead in leads:
+                self.storage.save_lead(lead)
 
     def verify_leads_multi_channel(self, limit: int = 10) -> int:
         """
@@ -100,26 +195,29 @@ class LeadModule:
         if not self.storage:
             return 0
 
-        leads = self.storage.get_leads(limit=limit)
-        new_leads = [l for l in leads if l.status == "new"]
-        verified_count = 0
+        verified = []
 
-        for lead in new_leads:
+        for lead in self._new_leads(limit):
             logger.info(f"Verifying lead: {lead.author} from {lead.source}")
             verified_profiles = self._research_social_profiles(lead.author, lead.source)
 
             if verified_profiles:
                 lead.verified_profiles.update(verified_profiles)
                 lead.status = "verified"
-                # Update in storage (Requires update_lead or re-save)
-                # For now, re-save if save_lead handles REPLACE or if we add update_lead
-                if hasattr(self.storage, "save_lead"):
-                    # Note: save_lead currently uses INSERT, not REPLACE in SQLiteProvider
-                    # We might need to update SQLiteProvider.save_lead
-                    self.storage.save_lead(lead)
-                verified_count += 1
-
-        return verified_count
+                verified.append(lead)
+
+        # Leads with an id are updated in place
+        self._save_leads(verified)
+        return len(verified)
+
+    def _new_leads(self, limit: int) -> List[Lead]:
+        """Up to ``limit`` leads still marked new, newest first."""
+        if not hasattr(self.storage, "iter_leads"):
+            leads = self.storage.get_leads(limit=limit)
+            return [l for l in leads if l.status == "new"]
+        # Streamed, so already-handled leads are skipped without loading them all
+        with closing(self.storage.iter_leads()) as leads:
+            return list(islice((l for l in leads if l.status == "new"), limit))
 
     def _research_social_profiles(self, username: str, platform: str) -> Dict[str, str]:
         """
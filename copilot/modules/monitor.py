@@ -6,6 +6,7 @@ from ..providers.base import ScraperProvider, LLMProvider
 from ..providers.storage.base import StorageProvider
 from ..models.schemas import ScrapedPost, PainScore, ValidationReport
 from ..core.config import ConfigManager
+from ..core.matcher import keyword_matcher
 import os
 
 if TYPE_CHECKING:
@@ -148,6 +149,7 @@ class MonitorModule:
         """
         count = 0
         deep_research_reports_generated = 0
+        matcher = keyword_matcher({"competitor": competitors})
 
         for sub in subreddits:
             try:
@@ -155,31 +157,35 @@ class MonitorModule:
                     source="reddit", target=sub, limit=50
                 )
                 for post in posts:
-                    content = f"{post.title} {post.body or ''}".lower()
-
-                    for comp in competitors:
-                        if comp.lower() in content:
+                    mentioned = []
+                    for match in matcher.finditer(f"{post.title} {post.body or ''}"):
+                        if match.keyword not in mentioned:
+                            mentioned.append(match.keyword)
+                    if not mentioned:
+                        continue
+
+                    # Analyze and save post/signal once, however many competitors it names
+                    pain_info = self.discovery.analyze_pain_intensity(post)
+                    if self.storage:
+                        self.storage.save_post(post)
+                        self.storage.save_signal(post.id, pain_info)
+
+                    for comp in mentioned:
+                        logger.info(
+                            f"Monitor found mention of competitor '{comp}' in r/{sub}: {post.title}"
+                        )
+                        count += 1
+
+                        # Trigger deep research cycle
+                        report = self._trigger_deep_research_cycle(
+                            post.id, comp, post, pain_info
+                        )
+                        if report and self.storage:
+                            self.storage.save_report(report)
+                            deep_research_reports_generated += 1
                             logger.info(
-                                f"Monitor found mention of competitor '{comp}' in r/{sub}: {post.title}"
-                            )
-
-                            # Analyze and save post/signal first
-                            pain_info = self.discovery.analyze_pain_intensity(post)
-                            if self.storage:
-                                self.storage.save_post(post)
-                                self.storage.save_signal(post.id, pain_info)
-                            count += 1
-
-                            # Trigger deep research cycle
-                            report = self._trigger_deep_research_cycle(
-                                post.id, comp, post, pain_info
+                                f"Generated deep research report for '{comp}' related to post {post.id}"
                             )
-                            if report and self.storage:
-                                self.storage.save_report(report)
-                                deep_research_reports_generated += 1
-                                logger.info(
-                                    f"Generated deep research report for '{comp}' related to post {post.id}"
-                                )
 
             except Exception as e:
                 logger.error(f"Error monitoring r/{sub}: {e}")
@@ -206,15 +206,16 @@ Return ONLY valid JSON. Do not include any other text, markdown, or explanations
             limit: Number of profiles to generate
         """
         profiles = []
+        if not self.storage:
+            logger.warning(
+                "Storage not available to fetch post details for persona generation."
+            )
+            return profiles
 
-        for score in scored_posts[:limit]:
-            if not self.storage:
-                logger.warning(
-                    "Storage not available to fetch post details for persona generation."
-                )
-                continue
-
-            post = self.storage.get_post_by_id(score.post_id)
+        top = scored_posts[:limit]
+        posts = self.storage.get_posts_by_ids([score.post_id for score in top])
+        for score in top:
+            post = posts.get(score.post_id)
             if not post:
                 continue
 
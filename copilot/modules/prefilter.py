@@ -0,0 +1,160 @@
+import math
+import re
+import logging
+from typing import Dict, List, Optional, Tuple
+from ..models.schemas import ScrapedPost, PrefilterReport
+from ..providers.storage.base import StorageProvider
+from .scoring import calculate_engagement_norm, calculate_market_signal
+
+logger = logging.getLogger(__name__)
+
+# Word prefixes, so "frustrat" matches frustrated/frustrating/frustration
+PAIN_LEXICON = [
+    "frustrat",
+    "annoy",
+    "hate",
+    "struggl",
+    "pain",
+    "problem",
+    "issue",
+    "broken",
+    "waste",
+    "tedious",
+    "manual",
+    "nightmare",
+    "can't",
+    "cannot",
+    "doesn't work",
+    "impossible",
+    "stuck",
+    "expensive",
+    "overpriced",
+    "slow",
+    "bug",
+    "workaround",
+    "sick of",
+    "tired of",
+    "fed up",
+    "desperate",
+    "urgent",
+    "disappoint",
+    "terrible",
+    "worst",
+]
+
+LEXICAL_WEIGHTS = {
+    "pain": 0.4,
+    "intent": 0.3,
+    "engagement": 0.2,
+    "question": 0.1,
+}
+
+_PAIN_PATTERN = re.compile(
+    r"\b(?:" + "|".join(re.escape(term) for term in PAIN_LEXICON) + ")",
+    re.IGNORECASE,
+)
+
+
+def lexical_score(post: ScrapedPost) -> float:
+    """Cheap 0-1 estimate of how likely a post is to describe a pain point.
+
+    Combines pain/frustration lexicon hits, SaaS intent keywords, normalized
+    engagement and whether the post asks a question. Low star ratings on
+    review sites count as pain.
+    """
+    content = f"{post.title} {post.body or ''}"
+
+    pain = min(1.0, len(_PAIN_PATTERN.findall(content)) * 0.25)
+    star_rating = post.metadata.get("star_rating")
+    if isinstance(star_rating, (int, float)):
+        pain = max(pain, (5 - star_rating) / 4.0)
+
+    features = {
+        "pain": pain,
+        "intent": calculate_market_signal(post),
+        "engagement": min(1.0, calculate_engagement_norm(post)),
+        "question": 1.0 if "?" in content else 0.0,
+    }
+    return sum(features[name] * weight for name, weight in LEXICAL_WEIGHTS.items())
+
+
+class LexicalPrefilter:
+    """First tier of the discovery cascade, in front of the LLM.
+
+    Posts whose ``lexical_score`` falls below their source's threshold are
+    dropped without an LLM call. Sources without a calibrated threshold pass
+    everything, so the filter is a no-op until ``calibrate`` has run.
+    """
+
+    def __init__(self, thresholds: Optional[Dict[str, float]] = None):
+        self.thresholds: Dict[str, float] = dict(thresholds or {})
+
+    def passes(self, post: ScrapedPost) -> bool:
+        threshold = self.thresholds.get(post.source, 0.0)
+        return threshold <= 0.0 or lexical_score(post) >= threshold
+
+    def calibrate(
+        self,
+        labelled: List[Tuple[ScrapedPost, bool]],
+        target_recall: float = 0.95,
+        min_positives: int = 10,
+    ) -> Dict[str, float]:
+        """Pick, per source, the highest threshold that keeps ``target_recall``.
+
+        ``labelled`` pairs each post with whether the LLM judged it a real
+        pain point. Sources with fewer than ``min_positives`` positives keep
+        a threshold of 0 (pass everything).
+        """
+        positives_by_source: Dict[str, List[float]] = {}
+        for post, is_pain in labelled:
+            scores = positives_by_source.setdefault(post.source, [])
+            if is_pain:
+                scores.append(lexical_score(post))
+
+        thresholds = {}
+        for source, scores in positives_by_source.items():
+            if len(scores) < min_positives:
+                thresholds[source] = 0.0
+                continue
+            scores.sort()
+            # Dropping the k lowest-scoring positives keeps recall >= target
+            k = int(math.floor(len(scores) * (1.0 - target_recall) + 1e-9))
+            thresholds[source] = round(scores[min(k, len(scores) - 1)], 4)
+
+        self.thresholds.update(thresholds)
+        return thresholds
+
+    def evaluate(self, labelled: List[Tuple[ScrapedPost, bool]]) -> List[PrefilterReport]:
+        """Estimate LLM calls saved and recall lost on a labelled sample, per source."""
+        reports: Dict[str, PrefilterReport] = {}
+        for post, is_pain in labelled:
+            report = reports.get(post.source)
+            if report is None:
+                report = PrefilterReport(
+                    source=post.source, threshold=self.thresholds.get(post.source, 0.0)
+                )
+                reports[post.source] = report
+
+            passed = self.passes(post)
+            report.sample_size += 1
+            report.positives += int(is_pain)
+            report.skipped += int(not passed)
+            report.missed_positives += int(is_pain and not passed)
+
+        return sorted(reports.values(), key=lambda r: r.source)
+
+
+def labelled_sample_from_storage(
+    storage: StorageProvider, limit: int = 1000, pain_threshold: float = 0.5
+) -> List[Tuple[ScrapedPost, bool]]:
+    """Label stored posts with the LLM's own verdict (signal score >= ``pain_threshold``).
+
+    Posts whose analysis failed have no verdict and are left out.
+    """
+    posts = storage.get_posts(limit=limit)
+    signals = storage.get_signals([post.id for post in posts])
+    return [
+        (post, signals[post.id].score >= pain_threshold)
+        for post in posts
+        if post.id in signals and not signals[post.id].failed
+    ]
@@ -1,10 +1,22 @@
+import json
 import math
 import logging
+import os
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from datetime import datetime, timezone, timedelta
-from typing import Dict, List, Set, Optional
+from itertools import islice
+from typing import Callable, Dict, Iterable, Iterator, List, Set, Optional, Tuple
 from ..models.schemas import ScrapedPost, PainScore, OpportunityScore
 from ..providers.storage.base import StorageProvider
 from ..core.config import SAAS_INTENT_KEYWORDS
+from ..core.text import content_terms, rank_terms
+from ..core.matcher import keyword_matcher
+
+try:
+    import numpy as np
+except ImportError:  # Batch scoring falls back to the per-post loop
+    np = None
 
 logger = logging.getLogger(__name__)
 
@@ -18,6 +30,48 @@ WEIGHTS = {
     "market_signal": 0.10,
 }
 
+# Named alternatives to WEIGHTS for re-ranking stored scores. Dimensions a
+# profile leaves out get no weight.
+WEIGHT_PROFILES = {
+    "default": WEIGHTS,
+    "pain": {
+        "pain_intensity": 0.40,
+        "engagement_norm": 0.05,
+        "validation_evidence": 0.15,
+        "sentiment_intensity": 0.25,
+        "recency": 0.05,
+        "trend_momentum": 0.05,
+        "market_signal": 0.05,
+    },
+    "traction": {
+        "pain_intensity": 0.15,
+        "engagement_norm": 0.35,
+        "validation_evidence": 0.25,
+        "sentiment_intensity": 0.05,
+        "recency": 0.05,
+        "trend_momentum": 0.05,
+        "market_signal": 0.10,
+    },
+    "trending": {
+        "pain_intensity": 0.15,
+        "engagement_norm": 0.10,
+        "validation_evidence": 0.10,
+        "sentiment_intensity": 0.05,
+        "recency": 0.20,
+        "trend_momentum": 0.35,
+        "market_signal": 0.05,
+    },
+    "buyer": {
+        "pain_intensity": 0.20,
+        "engagement_norm": 0.05,
+        "validation_evidence": 0.20,
+        "sentiment_intensity": 0.05,
+        "recency": 0.05,
+        "trend_momentum": 0.05,
+        "market_signal": 0.40,
+    },
+}
+
 ENGAGEMENT_NORMALIZERS = {
     "reddit": {
         "upvote_cap": 200,
@@ -56,6 +110,42 @@ SENTIMENT_SCORES = {
 }
 
 
+def resolve_weights(
+    spec: str,
+    profiles: Optional[Dict[str, Dict[str, float]]] = None,
+    allow_files: bool = True,
+) -> Dict[str, float]:
+    """Weights from a profile name, a JSON file path or an inline JSON object.
+
+    Names are looked up in ``profiles`` (e.g. the ``weight_profiles`` config
+    key) before WEIGHT_PROFILES. Dimensions left out get a weight of 0. Pass
+    ``allow_files=False`` when ``spec`` comes from an untrusted caller, so it
+    can never read a local file.
+    """
+    spec = spec.strip()
+    named = {**WEIGHT_PROFILES, **(profiles or {})}
+    if spec in named:
+        raw = named[spec]
+    elif spec.startswith("{"):
+        raw = json.loads(spec)
+    elif allow_files and os.path.isfile(spec):
+        with open(spec, "r") as f:
+            raw = json.load(f)
+    else:
+        accepted = "a JSON object or a JSON file" if allow_files else "or a JSON object"
+        raise ValueError(
+            f"Unknown weight profile '{spec}'. "
+            f"Use one of {', '.join(sorted(named))}, {accepted}."
+        )
+
+    if not isinstance(raw, dict):
+        raise ValueError("A weight profile must be a JSON object")
+    unknown = set(raw) - set(WEIGHTS)
+    if unknown:
+        raise ValueError(f"Unknown scoring dimensions: {', '.join(sorted(unknown))}")
+    return {name: float(raw.get(name, 0.0)) for name in WEIGHTS}
+
+
 def calculate_engagement_norm(post: ScrapedPost) -> float:
     """Normalize engagement to 0-1 regardless of source."""
     norms = ENGAGEMENT_NORMALIZERS.get(post.source, ENGAGEMENT_NORMALIZERS["reddit"])
@@ -96,170 +186,72 @@ def calculate_recency_score(post: ScrapedPost) -> float:
     return 0.0
 
 
-def extract_key_terms(post: ScrapedPost) -> List[str]:
-    """Extract key terms from post title and body using simple frequency analysis."""
-    content = f"{post.title} {post.body or ''}".lower()
-
-    stop_words = {
-        "the",
-        "a",
-        "an",
-        "is",
-        "are",
-        "was",
-        "were",
-        "be",
-        "been",
-        "being",
-        "have",
-        "has",
-        "had",
-        "do",
-        "does",
-        "did",
-        "will",
-        "would",
-        "could",
-        "should",
-        "may",
-        "might",
-        "must",
-        "shall",
-        "can",
-        "need",
-        "dare",
-        "i",
-        "you",
-        "he",
-        "she",
-        "it",
-        "we",
-        "they",
-        "me",
-        "him",
-        "her",
-        "us",
-        "them",
-        "my",
-        "your",
-        "his",
-        "its",
-        "our",
-        "their",
-        "this",
-        "that",
-        "these",
-        "those",
-        "am",
-        "and",
-        "or",
-        "but",
-        "if",
-        "because",
-        "as",
-        "until",
-        "while",
-        "of",
-        "at",
-        "by",
-        "for",
-        "with",
-        "about",
-        "against",
-        "between",
-        "into",
-        "through",
-        "during",
-        "before",
-        "after",
-        "above",
-        "below",
-        "to",
-        "from",
-        "up",
-        "down",
-        "in",
-        "out",
-        "on",
-        "off",
-        "over",
-        "under",
-        "again",
-        "further",
-        "then",
-        "once",
-        "here",
-        "there",
-        "when",
-        "where",
-        "why",
-        "how",
-        "all",
-        "any",
-        "both",
-        "each",
-        "few",
-        "more",
-        "most",
-        "other",
-        "some",
-        "such",
-        "no",
-        "nor",
-        "not",
-        "only",
-        "own",
-        "same",
-        "so",
-        "than",
-        "too",
-        "very",
-        "just",
-        "also",
-        "now",
-        "what",
-        "which",
-        "who",
-        "whom",
-        "like",
-        "get",
-        "got",
-        "getting",
-        "go",
-        "goes",
-        "going",
-        "want",
-        "wants",
-        "make",
-        "makes",
-        "use",
-        "uses",
-        "using",
-        "see",
-        "seen",
-        "saw",
-        "think",
-        "thinks",
-        "thinking",
-    }
+def extract_key_terms(
+    post: ScrapedPost,
+    document_frequencies: Optional[Tuple[Dict[str, int], int]] = None,
+) -> List[str]:
+    """Extract the 5 key terms of a post's title and body.
+
+    With ``document_frequencies`` (``({term: df}, total_documents)``) terms are
+    ranked by TF-IDF, so words common across the corpus give way to
+    distinctive ones; otherwise by raw frequency.
+    """
+    words = content_terms(f"{post.title} {post.body or ''}")
+    if document_frequencies is not None:
+        return rank_terms(words, *document_frequencies)
+
+    return [word for word, _ in Counter(words).most_common(5)]
 
-    words = []
-    for word in content.split():
-        cleaned = "".join(c for c in word if c.isalnum())
-        if len(cleaned) >= 3 and cleaned not in stop_words:
-            words.append(cleaned)
 
-    from collections import Counter
+def _document_frequencies(
+    storage: StorageProvider, posts: List[ScrapedPost]
+) -> Optional[Tuple[Dict[str, int], int]]:
+    """Stored document frequencies for the terms of ``posts``, if the storage keeps them."""
+    if not hasattr(storage, "get_document_frequencies"):
+        return None
+    terms = {t for post in posts for t in content_terms(f"{post.title} {post.body or ''}")}
+    return storage.get_document_frequencies(sorted(terms))
 
-    word_freq = Counter(words)
 
-    return [word for word, _ in word_freq.most_common(5)]
+def _scan_trend_counts(
+    post: ScrapedPost,
+    key_terms: List[str],
+    storage: StorageProvider,
+    recent_cutoff: datetime,
+    older_cutoff_start: datetime,
+    older_cutoff_end: datetime,
+) -> tuple[int, int]:
+    """Fallback for storages without a term index: scan the newest 1000 posts."""
+    recent_count = 0
+    older_count = 0
+
+    for p in storage.get_posts(limit=1000, source=post.source):
+        if p.id == post.id:
+            continue
+
+        content = f"{p.title} {p.body or ''}".lower()
+        if any(term.lower() in content for term in key_terms):
+            if p.created_at >= recent_cutoff:
+                recent_count += 1
+            elif older_cutoff_start <= p.created_at < older_cutoff_end:
+                older_count += 1
+    return recent_count, older_count
+
+
+def _momentum_from_counts(recent_count: int, older_count: int) -> float:
+    if older_count == 0:
+        if recent_count == 0:
+            return 0.5
+        return 0.5  # New topic with some data, moderate momentum
+
+    ratio = recent_count / older_count
+    return 1.0 / (1.0 + math.exp(-2 * (ratio - 1.0)))
 
 
 def calculate_trend_momentum(post: ScrapedPost, storage: StorageProvider) -> float:
     """Calculate trend momentum: are similar pain topics increasing over time?"""
     try:
-        key_terms = extract_key_terms(post)
+        key_terms = extract_key_terms(post, _document_frequencies(storage, [post]))
         if not key_terms:
             return 0.5
 
@@ -268,28 +260,24 @@ def calculate_trend_momentum(post: ScrapedPost, storage: StorageProvider) -> flo
         older_cutoff_start = now - timedelta(days=60)
         older_cutoff_end = now - timedelta(days=30)
 
-        recent_posts = storage.get_posts(limit=1000, source=post.source)
-        recent_count = 0
-        older_count = 0
-
-        for p in recent_posts:
-            if p.id == post.id:
-                continue
-
-            content = f"{p.title} {p.body or ''}".lower()
-            if any(term.lower() in content for term in key_terms):
-                if p.created_at >= recent_cutoff:
-                    recent_count += 1
-                elif older_cutoff_start <= p.created_at < older_cutoff_end:
-                    older_count += 1
-
-        if older_count == 0:
-            if recent_count == 0:
-                return 0.5
-            return 0.5  # New topic with some data, moderate momentum
+        if hasattr(storage, "sum_term_counts"):
+            # Daily term-count rollups over the whole corpus
+            recent_count = storage.sum_term_counts(
+                key_terms, since=recent_cutoff, source=post.source, exclude_post_id=post.id
+            )
+            older_count = storage.sum_term_counts(
+                key_terms,
+                since=older_cutoff_start,
+                until=older_cutoff_end,
+                source=post.source,
+                exclude_post_id=post.id,
+            )
+        else:
+            recent_count, older_count = _scan_trend_counts(
+                post, key_terms, storage, recent_cutoff, older_cutoff_start, older_cutoff_end
+            )
 
-        ratio = recent_count / older_count
-        return 1.0 / (1.0 + math.exp(-2 * (ratio - 1.0)))
+        return _momentum_from_counts(recent_count, older_count)
     except Exception as e:
         logger.error(f"Error calculating trend momentum for post {post.id}: {e}")
         return 0.5
@@ -297,11 +285,13 @@ def calculate_trend_momentum(post: ScrapedPost, storage: StorageProvider) -> flo
 
 def calculate_market_signal(post: ScrapedPost) -> float:
     """Calculate market signal score based on SaaS intent keywords."""
-    content = f"{post.title} {post.body or ''}".lower()
+    found = keyword_matcher(SAAS_INTENT_KEYWORDS).matched_keywords(
+        f"{post.title} {post.body or ''}"
+    )
     score = 0.0
 
-    for level, keywords in SAAS_INTENT_KEYWORDS.items():
-        matches = sum(1 for kw in keywords if kw.lower() in content)
+    for level in SAAS_INTENT_KEYWORDS:
+        matches = len(found.get(level, ()))
         if level == "high":
             score += matches * 0.3
         elif level == "medium":
@@ -315,26 +305,30 @@ def calculate_market_signal(post: ScrapedPost) -> float:
 def calculate_cross_source_bonus(post: ScrapedPost, storage: StorageProvider) -> float:
     """Bonus for pain topics confirmed across multiple platforms."""
     try:
-        key_terms = extract_key_terms(post)
+        key_terms = extract_key_terms(post, _document_frequencies(storage, [post]))
         if not key_terms:
             return 0.0
 
         now = datetime.now(timezone.utc)
         cutoff = now - timedelta(days=90)
 
-        all_posts = storage.get_posts(limit=1000)
-        sources_with_matches: Set[str] = set()
-
-        for p in all_posts:
-            if p.created_at < cutoff:
-                continue
+        if hasattr(storage, "get_sources_with_terms"):
+            sources_with_matches: Set[str] = storage.get_sources_with_terms(
+                key_terms, since=cutoff, exclude_source=post.source
+            )
+        else:
+            # Fallback for storages without a term index: scan the newest 1000 posts
+            sources_with_matches = set()
+            for p in storage.get_posts(limit=1000):
+                if p.created_at < cutoff:
+                    continue
 
-            if p.source == post.source:
-                continue
+                if p.source == post.source:
+                    continue
 
-            content = f"{p.title} {p.body or ''}".lower()
-            if any(term.lower() in content for term in key_terms):
-                sources_with_matches.add(p.source)
+                content = f"{p.title} {p.body or ''}".lower()
+                if any(term.lower() in content for term in key_terms):
+                    sources_with_matches.add(p.source)
 
         additional_sources = len(sources_with_matches)
         return additional_sources * 0.05
@@ -403,6 +397,265 @@ def compute_opportunity_score(
     )
 
 
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+_MICROSECOND = timedelta(microseconds=1)
+_MICROSECONDS_PER_DAY = 86_400_000_000
+_DIMENSIONS = list(WEIGHTS)
+
+
+def _epoch_microseconds(dt: datetime) -> int:
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return (dt - _EPOCH) // _MICROSECOND
+
+
+def _engagement_norms(sources, upvotes, comments, star_ratings):
+    """Vectorized ``calculate_engagement_norm``; unknown sources use reddit's norms."""
+    result = np.empty(len(sources))
+    fallback = np.ones(len(sources), dtype=bool)
+    for source, norms in ENGAGEMENT_NORMALIZERS.items():
+        if source == "reddit":
+            continue  # Applied below, together with unknown sources
+        mask = sources == source
+        fallback &= ~mask
+        result[mask] = _masked_engagement(norms, mask, upvotes, comments, star_ratings)
+
+    result[fallback] = _masked_engagement(
+        ENGAGEMENT_NORMALIZERS["reddit"], fallback, upvotes, comments, star_ratings
+    )
+    return result
+
+
+def _masked_engagement(norms, mask, upvotes, comments, star_ratings):
+    upvote_score = (
+        np.minimum(1.0, upvotes[mask] / norms["upvote_cap"]) * norms["upvote_weight"]
+    )
+    comment_score = (
+        np.minimum(1.0, comments[mask] / max(1, norms["comment_cap"]))
+        * norms["comment_weight"]
+    )
+    score = upvote_score + comment_score
+
+    star_weight = norms.get("star_rating_weight", 0.0)
+    if star_weight > 0:
+        ratings = star_ratings[mask]
+        rated = ~np.isnan(ratings)
+        star_pain = np.maximum(0.0, (5 - ratings[rated]) / 4.0)
+        score[rated] = score[rated] + (star_pain * star_weight)
+    return score
+
+
+def _recency_scores(created_us, now: datetime):
+    """Vectorized ``calculate_recency_score`` over epoch-microsecond timestamps."""
+    days = (_epoch_microseconds(now) - created_us) // _MICROSECONDS_PER_DAY
+    return np.select(
+        [days < 1, days < 7, days < 30, days < 90], [1.0, 0.8, 0.5, 0.2], default=0.0
+    )
+
+
+def _batch_term_dimensions(
+    posts: List[ScrapedPost], storage: StorageProvider, now: datetime
+) -> Tuple[List[float], List[float]]:
+    """Trend momentum and cross-source bonus for a batch, from one rollup read.
+
+    Same counts as ``calculate_trend_momentum`` / ``calculate_cross_source_bonus``,
+    including subtracting each post's own mentions, but summed in memory.
+    """
+    recent_day = (now - timedelta(days=30)).date()
+    older_day = (now - timedelta(days=60)).date()
+    cross_cutoff = now - timedelta(days=90)
+
+    frequencies = _document_frequencies(storage, posts)
+    key_terms = [tuple(extract_key_terms(post, frequencies)) for post in posts]
+    all_terms = sorted({term for terms in key_terms for term in terms})
+
+    recent_sums: Dict[tuple, int] = {}
+    older_sums: Dict[tuple, int] = {}
+    term_sources: Dict[str, Set[str]] = {}
+    for term, source, day, count in storage.get_term_daily_counts(
+        all_terms, since=cross_cutoff
+    ):
+        term_sources.setdefault(term, set()).add(source)
+        if day >= recent_day:
+            recent_sums[(term, source)] = recent_sums.get((term, source), 0) + count
+        elif day >= older_day:
+            older_sums[(term, source)] = older_sums.get((term, source), 0) + count
+    own_terms = storage.get_post_terms([post.id for post in posts])
+
+    momentum, cross = [], []
+    for post, terms in zip(posts, key_terms):
+        if not terms:
+            momentum.append(0.5)
+            cross.append(0.0)
+            continue
+
+        recent_count = sum(recent_sums.get((t, post.source), 0) for t in terms)
+        older_count = sum(older_sums.get((t, post.source), 0) for t in terms)
+        for term, source, day in own_terms.get(post.id, ()):
+            if term in terms and source == post.source:
+                if day >= recent_day:
+                    recent_count -= 1
+                elif day >= older_day:
+                    older_count -= 1
+        momentum.append(_momentum_from_counts(recent_count, older_count))
+
+        sources = set().union(*(term_sources.get(t, set()) for t in terms))
+        sources.discard(post.source)
+        cross.append(len(sources) * 0.05)
+    return momentum, cross
+
+
+def compute_opportunity_scores(
+    posts_with_pain: List[Tuple[ScrapedPost, PainScore]],
+    storage: StorageProvider,
+    weights: Optional[Dict[str, float]] = None,
+) -> List[OpportunityScore]:
+    """Batch ``compute_opportunity_score``: same scores, column-wise with NumPy.
+
+    Engagement, recency and the weighted sum are computed over arrays of the
+    whole batch; trend momentum and cross-source bonus come from a single
+    read of the daily term rollups. Falls back to the per-post loop when NumPy is not installed.
+    Posts that fail to score are logged and skipped.
+    """
+    if weights is None:
+        weights = WEIGHTS.copy()
+
+    if np is None:
+        scores = []
+        for post, pain in posts_with_pain:
+            try:
+                scores.append(compute_opportunity_score(post, pain, storage, weights))
+            except Exception as e:
+                logger.error(f"Error computing score for post {post.id}: {e}")
+        return scores
+
+    rows = []
+    for post, pain in posts_with_pain:
+        try:
+            star_rating = post.metadata.get("star_rating")
+            rows.append(
+                (
+                    post,
+                    pain.score,
+                    post.upvotes,
+                    post.comments_count,
+                    float("nan") if star_rating is None else star_rating,
+                    _epoch_microseconds(post.created_at),
+                    pain.validation_score,
+                    pain.sentiment_intensity,
+                    calculate_market_signal(post),
+                )
+            )
+        except Exception as e:
+            logger.error(f"Error computing score for post {post.id}: {e}")
+
+    if not rows:
+        return []
+
+    posts = [row[0] for row in rows]
+    (
+        pain_col,
+        upvotes,
+        comments,
+        star_ratings,
+        created_us,
+        validation,
+        sentiment,
+        market,
+    ) = zip(*(row[1:] for row in rows))
+
+    now = datetime.now(timezone.utc)
+    if hasattr(storage, "get_term_daily_counts"):
+        trend, cross = _batch_term_dimensions(posts, storage, now)
+    else:
+        trend = [calculate_trend_momentum(post, storage) for post in posts]
+        cross = [calculate_cross_source_bonus(post, storage) for post in posts]
+    d1 = np.array(pain_col, dtype=float)
+    d2 = _engagement_norms(
+        np.array([p.source for p in posts], dtype=object),
+        np.array(upvotes, dtype=float),
+        np.array(comments, dtype=float),
+        np.array(star_ratings, dtype=float),
+    )
+    d3 = np.array(validation, dtype=float)
+    d4 = np.array(sentiment, dtype=float)
+    d5 = _recency_scores(np.array(created_us, dtype=np.int64), now)
+    d6 = np.array(trend, dtype=float)
+    d7 = np.array(market, dtype=float)
+    cross_bonus = np.array(cross, dtype=float)
+
+    # Same summation order as compute_opportunity_score so floats match exactly
+    base_score = (
+        weights["pain_intensity"] * d1
+        + weights["engagement_norm"] * d2
+        + weights["validation_evidence"] * d3
+        + weights["sentiment_intensity"] * d4
+        + weights["recency"] * d5
+        + weights["trend_momentum"] * d6
+        + weights["market_signal"] * d7
+    )
+    final_scores = np.minimum(1.0, base_score + cross_bonus)
+
+    dimension_columns = [
+        column.tolist() for column in (d1, d2, d3, d4, d5, d6, d7)
+    ]
+    scores = []
+    for i, (post, final_score) in enumerate(zip(posts, final_scores.tolist())):
+        dimensions = {
+            name: column[i] for name, column in zip(_DIMENSIONS, dimension_columns)
+        }
+        scores.append(
+            OpportunityScore(
+                post_id=post.id,
+                source=post.source,
+                final_score=final_score,
+                **dimensions,
+                cross_source_bonus=cross[i],
+                dimensions=dimensions,
+                weights=weights,
+                computed_at=now,
+            )
+        )
+    return scores
+
+
+def _batches(items: Iterable, size: int) -> Iterator[list]:
+    iterator = iter(items)
+    while batch := list(islice(iterator, size)):
+        yield batch
+
+
+def _shard_bounds(
+    post_ids: List[str], chunk_size: int
+) -> List[Tuple[Optional[str], int]]:
+    """(after_id, limit) pages that together cover ``post_ids`` in order."""
+    return [
+        (post_ids[start - 1] if start else None, min(chunk_size, len(post_ids) - start))
+        for start in range(0, len(post_ids), chunk_size)
+    ]
+
+
+# Per-process storage for rescoring workers, opened once by the pool initializer
+_worker_storage: Optional[StorageProvider] = None
+
+
+def _init_rescore_worker(storage_class: type, db_path: str) -> None:
+    global _worker_storage
+    _worker_storage = storage_class(db_path, read_only=True)
+
+
+def _rescore_shard(
+    after_id: Optional[str],
+    limit: int,
+    source: Optional[str],
+    weights: Optional[Dict[str, float]],
+) -> List[OpportunityScore]:
+    chunk = _worker_storage.get_posts_with_signals(
+        limit=limit, after_id=after_id, source=source
+    )
+    return compute_opportunity_scores(chunk, _worker_storage, weights)
+
+
 class ScoringModule:
     """Module for computing opportunity scores on posts."""
 
@@ -423,22 +676,106 @@ class ScoringModule:
         self,
         posts_with_pain: List[tuple[ScrapedPost, PainScore]],
         weights: Optional[Dict[str, float]] = None,
+        persist: bool = True,
     ) -> List[OpportunityScore]:
-        """Compute opportunity scores for multiple posts."""
-        scores = []
-        for post, pain in posts_with_pain:
-            try:
-                score = self.compute_score(post, pain, weights)
-                scores.append(score)
-            except Exception as e:
-                logger.error(f"Error computing score for post {post.id}: {e}")
+        """Compute opportunity scores for multiple posts, best first.
 
+        The scores are saved with one bulk upsert unless ``persist`` is False.
+        """
+        scores = compute_opportunity_scores(posts_with_pain, self.storage, weights)
+        if persist:
+            self.save_scores(scores)
         return sorted(scores, key=lambda s: s.final_score, reverse=True)
 
+    def save_scores(self, scores: List[OpportunityScore]) -> None:
+        """Upsert scores into storage in one transaction."""
+        if not scores:
+            return
+        with self.storage.transaction():
+            self.storage.save_opportunity_scores(scores)
+
+    def rescore_all(
+        self,
+        chunk_size: int = 500,
+        source: Optional[str] = None,
+        weights: Optional[Dict[str, float]] = None,
+        progress: Optional[Callable[[int, int], None]] = None,
+        workers: int = 1,
+    ) -> int:
+        """Rescore every analyzed post in storage, one chunk at a time.
+
+        Posts are streamed from storage and each chunk is scored in a batch
+        and saved as soon as it is done, so memory stays flat however large
+        the database is. With ``workers`` > 1, chunks are scored in a process
+        pool, each worker reading through its own read-only connection; the
+        results are still written by this process only. ``progress`` is
+        called with (posts scored, total) after each chunk. Returns the
+        number of scores written.
+        """
+        db_path = getattr(self.storage, "db_path", None)
+        if workers > 1 and db_path is None:
+            logger.warning("Parallel rescoring needs a file-backed storage; using one process")
+            workers = 1
+
+        shards = []
+        if workers > 1:
+            # Workers page by id range, so the pool needs the ids up front
+            post_ids = self.storage.get_scored_post_ids(source=source)
+            shards = _shard_bounds(post_ids, chunk_size)
+            expected = len(post_ids)
+        else:
+            expected = self.storage.count_posts(source=source, analyzed_only=True)
+
+        total = 0
+
+        def merge(scores: List[OpportunityScore]) -> None:
+            nonlocal total
+            self.save_scores(scores)
+            total += len(scores)
+            if progress:
+                progress(total, expected)
+
+        if len(shards) <= 1:
+            posts = self.storage.iter_posts(
+                source=source, analyzed_only=True, chunk_size=chunk_size
+            )
+            for chunk in _batches(posts, chunk_size):
+                signals = self.storage.get_signals([post.id for post in chunk])
+                pairs = [(post, signals[post.id]) for post in chunk if post.id in signals]
+                merge(compute_opportunity_scores(pairs, self.storage, weights))
+            return total
+
+        with ProcessPoolExecutor(
+            max_workers=min(workers, len(shards)),
+            initializer=_init_rescore_worker,
+            initargs=(type(self.storage), db_path),
+        ) as pool:
+            futures = [
+                pool.submit(_rescore_shard, after_id, limit, source, weights)
+                for after_id, limit in shards
+            ]
+            for future in as_completed(futures):
+                merge(future.result())
+        return total
+
     def get_top_opportunities(
         self,
         limit: int = 20,
         min_score: float = 0.0,
+        weights: Optional[Dict[str, float]] = None,
+        source: Optional[str] = None,
     ) -> List[OpportunityScore]:
-        """Get top opportunity scores from storage."""
+        """Get top opportunity scores from storage.
+
+        With ``weights``, stored scores are re-ranked from their saved
+        dimensions instead of being recomputed.
+        """
+        if weights is not None:
+            return self.storage.get_reweighted_scores(
+                weights, limit=limit, min_score=min_score, source=source
+            )
+        if source is not None:
+            return self.storage.get_opportunity_scores(
+                limit=limit, min_score=min_score, source=source
+            )
         return self.storage.get_opportunity_scores(limit=limit, min_score=min_score)
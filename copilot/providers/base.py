@@ -1,3 +1,4 @@
+import json
 from abc import ABC, abstractmethod
 from typing import List, Dict, Any, Optional, Set
 from enum import Enum
@@ -79,6 +80,58 @@ class LLMProvider(ABC):
     def complete(self, prompt: str, **kwargs) -> str:
         pass
 
+    def complete_batch(
+        self, items: Dict[str, str], instructions: str, **kwargs
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Run the same instructions over several items in a single request.
+
+        The instructions are sent once, followed by every item tagged with its
+        id, and the model is asked for ``{"results": [{"id": ..., ...}]}``.
+        Providers with a native batch endpoint may override this.
+
+        Args:
+            items: Mapping of item id -> item text
+            instructions: Task description shared by all items
+            **kwargs: Passed through to ``complete`` (system_prompt, etc.)
+
+        Returns:
+            Mapping of item id -> parsed result object. Items the model
+            skipped are absent from the mapping.
+
+        Raises:
+            ValueError: If the response is not a parseable batch result.
+        """
+        sections = "\n\n".join(
+            f"### Item id: {item_id}\n{text}" for item_id, text in items.items()
+        )
+        prompt = (
+            f"{instructions}\n\n"
+            f"Apply the instructions above to each of the following {len(items)} items independently. "
+            'Return a JSON object of the form {"results": [{"id": "<item id>", ...}]} '
+            "with exactly one entry per item, keeping the fields described above.\n\n"
+            f"{sections}"
+        )
+        kwargs.setdefault("max_tokens", 512 * len(items))
+
+        try:
+            data = json.loads(self.complete(prompt=prompt, **kwargs))
+        except (TypeError, json.JSONDecodeError) as e:
+            raise ValueError(f"Batch response is not valid JSON: {e}") from e
+
+        entries = data.get("results") if isinstance(data, dict) else data
+        if not isinstance(entries, list):
+            raise ValueError("Batch response has no 'results' array.")
+
+        results: Dict[str, Dict[str, Any]] = {}
+        for entry in entries:
+            if not isinstance(entry, dict) or "id" not in entry:
+                continue
+            item_id = str(entry.pop("id"))
+            if item_id in items:
+                results[item_id] = entry
+        return results
+
 
 class CRMProvider(ABC):
     """Abstract base class for all CRM implementations."""
@@ -1,5 +1,15 @@
 from ..base import LLMProvider
 from .groq import GroqProvider
 from .ollama import OllamaProvider
+from .rate_limit import AIMDRateLimiter, RateLimitedLLMProvider, RateLimitError
+from .cache import LLMResponseCache, CachedLLMProvider
 
-__all__ = ["GroqProvider", "OllamaProvider"]
+__all__ = [
+    "GroqProvider",
+    "OllamaProvider",
+    "AIMDRateLimiter",
+    "RateLimitedLLMProvider",
+    "RateLimitError",
+    "LLMResponseCache",
+    "CachedLLMProvider",
+]
@@ -0,0 +1,265 @@
+import hashlib
+import json
+import logging
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Dict, Any, Optional
+from ..base import LLMProvider
+
+logger = logging.getLogger(__name__)
+
+
+class LLMResponseCache:
+    """Persistent, content-addressed store of LLM responses backed by SQLite.
+
+    Entries expire after ``ttl_seconds``. When the table grows past
+    ``max_entries``, the least recently used entries are evicted. The entry
+    count is tracked as entries come and go, so inserts don't count the table.
+    """
+
+    def __init__(
+        self,
+        db_path: str,
+        ttl_seconds: float = 30 * 24 * 3600,
+        max_entries: int = 100_000,
+    ):
+        self.db_path = db_path
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._conn: Optional[sqlite3.Connection] = None
+        self._lock = threading.Lock()
+        self._entries: Optional[int] = None  # Row count as of this process's writes
+
+    def _get_connection(self) -> sqlite3.Connection:
+        if self._conn is None:
+            if self.db_path != ":memory:":
+                Path(self.db_path).parent.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(self.db_path, check_same_thread=False)
+            self._conn.execute("""
+                CREATE TABLE IF NOT EXISTS llm_cache (
+                    key TEXT PRIMARY KEY,
+                    response TEXT NOT NULL,
+                    created_at REAL NOT NULL,
+                    last_used REAL NOT NULL
+                )
+            """)
+            self._conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_llm_cache_last_used ON llm_cache (last_used)"
+            )
+            self._conn.commit()
+            self._entries = self._conn.execute("SELECT COUNT(*) FROM llm_cache").fetchone()[0]
+        return self._conn
+
+    @staticmethod
+    def make_key(*parts: Any) -> str:
+        """Hash the parts that determine a response into a cache key."""
+        payload = json.dumps(parts, sort_keys=True, default=str)
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Optional[str]:
+        """Return the cached response for ``key``, or None if missing or expired."""
+        now = time.time()
+        with self._lock:
+            conn = self._get_connection()
+            row = conn.execute(
+                "SELECT response, created_at FROM llm_cache WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            if now - row[1] > self.ttl_seconds:
+                conn.execute("DELETE FROM llm_cache WHERE key = ?", (key,))
+                conn.commit()
+                self._entries -= 1
+                return None
+            conn.execute("UPDATE llm_cache SET last_used = ? WHERE key = ?", (now, key))
+            conn.commit()
+            return row[0]
+
+    def put(self, key: str, response: str) -> None:
+        now = time.time()
+        with self._lock:
+            conn = self._get_connection()
+            exists = conn.execute("SELECT 1 FROM llm_cache WHERE key = ?", (key,)).fetchone()
+            conn.execute(
+                "INSERT OR REPLACE INTO llm_cache (key, response, created_at, last_used) VALUES (?, ?, ?, ?)",
+                (key, response, now, now),
+            )
+            if not exists:
+                self._entries += 1
+            if self._entries > self.max_entries:
+                # Other processes may share the file, so count for real first
+                count = conn.execute("SELECT COUNT(*) FROM llm_cache").fetchone()[0]
+                if count > self.max_entries:
+                    # Evict down to 90% of the cap so we don't evict on every insert
+                    excess = count - int(self.max_entries * 0.9)
+                    cursor = conn.execute(
+                        "DELETE FROM llm_cache WHERE key IN "
+                        "(SELECT key FROM llm_cache ORDER BY last_used ASC LIMIT ?)",
+                        (excess,),
+                    )
+                    count -= cursor.rowcount
+                self._entries = count
+            conn.commit()
+
+    def purge_expired(self) -> int:
+        """Delete expired entries and return how many were removed."""
+        with self._lock:
+            conn = self._get_connection()
+            cursor = conn.execute(
+                "DELETE FROM llm_cache WHERE created_at < ?",
+                (time.time() - self.ttl_seconds,),
+            )
+            conn.commit()
+            self._entries -= cursor.rowcount
+            return cursor.rowcount
+
+    def clear(self) -> int:
+        """Delete every entry and return how many were removed."""
+        with self._lock:
+            conn = self._get_connection()
+            cursor = conn.execute("DELETE FROM llm_cache")
+            conn.commit()
+            self._entries = 0
+            return cursor.rowcount
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._get_connection().execute(
+                "SELECT COUNT(*) FROM llm_cache"
+            ).fetchone()[0]
+
+    def close(self) -> None:
+        with self._lock:
+            if self._conn:
+                self._conn.close()
+                self._conn = None
+
+
+class CachedLLMProvider(LLMProvider):
+    """Wraps any LLMProvider with a persistent LLMResponseCache.
+
+    The cache key covers the provider name, model, prompt template version,
+    system prompt, response format and prompt. Bump ``prompt_version`` (or
+    pass ``prompt_version=...`` to a call) to invalidate responses whose
+    prompts still read the same but are interpreted differently. Pass
+    ``bypass_cache=True`` to a call, or set ``bypass``, to always hit the
+    provider. Fresh responses are still stored.
+    """
+
+    def __init__(
+        self,
+        provider: LLMProvider,
+        cache: LLMResponseCache,
+        prompt_version: str = "1",
+        bypass: bool = False,
+    ):
+        self.provider = provider
+        self.cache = cache
+        self.prompt_version = prompt_version
+        self.bypass = bypass
+        self.hits = 0
+        self.misses = 0
+        self._stats_lock = threading.Lock()
+
+    @property
+    def name(self) -> str:
+        return self.provider.name
+
+    def __getattr__(self, item: str) -> Any:
+        # Expose wrapped provider attributes (model, host, ...) transparently
+        if item == "provider":
+            raise AttributeError(item)
+        return getattr(self.provider, item)
+
+    def configure(self, config: Dict[str, Any]) -> None:
+        self.provider.configure(config)
+
+    def _key(self, prompt: str, prompt_version: str, kwargs: Dict[str, Any]) -> str:
+        return LLMResponseCache.make_key(
+            self.provider.name,
+            getattr(self.provider, "model", ""),
+            prompt_version,
+            kwargs.get("system_prompt", ""),
+            kwargs.get("response_format"),
+            prompt,
+        )
+
+    def _record(self, hit: bool) -> None:
+        with self._stats_lock:
+            if hit:
+                self.hits += 1
+            else:
+                self.misses += 1
+
+    def complete(self, prompt: str, **kwargs) -> str:
+        bypass = kwargs.pop("bypass_cache", False) or self.bypass
+        prompt_version = kwargs.pop("prompt_version", self.prompt_version)
+        key = self._key(prompt, prompt_version, kwargs)
+
+        if not bypass:
+            cached = self.cache.get(key)
+            if cached is not None:
+                self._record(hit=True)
+                return cached
+
+        self._record(hit=False)
+        response = self.provider.complete(prompt, **kwargs)
+        if self._is_cacheable(response, kwargs):
+            self.cache.put(key, response)
+        return response
+
+    @staticmethod
+    def _is_cacheable(response: str, kwargs: Dict[str, Any]) -> bool:
+        """Don't persist malformed JSON answers; a retry may well succeed."""
+        response_format = kwargs.get("response_format")
+        if isinstance(response_format, dict) and response_format.get("type") == "json_object":
+            try:
+                json.loads(response)
+            except (TypeError, ValueError):
+                return False
+        return isinstance(response, str)
+
+    def complete_batch(
+        self, items: Dict[str, str], instructions: str, **kwargs
+    ) -> Dict[str, Dict[str, Any]]:
+        """Serve cached items individually and batch only the misses.
+
+        Items are cached one by one, so a post hits the cache no matter
+        which batch it lands in on the next run.
+        """
+        bypass = kwargs.pop("bypass_cache", False) or self.bypass
+        prompt_version = kwargs.pop("prompt_version", self.prompt_version)
+        keys = {
+            item_id: self._key(f"{instructions}\n{text}", f"batch:{prompt_version}", kwargs)
+            for item_id, text in items.items()
+        }
+
+        results: Dict[str, Dict[str, Any]] = {}
+        if not bypass:
+            for item_id, key in keys.items():
+                cached = self.cache.get(key)
+                if cached is not None:
+                    results[item_id] = json.loads(cached)
+                    self._record(hit=True)
+
+        misses = {k: v for k, v in items.items() if k not in results}
+        if misses:
+            for _ in misses:
+                self._record(hit=False)
+            fresh = self.provider.complete_batch(misses, instructions, **kwargs)
+            for item_id, data in fresh.items():
+                self.cache.put(keys[item_id], json.dumps(data))
+            results.update(fresh)
+        return results
+
+    def stats(self) -> Dict[str, Any]:
+        """Hit/miss counters for this process plus the persistent entry count."""
+        total = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / total if total else 0.0,
+            "entries": len(self.cache),
+        }
@@ -1,7 +1,10 @@
 import os
 import requests
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
 from typing import Dict, Any, Optional
 from ..base import LLMProvider
+from .rate_limit import RateLimitError
 from tenacity import (
     retry,
     stop_after_attempt,
@@ -10,6 +13,23 @@ from tenacity import (
 )
 
 
+def _parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Parse a Retry-After header given either as seconds or as an HTTP date."""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+
 class GroqProvider(LLMProvider):
     """LLM Provider using Groq API for high-speed inference."""
 
@@ -68,6 +88,12 @@ class GroqProvider(LLMProvider):
         response = requests.post(
             self.api_url, headers=headers, json=payload, timeout=30
         )
+        if response.status_code == 429:
+            # Not retried here: RateLimitedLLMProvider backs off for all callers
+            raise RateLimitError(
+                "Groq rate limit exceeded",
+                retry_after=_parse_retry_after(response.headers.get("Retry-After")),
+            )
         response.raise_for_status()
 
         return response.json()["choices"][0]["message"]["content"]
@@ -36,3 +36,11 @@ class MockLLMProvider(LLMProvider):
                 "composite_value": 0.8
             })
         return json.dumps({"result": "success"})
+
+    def complete_batch(
+        self, items: Dict[str, str], instructions: str, **kwargs
+    ) -> Dict[str, Dict[str, Any]]:
+        return {
+            item_id: json.loads(self.complete(f"{instructions}\n{text}", **kwargs))
+            for item_id, text in items.items()
+        }
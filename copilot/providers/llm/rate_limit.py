@@ -0,0 +1,131 @@
+import logging
+import threading
+import time
+from typing import Dict, Any, Optional
+from ..base import LLMProvider
+
+logger = logging.getLogger(__name__)
+
+
+class RateLimitError(Exception):
+    """Raised by a provider when the API rejects a request with HTTP 429."""
+
+    def __init__(self, message: str, retry_after: Optional[float] = None):
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
+class AIMDRateLimiter:
+    """Thread-safe token bucket with an additive-increase/multiplicative-decrease rate.
+
+    Every successful call raises the refill rate by ``increase`` requests per
+    minute (up to ``max_rate_per_minute``). Every throttle multiplies it by
+    ``decrease`` (down to ``min_rate_per_minute``), empties the bucket and pauses
+    all callers until the provider's Retry-After has elapsed.
+    """
+
+    def __init__(
+        self,
+        rate_per_minute: float = 30.0,
+        max_rate_per_minute: float = 600.0,
+        min_rate_per_minute: float = 2.0,
+        burst: int = 4,
+        increase: float = 2.0,
+        decrease: float = 0.5,
+    ):
+        self.max_rate = max_rate_per_minute
+        self.min_rate = min_rate_per_minute
+        self.rate = max(self.min_rate, min(rate_per_minute, self.max_rate))
+        self.capacity = float(max(1, burst))
+        self.increase = increase
+        self.decrease = decrease
+
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._paused_until = 0.0
+        self._lock = threading.Lock()
+
+    def _refill(self, now: float) -> None:
+        elapsed = now - self._updated
+        self._updated = now
+        self._tokens = min(self.capacity, self._tokens + elapsed * self.rate / 60.0)
+
+    def acquire(self) -> None:
+        """Block until a request slot is available."""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                if now < self._paused_until:
+                    wait = self._paused_until - now
+                else:
+                    self._refill(now)
+                    if self._tokens >= 1.0:
+                        self._tokens -= 1.0
+                        return
+                    wait = (1.0 - self._tokens) * 60.0 / self.rate
+            time.sleep(wait)
+
+    def on_success(self) -> None:
+        """Additive increase after a request the provider accepted."""
+        with self._lock:
+            self.rate = min(self.max_rate, self.rate + self.increase)
+
+    def on_throttle(self, retry_after: Optional[float] = None) -> None:
+        """Multiplicative decrease after a 429, honouring Retry-After if given."""
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            self.rate = max(self.min_rate, self.rate * self.decrease)
+            self._tokens = 0.0
+            pause = retry_after if retry_after is not None else 60.0 / self.rate
+            self._paused_until = max(self._paused_until, now + pause)
+            logger.warning(
+                f"LLM provider throttled; backing off {pause:.1f}s, "
+                f"rate now {self.rate:.1f} req/min"
+            )
+
+
+class RateLimitedLLMProvider(LLMProvider):
+    """Wraps any LLMProvider so every call goes through an AIMDRateLimiter.
+
+    Safe to share between threads, so modules can keep several analyses in
+    flight while the limiter keeps them inside the provider's quota.
+    """
+
+    def __init__(
+        self,
+        provider: LLMProvider,
+        limiter: Optional[AIMDRateLimiter] = None,
+        max_retries: int = 5,
+    ):
+        self.provider = provider
+        self.limiter = limiter or AIMDRateLimiter()
+        self.max_retries = max_retries
+
+    @property
+    def name(self) -> str:
+        return self.provider.name
+
+    def __getattr__(self, item: str) -> Any:
+        # Expose wrapped provider attributes (model, host, ...) transparently
+        if item == "provider":
+            raise AttributeError(item)
+        return getattr(self.provider, item)
+
+    def configure(self, config: Dict[str, Any]) -> None:
+        self.provider.configure(config)
+
+    def complete(self, prompt: str, **kwargs) -> str:
+        attempt = 0
+        while True:
+            self.limiter.acquire()
+            try:
+                result = self.provider.complete(prompt, **kwargs)
+            except RateLimitError as e:
+                attempt += 1
+                self.limiter.on_throttle(e.retry_after)
+                if attempt > self.max_retries:
+                    raise
+                continue
+            self.limiter.on_success()
+            return result
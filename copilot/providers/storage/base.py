@@ -1,5 +1,8 @@
+import sys
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Iterable, Iterator, List, Optional, Dict, Tuple, TypeVar
 from ...models.schemas import (
     ScrapedPost,
     PainScore,
@@ -8,6 +11,21 @@ from ...models.schemas import (
     OpportunityScore,
 )
 
+T = TypeVar("T")
+
+
+def _in_range(
+    items: Iterable[T],
+    timestamp: str,
+    since: Optional[datetime],
+    until: Optional[datetime],
+) -> Iterator[T]:
+    """Items whose ``timestamp`` attribute is on or after ``since`` and before ``until``."""
+    for item in items:
+        value = getattr(item, timestamp)
+        if (since is None or value >= since) and (until is None or value < until):
+            yield item
+
 
 class StorageProvider(ABC):
     """Canonical storage interface. All storage backends MUST implement this."""
@@ -21,11 +39,24 @@ class StorageProvider(ABC):
     def initialize(self) -> None:
         pass
 
+    @contextmanager
+    def transaction(self) -> Iterator[None]:
+        """Unit of work: group writes so they persist together.
+
+        Providers without transactions just run the block.
+        """
+        yield
+
     # --- Posts ---
     @abstractmethod
     def save_post(self, post: ScrapedPost) -> None:
         pass
 
+    def save_posts(self, posts: List[ScrapedPost]) -> None:
+        """Save many posts at once."""
+        for post in posts:
+            self.save_post(post)
+
     @abstractmethod
     def get_posts(
         self, limit: int = 100, source: Optional[str] = None
@@ -36,35 +67,178 @@ class StorageProvider(ABC):
     def get_post_by_id(self, post_id: str) -> Optional[ScrapedPost]:
         pass
 
+    def iter_posts(
+        self,
+        source: Optional[str] = None,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None,
+        analyzed_only: bool = False,
+        chunk_size: int = 500,
+    ) -> Iterator[ScrapedPost]:
+        """Stream stored posts, newest first, optionally only analyzed ones.
+
+        ``since`` and ``until`` bound ``created_at`` (inclusive, exclusive).
+        Providers that can read from a cursor ``chunk_size`` rows at a time
+        should override this; the default loads every post first.
+        """
+        posts = _in_range(
+            self.get_posts(limit=sys.maxsize, source=source), "created_at", since, until
+        )
+        if not analyzed_only:
+            yield from posts
+            return
+        posts = list(posts)
+        signals = self.get_signals([post.id for post in posts])
+        yield from (post for post in posts if post.id in signals)
+
+    def count_posts(
+        self,
+        source: Optional[str] = None,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None,
+        analyzed_only: bool = False,
+    ) -> int:
+        """Number of posts iter_posts would yield with the same filters."""
+        return sum(
+            1
+            for _ in self.iter_posts(
+                source=source, since=since, until=until, analyzed_only=analyzed_only
+            )
+        )
+
+    def get_posts_by_ids(self, post_ids: List[str]) -> Dict[str, ScrapedPost]:
+        """Fetch many posts by id. Missing ids are omitted."""
+        posts = {}
+        for post_id in post_ids:
+            post = self.get_post_by_id(post_id)
+            if post:
+                posts[post_id] = post
+        return posts
+
     # --- Signals / Analysis ---
     @abstractmethod
     def save_signal(self, post_id: str, pain_info: PainScore) -> None:
         pass
 
+    def save_signals(self, signals: Dict[str, PainScore]) -> None:
+        """Save many signals, keyed by post id, at once."""
+        for post_id, pain_info in signals.items():
+            self.save_signal(post_id, pain_info)
+
     @abstractmethod
     def get_signal(self, post_id: str) -> Optional[PainScore]:
         pass
 
+    def get_signals(self, post_ids: List[str]) -> Dict[str, PainScore]:
+        """Fetch the stored signals for many posts. Missing ids are omitted."""
+        signals = {}
+        for post_id in post_ids:
+            signal = self.get_signal(post_id)
+            if signal:
+                signals[post_id] = signal
+        return signals
+
+    def get_content_hashes(self, post_ids: List[str]) -> Dict[str, Optional[str]]:
+        """Content hash of each already-analyzed post (posts with a signal).
+
+        Posts that are unknown or were never analyzed are omitted.
+        """
+        hashes = {}
+        for post_id in post_ids:
+            post = self.get_post_by_id(post_id)
+            if post and self.get_signal(post_id):
+                hashes[post_id] = post.content_hash
+        return hashes
+
+    def find_near_duplicates(
+        self, posts: List[ScrapedPost], threshold: float = 0.8
+    ) -> Dict[str, str]:
+        """Map each post that near-duplicates a stored post to its canonical id.
+
+        Providers without a near-duplicate index report no duplicates.
+        """
+        return {}
+
     # --- Opportunity Scores ---
     @abstractmethod
     def save_opportunity_score(self, score: OpportunityScore) -> None:
         pass
 
+    def save_opportunity_scores(self, scores: List[OpportunityScore]) -> None:
+        """Save many opportunity scores at once."""
+        for score in scores:
+            self.save_opportunity_score(score)
+
     @abstractmethod
     def get_opportunity_scores(
-        self, limit: int = 100, min_score: float = 0.0
+        self, limit: int = 100, min_score: float = 0.0, source: Optional[str] = None
     ) -> List[OpportunityScore]:
         pass
 
+    def iter_scores(
+        self,
+        source: Optional[str] = None,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None,
+        chunk_size: int = 500,
+    ) -> Iterator[OpportunityScore]:
+        """Stream stored scores, best first.
+
+        ``since`` and ``until`` bound ``computed_at`` (inclusive, exclusive).
+        """
+        if source is not None:
+            scores = self.get_opportunity_scores(limit=sys.maxsize, source=source)
+        else:
+            scores = self.get_opportunity_scores(limit=sys.maxsize)
+        yield from _in_range(scores, "computed_at", since, until)
+
+    def get_scored_view(
+        self, limit: int = 100, min_score: float = 0.0, source: Optional[str] = None
+    ) -> List[Tuple[OpportunityScore, ScrapedPost, Optional[PainScore]]]:
+        """Top scores with their posts and signals, best first.
+
+        Scores whose post is missing are skipped.
+        """
+        scores = self.get_opportunity_scores(limit=limit, min_score=min_score, source=source)
+        post_ids = [score.post_id for score in scores]
+        posts = self.get_posts_by_ids(post_ids)
+        signals = self.get_signals(post_ids)
+        return [
+            (score, posts[score.post_id], signals.get(score.post_id))
+            for score in scores
+            if score.post_id in posts
+        ]
+
     # --- Leads ---
     @abstractmethod
     def save_lead(self, lead: Lead) -> None:
         pass
 
+    def save_leads(self, leads: List[Lead]) -> None:
+        """Save many leads at once."""
+        for lead in leads:
+            self.save_lead(lead)
+
     @abstractmethod
     def get_leads(self, limit: Optional[int] = 100) -> List[Lead]:
         pass
 
+    def iter_leads(
+        self,
+        source: Optional[str] = None,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None,
+        chunk_size: int = 500,
+    ) -> Iterator[Lead]:
+        """Stream stored leads, newest first.
+
+        ``since`` and ``until`` bound ``created_at`` (inclusive, exclusive).
+        """
+        leads = self.get_leads(limit=None)
+        if source is not None:
+            leads = [lead for lead in leads if lead.source == source]
+        yield from _in_range(leads, "created_at", since, until)
+
     # --- Reports ---
     @abstractmethod
     def save_report(self, report: ValidationReport) -> None:
@@ -73,3 +247,19 @@ class StorageProvider(ABC):
     @abstractmethod
     def get_reports(self, limit: Optional[int] = None) -> List[ValidationReport]:
         pass
+
+    def iter_reports(
+        self,
+        source: Optional[str] = None,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None,
+        chunk_size: int = 500,
+    ) -> Iterator[ValidationReport]:
+        """Stream stored validation reports, newest first.
+
+        ``since`` and ``until`` bound ``generated_at`` (inclusive, exclusive).
+        """
+        reports = self.get_reports(limit=None)
+        if source is not None:
+            reports = [report for report in reports if report.source == source]
+        yield from _in_range(reports, "generated_at", since, until)
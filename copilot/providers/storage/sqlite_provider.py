@@ -1,8 +1,15 @@
+import functools
 import json
+import logging
 import sqlite3
+import threading
+from collections import Counter
+from contextlib import contextmanager
 from pathlib import Path
-from typing import List, Dict, Any, Optional
-from datetime import datetime
+from typing import List, Dict, Any, Optional, Iterator, Type, TypeVar
+from datetime import date, datetime, timedelta, timezone
+
+from pydantic import BaseModel
 
 from .base import StorageProvider
 from ...models.schemas import (
@@ -11,30 +18,518 @@ from ...models.schemas import (
     Lead,
     ValidationReport,
     OpportunityScore,
+    compute_content_hash,
+)
+from ...core.text import (
+    DEFAULT_SIMILARITY,
+    content_minhash,
+    index_terms,
+    estimate_similarity,
+    lsh_buckets,
+    pack_signature,
+    unpack_signature,
+)
+
+logger = logging.getLogger(__name__)
+
+# Dimension columns of opportunity_scores, in scoring.WEIGHTS order
+_SCORE_DIMENSIONS = (
+    "pain_intensity",
+    "engagement_norm",
+    "validation_evidence",
+    "sentiment_intensity",
+    "recency",
+    "trend_momentum",
+    "market_signal",
+)
+
+# Columns read back into each model, named after the fields they fill and in
+# the order the _row_to_* helpers zip them. Rows may carry extra columns after
+# these.
+_POST_COLUMNS = (
+    "id",
+    "source",
+    "title",
+    "body",
+    "author",
+    "url",
+    "upvotes",
+    "comments_count",
+    "created_at",
+    "channel",
+    "subreddit",
+    "sentiment_label",
+    "sentiment_intensity",
+    "metadata",
+)
+_SIGNAL_COLUMNS = (
+    "score",
+    "reasoning",
+    "detected_problems",
+    "suggested_solutions",
+    "engagement_score",
+    "validation_score",
+    "recency_score",
+    "composite_value",
+    "sentiment_label",
+    "sentiment_intensity",
+    "failed",
+)
+_LEAD_COLUMNS = (
+    "id",
+    "post_id",
+    "source",
+    "author",
+    "content_snippet",
+    "intent_score",
+    "sentiment_label",
+    "sentiment_intensity",
+    "contact_url",
+    "verified_profiles",
+    "status",
+    "created_at",
+)
+_REPORT_COLUMNS = (
+    "post_id",
+    "source",
+    "idea_summary",
+    "market_size_estimate",
+    "competitors",
+    "swot_analysis",
+    "validation_verdict",
+    "next_steps",
+    "corroborating_sources",
+    "corroborating_post_ids",
+    "generated_at",
+)
+_SCORE_COLUMNS = (
+    ("post_id", "source", "final_score")
+    + _SCORE_DIMENSIONS
+    + ("cross_source_bonus", "dimensions", "weights", "computed_at")
+)
+
+# Indexes for the filter + ORDER BY of every top-N and listing query, so they
+# walk an index in order instead of scanning and sorting the table
+_SECONDARY_INDEXES = (
+    "CREATE INDEX IF NOT EXISTS idx_raw_posts_created_at ON raw_posts (created_at DESC)",
+    "CREATE INDEX IF NOT EXISTS idx_raw_posts_source_created_at ON raw_posts (source, created_at DESC)",
+    "CREATE INDEX IF NOT EXISTS idx_opportunity_scores_final_score ON opportunity_scores (final_score DESC)",
+    "CREATE INDEX IF NOT EXISTS idx_opportunity_scores_source_final_score ON opportunity_scores (source, final_score DESC)",
+    "CREATE INDEX IF NOT EXISTS idx_leads_created_at ON leads (created_at DESC)",
+    "CREATE INDEX IF NOT EXISTS idx_leads_intent_score ON leads (intent_score DESC)",
+    "CREATE INDEX IF NOT EXISTS idx_personas_generated_at ON personas (generated_at DESC)",
+    "CREATE INDEX IF NOT EXISTS idx_personas_type_generated_at ON personas (persona_type, generated_at DESC)",
+    "CREATE INDEX IF NOT EXISTS idx_validation_reports_generated_at ON validation_reports (generated_at DESC)",
+)
+
+# Rows of search_index for raw_posts p, with the analysis from signals s
+_SEARCH_ROWS = """
+    SELECT p.rowid, p.title, p.body, s.detected_problems, s.reasoning
+    FROM raw_posts p LEFT JOIN signals s ON s.post_id = p.id
+"""
+
+# INSERT OR REPLACE on raw_posts deletes the old row first, which fires the
+# delete trigger because connections enable recursive_triggers
+_SEARCH_TRIGGERS = (
+    """
+    CREATE TRIGGER IF NOT EXISTS raw_posts_search_insert AFTER INSERT ON raw_posts BEGIN
+        INSERT INTO search_index (rowid, title, body, problems, reasoning)
+        SELECT new.rowid, new.title, new.body, s.detected_problems, s.reasoning
+        FROM (SELECT 1) LEFT JOIN signals s ON s.post_id = new.id;
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS raw_posts_search_delete AFTER DELETE ON raw_posts BEGIN
+        DELETE FROM search_index WHERE rowid = old.rowid;
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS raw_posts_search_update AFTER UPDATE OF title, body ON raw_posts BEGIN
+        UPDATE search_index SET title = new.title, body = new.body WHERE rowid = new.rowid;
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS signals_search_insert AFTER INSERT ON signals BEGIN
+        UPDATE search_index SET problems = new.detected_problems, reasoning = new.reasoning
+        WHERE rowid = (SELECT rowid FROM raw_posts WHERE id = new.post_id);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS signals_search_update AFTER UPDATE ON signals BEGIN
+        UPDATE search_index SET problems = new.detected_problems, reasoning = new.reasoning
+        WHERE rowid = (SELECT rowid FROM raw_posts WHERE id = new.post_id);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS signals_search_delete AFTER DELETE ON signals BEGIN
+        UPDATE search_index SET problems = NULL, reasoning = NULL
+        WHERE rowid = (SELECT rowid FROM raw_posts WHERE id = old.post_id);
+    END
+    """,
+)
+
+
+# Keep IN (...) lists well under SQLite's bound-parameter limit
+_ID_CHUNK_SIZE = 500
+
+
+def _chunks(ids: List[str], size: int = _ID_CHUNK_SIZE) -> Iterator[List[str]]:
+    for i in range(0, len(ids), size):
+        yield ids[i : i + size]
+
+
+def _utc_iso(value: datetime) -> str:
+    """ISO timestamp in UTC (naive values are taken as UTC), so text order is time order."""
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc).isoformat()
+
+
+def _utc_day(value: datetime) -> str:
+    """UTC calendar day of ``value`` as YYYY-MM-DD, the term rollup key."""
+    return _utc_iso(value)[:10]
+
+
+def _select(columns: tuple, table: Optional[str] = None) -> str:
+    prefix = f"{table}." if table else ""
+    return ", ".join(prefix + column for column in columns)
+
+
+_json_decoder = json.JSONDecoder()
+
+
+def _loads(text: Optional[str], empty: type) -> Any:
+    """Decode a JSON column written by json.dumps; NULL or empty gives ``empty()``."""
+    if not text or text == "{}" or text == "[]":
+        return empty()
+    # Stored JSON has no surrounding whitespace, so skip json.loads' checks
+    return _json_decoder.raw_decode(text)[0]
+
+
+def _filters(
+    time_column: str,
+    source: Optional[str] = None,
+    since: Optional[datetime] = None,
+    until: Optional[datetime] = None,
+    table: Optional[str] = None,
+) -> tuple[list, list]:
+    """Conditions and params for the source and time range filters of queries.
+
+    Timestamps are stored as written (naive or with any UTC offset), so the
+    indexed text range is widened by a day, covering every offset, and
+    julianday() then compares the exact instants in UTC.
+    """
+    prefix = f"{table}." if table else ""
+    column = f"{prefix}{time_column}"
+    conditions, params = [], []
+    if source:
+        conditions.append(f"{prefix}source = ?")
+        params.append(source)
+    if since is not None:
+        conditions.append(f"{column} >= ? AND julianday({column}) >= julianday(?)")
+        params += [_utc_iso(since - timedelta(days=1))[:19], _utc_iso(since)]
+    if until is not None:
+        conditions.append(f"{column} < ? AND julianday({column}) < julianday(?)")
+        params += [_utc_iso(until + timedelta(days=1))[:19], _utc_iso(until)]
+    return conditions, params
+
+
+def _where(
+    time_column: str,
+    source: Optional[str] = None,
+    since: Optional[datetime] = None,
+    until: Optional[datetime] = None,
+    table: Optional[str] = None,
+) -> tuple[str, list]:
+    """WHERE clause and params for the source and time range filters of iter_*."""
+    conditions, params = _filters(time_column, source, since, until, table)
+    return (f"WHERE {' AND '.join(conditions)}" if conditions else ""), params
+
+
+# SQL of the hot read paths. The methods fill in the {placeholders} per call
+# and HOT_QUERIES with sample values, so ``explain_queries`` shows the plans
+# of the queries the app actually runs.
+_POSTS_SQL = (
+    f"SELECT {_select(_POST_COLUMNS, 'p')} FROM raw_posts p {{join}} {{where}} "
+    "ORDER BY p.created_at DESC"
+)
+_ANALYZED_JOIN = "JOIN signals s ON s.post_id = p.id"
+_POST_BY_ID_SQL = f"SELECT {_select(_POST_COLUMNS)} FROM raw_posts WHERE id = ?"
+_SIGNAL_SQL = f"SELECT {_select(_SIGNAL_COLUMNS)} FROM signals WHERE post_id = ?"
+_SEARCH_SQL = f"""
+    SELECT {_select(_POST_COLUMNS, "p")}, -search_index.rank AS search_rank,
+           snippet(search_index, -1, '[', ']', '...', 12) AS search_snippet
+    FROM search_index
+    JOIN raw_posts p ON p.rowid = search_index.rowid
+    WHERE {{where}}
+    ORDER BY {{order}}
+    LIMIT ?
+"""
+_SCORES_SQL = (
+    f"SELECT {_select(_SCORE_COLUMNS)} FROM opportunity_scores {{where}} "
+    "ORDER BY final_score DESC"
 )
+_LEADS_SQL = f"SELECT {_select(_LEAD_COLUMNS)} FROM leads {{where}} ORDER BY created_at DESC"
+_REPORTS_SQL = (
+    f"SELECT {_select(_REPORT_COLUMNS)} FROM validation_reports {{where}} "
+    "ORDER BY generated_at DESC"
+)
+_SCORED_VIEW_SQL = f"""
+    SELECT {_select(_SCORE_COLUMNS, "os")}, {_select(_POST_COLUMNS, "p")},
+           {_select(_SIGNAL_COLUMNS, "s")}, s.post_id AS signal_post_id
+    FROM opportunity_scores os
+    JOIN raw_posts p ON p.id = os.post_id
+    LEFT JOIN signals s ON s.post_id = os.post_id
+    WHERE os.final_score >= ? {{source_filter}}
+    ORDER BY os.final_score DESC
+    LIMIT ?
+"""
+
+# Queries the dashboard API (copilot/dashboard/api.py) runs on the database
+# directly
+DASHBOARD_LEADS_SQL = "SELECT * FROM leads ORDER BY intent_score DESC LIMIT ?"
+DASHBOARD_PERSONAS_SQL = "SELECT * FROM personas {where} ORDER BY generated_at DESC LIMIT ?"
+DASHBOARD_HIGH_SCORES_SQL = "SELECT COUNT(*) FROM opportunity_scores WHERE final_score > ?"
+
+
+def _hot_queries() -> tuple:
+    since = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    posts_where, posts_params = _where("created_at", "reddit", since, table="p")
+    leads_where, leads_params = _where("created_at", since=since)
+    reports_where, reports_params = _where("generated_at", since=since)
+    scores_where, scores_params = _where("computed_at", "reddit")
+    return (
+        ("get_posts", _POSTS_SQL.format(join="", where="") + " LIMIT ?", (100,)),
+        (
+            "get_posts by source",
+            _POSTS_SQL.format(join="", where="WHERE p.source = ?") + " LIMIT ?",
+            ("reddit", 100),
+        ),
+        ("get_post_by_id", _POST_BY_ID_SQL, ("id",)),
+        ("get_signal", _SIGNAL_SQL, ("id",)),
+        (
+            "search_posts",
+            _SEARCH_SQL.format(where="search_index MATCH ?", order="search_index.rank"),
+            ("invoice", 50),
+        ),
+        (
+            "get_opportunity_scores",
+            _SCORES_SQL.format(where="WHERE final_score >= ?") + " LIMIT ?",
+            (0.5, 100),
+        ),
+        (
+            "get_opportunity_scores by source",
+            _SCORES_SQL.format(where="WHERE final_score >= ? AND source = ?") + " LIMIT ?",
+            (0.5, "reddit", 100),
+        ),
+        ("get_leads", _LEADS_SQL.format(where="") + " LIMIT 100", ()),
+        ("get_reports", _REPORTS_SQL.format(where="") + " LIMIT 100", ()),
+        (
+            "iter_posts analyzed since",
+            _POSTS_SQL.format(join=_ANALYZED_JOIN, where=posts_where),
+            tuple(posts_params),
+        ),
+        ("iter_leads since", _LEADS_SQL.format(where=leads_where), tuple(leads_params)),
+        ("iter_reports since", _REPORTS_SQL.format(where=reports_where), tuple(reports_params)),
+        ("iter_scores by source", _SCORES_SQL.format(where=scores_where), tuple(scores_params)),
+        ("get_scored_view", _SCORED_VIEW_SQL.format(source_filter=""), (0.0, 100)),
+        ("dashboard /leads", DASHBOARD_LEADS_SQL, (50,)),
+        ("dashboard /personas", DASHBOARD_PERSONAS_SQL.format(where=""), (10,)),
+        (
+            "dashboard /personas by type",
+            DASHBOARD_PERSONAS_SQL.format(where="WHERE persona_type = ?"),
+            ("buyer", 10),
+        ),
+        ("dashboard /stats", DASHBOARD_HIGH_SCORES_SQL, (0.7,)),
+    )
+
+
+# Hot queries of this provider and of the dashboard API, with sample
+# parameters, for ``explain_queries``
+HOT_QUERIES = _hot_queries()
+
+
+Model = TypeVar("Model", bound=BaseModel)
+
+
+@functools.lru_cache(maxsize=None)
+def _all_fields(model: Type[BaseModel]) -> set:
+    # Shared by every instance _trusted builds. Setting an attribute only
+    # adds a field name to it, and every field name is already there.
+    return set(model.model_fields)
+
+
+def _trusted(model: Type[Model], values: Dict[str, Any]) -> Model:
+    """Build ``model`` from stored values without validating them again.
+
+    Everything in the database was validated on its way in, so reads skip
+    pydantic validation. This is model_construct without its per-field
+    default and alias handling, so ``values`` must have every field.
+    """
+    instance = model.__new__(model)
+    object.__setattr__(instance, "__dict__", values)
+    object.__setattr__(instance, "__pydantic_fields_set__", _all_fields(model))
+    object.__setattr__(instance, "__pydantic_extra__", None)
+    object.__setattr__(instance, "__pydantic_private__", None)
+    return instance
+
+
+def _writes(method):
+    """Run a storage method on the writer connection as one transaction."""
+
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        with self.transaction():
+            return method(self, *args, **kwargs)
+
+    return wrapper
 
 
 class SQLiteProvider(StorageProvider):
     """SQLite implementation of the StorageProvider."""
 
-    def __init__(self, db_path: str = "founder_copilot.db"):
+    def __init__(
+        self,
+        db_path: str = "founder_copilot.db",
+        read_only: bool = False,
+        busy_timeout: float = 5.0,
+        cache_size_kb: int = 65536,
+        mmap_size_mb: int = 256,
+    ):
         self.db_path = db_path
-        self._conn = None
+        self.read_only = read_only
+        self.busy_timeout = busy_timeout
+        self.cache_size_kb = cache_size_kb
+        self.mmap_size_mb = mmap_size_mb
+        self._writer: Optional[sqlite3.Connection] = None
+        self._writer_owner: Optional[int] = None
+        self._write_lock = threading.RLock()
+        self._readers = threading.local()
+        self._connections: List[sqlite3.Connection] = []
+        self._connections_lock = threading.Lock()
+        self._transaction_depth = 0
+        self._schema_ready = False
 
     @property
     def name(self) -> str:
         return "sqlite"
 
-    def _get_connection(self):
-        if self._conn is None:
-            self._conn = sqlite3.connect(self.db_path)
-            self._conn.row_factory = sqlite3.Row
-        return self._conn
+    def _connect(self) -> sqlite3.Connection:
+        if self.read_only:
+            # Worker processes read alongside the writer; never write
+            uri = Path(self.db_path).resolve().as_uri() + "?mode=ro"
+            conn = sqlite3.connect(
+                uri, uri=True, timeout=self.busy_timeout, check_same_thread=False
+            )
+        else:
+            conn = sqlite3.connect(
+                self.db_path, timeout=self.busy_timeout, check_same_thread=False
+            )
+        conn.row_factory = sqlite3.Row
+        conn.execute("PRAGMA synchronous = NORMAL")
+        conn.execute("PRAGMA recursive_triggers = ON")
+        conn.execute(f"PRAGMA cache_size = -{int(self.cache_size_kb)}")
+        conn.execute(f"PRAGMA mmap_size = {int(self.mmap_size_mb) * 1024 * 1024}")
+        with self._connections_lock:
+            self._connections.append(conn)
+        return conn
+
+    def _writer_connection(self) -> sqlite3.Connection:
+        if self._writer is None:
+            self._writer = self._connect()
+            if not self.read_only:
+                # Readers never block the writer, nor the writer readers
+                self._writer.execute("PRAGMA journal_mode = WAL")
+        return self._writer
+
+    def _get_connection(self) -> sqlite3.Connection:
+        """Connection for the calling thread.
+
+        Inside a ``transaction()`` this is the writer, so the block reads its
+        own uncommitted writes. Otherwise each thread reads through its own
+        connection and sees the last committed state.
+        """
+        if self._writer_owner == threading.get_ident() or self.db_path == ":memory:":
+            return self._writer_connection()
+        conn = getattr(self._readers, "conn", None)
+        if conn is None:
+            # Open the writer first so the database is in WAL mode
+            self._writer_connection()
+            conn = self._readers.conn = self._connect()
+        return conn
+
+    @contextmanager
+    def transaction(self) -> Iterator[None]:
+        """Unit of work: every write in the block commits once at the end.
 
+        Writes from all threads go through one writer connection, one block
+        at a time. Rolls back if the block raises. Nested blocks join the
+        outermost one.
+        """
+        with self._write_lock:
+            conn = self._writer_connection()
+            self._writer_owner = threading.get_ident()
+            self._transaction_depth += 1
+            try:
+                yield
+            except BaseException:
+                self._transaction_depth -= 1
+                if self._transaction_depth == 0:
+                    self._writer_owner = None
+                    conn.rollback()
+                raise
+            self._transaction_depth -= 1
+            if self._transaction_depth == 0:
+                self._writer_owner = None
+                conn.commit()
+
+    @_writes
     def initialize(self) -> None:
+        """Bring the schema up to date by running any pending migrations.
+
+        PRAGMA user_version holds the number of migrations applied, so a
+        current database costs one PRAGMA read, and repeat calls on the same
+        provider cost nothing.
+        """
+        if self._schema_ready:
+            return
         conn = self._get_connection()
+        if conn.execute("PRAGMA user_version").fetchone()[0] < len(self._MIGRATIONS):
+            self._migrate(conn)
+        self._schema_ready = True
+
+    def _migrate(self, conn: sqlite3.Connection) -> None:
+        if not conn.in_transaction:
+            # Holds off other processes until the migrations have committed
+            conn.execute("BEGIN IMMEDIATE")
+        version = conn.execute("PRAGMA user_version").fetchone()[0]
         cursor = conn.cursor()
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS schema_version (
+                version INTEGER PRIMARY KEY,
+                name TEXT NOT NULL,
+                applied_at TEXT NOT NULL
+            )
+        """)
+        for number, (name, step) in enumerate(
+            self._MIGRATIONS[version:], start=version + 1
+        ):
+            logger.info(f"Applying schema migration {number}: {name}")
+            step(self, cursor)
+            cursor.execute(
+                "INSERT OR REPLACE INTO schema_version (version, name, applied_at) VALUES (?, ?, ?)",
+                (number, name, datetime.now(timezone.utc).isoformat()),
+            )
+            cursor.execute(f"PRAGMA user_version = {number}")
+
+    def schema_version(self) -> int:
+        """Number of schema migrations applied to the database."""
+        return self._get_connection().execute("PRAGMA user_version").fetchone()[0]
 
+    # Each migration is idempotent, so databases created before versioning
+    # (user_version 0) replay them all safely, whatever their state
+
+    def _migrate_core_tables(self, cursor: sqlite3.Cursor) -> None:
         # Raw Posts table
         cursor.execute("""
             CREATE TABLE IF NOT EXISTS raw_posts (
@@ -99,11 +594,7 @@ class SQLiteProvider(StorageProvider):
             )
         """)
 
-        conn.commit()
-
-        # Migration Logic: Check and add columns if they don't exist
-        # Example for 'leads' table: add 'author' if not exists.
-        # This is a simplified example; a full migration system would be more robust.
+        # Columns added after the first release
         self._add_column_if_not_exists(cursor, "leads", "author", "TEXT")
         self._add_column_if_not_exists(cursor, "leads", "content_snippet", "TEXT")
         self._add_column_if_not_exists(cursor, "leads", "intent_score", "REAL")
@@ -112,6 +603,7 @@ class SQLiteProvider(StorageProvider):
         self._add_column_if_not_exists(cursor, "leads", "created_at", "TEXT")
 
         self._add_column_if_not_exists(cursor, "raw_posts", "metadata", "TEXT")
+        self._add_column_if_not_exists(cursor, "raw_posts", "content_hash", "TEXT")
 
         # Add columns for PainScore if they don't exist
         self._add_column_if_not_exists(cursor, "signals", "validation_score", "REAL")
@@ -197,7 +689,657 @@ class SQLiteProvider(StorageProvider):
             )
         """)
 
-        conn.commit()
+        self._backfill_content_hashes(cursor)
+
+    def _migrate_near_duplicate_index(self, cursor: sqlite3.Cursor) -> None:
+        # Near-duplicate index: MinHash signature of title + body per post,
+        # plus one LSH bucket row per band. signature is NULL (and there are
+        # no bucket rows) for posts too short to fingerprint.
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS post_fingerprints (
+                post_id TEXT PRIMARY KEY,
+                signature BLOB,
+                canonical_id TEXT NOT NULL,
+                FOREIGN KEY (post_id) REFERENCES raw_posts (id)
+            )
+        """)
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS post_lsh_buckets (
+                band INTEGER NOT NULL,
+                bucket INTEGER NOT NULL,
+                post_id TEXT NOT NULL,
+                PRIMARY KEY (band, bucket, post_id)
+            ) WITHOUT ROWID
+        """)
+
+        self._backfill_fingerprints(cursor)
+
+    def _migrate_term_index(self, cursor: sqlite3.Cursor) -> None:
+        # Inverted index of post terms for trend momentum / cross-source lookups.
+        # created_at is normalized to UTC so range filters compare as text.
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS post_terms (
+                term TEXT NOT NULL,
+                source TEXT NOT NULL,
+                created_at TEXT NOT NULL,
+                post_id TEXT NOT NULL,
+                PRIMARY KEY (term, source, created_at, post_id)
+            ) WITHOUT ROWID
+        """)
+        cursor.execute(
+            "CREATE INDEX IF NOT EXISTS idx_post_terms_post_id ON post_terms (post_id)"
+        )
+
+        # Daily term-count rollups, maintained alongside post_terms
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS term_daily_counts (
+                term TEXT NOT NULL,
+                source TEXT NOT NULL,
+                day TEXT NOT NULL,
+                count INTEGER NOT NULL,
+                PRIMARY KEY (term, source, day)
+            ) WITHOUT ROWID
+        """)
+        cursor.execute(
+            "CREATE INDEX IF NOT EXISTS idx_term_daily_counts_day ON term_daily_counts (day, source)"
+        )
+
+        # Document frequency per term (and the corpus size) for TF-IDF key terms
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS term_document_counts (
+                term TEXT PRIMARY KEY,
+                documents INTEGER NOT NULL
+            ) WITHOUT ROWID
+        """)
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS corpus_stats (
+                name TEXT PRIMARY KEY,
+                value INTEGER NOT NULL
+            )
+        """)
+
+        self._backfill_term_rollups(cursor)
+        self._backfill_terms(cursor)
+
+    def _migrate_discovery_runs(self, cursor: sqlite3.Cursor) -> None:
+        # Discovery runs and their checkpoints, so interrupted runs can resume
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS discovery_runs (
+                run_id TEXT PRIMARY KEY,
+                targets TEXT NOT NULL,
+                min_score REAL DEFAULT 0.0,
+                limit_per_target INTEGER,
+                status TEXT NOT NULL,
+                created_at TEXT,
+                updated_at TEXT
+            )
+        """)
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS discovery_run_targets (
+                run_id TEXT NOT NULL,
+                scraper TEXT NOT NULL,
+                target TEXT NOT NULL,
+                PRIMARY KEY (run_id, scraper, target),
+                FOREIGN KEY (run_id) REFERENCES discovery_runs (run_id)
+            )
+        """)
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS discovery_run_posts (
+                run_id TEXT NOT NULL,
+                post_id TEXT NOT NULL,
+                post TEXT NOT NULL,
+                status TEXT NOT NULL,
+                pain TEXT,
+                updated_at TEXT,
+                PRIMARY KEY (run_id, post_id),
+                FOREIGN KEY (run_id) REFERENCES discovery_runs (run_id)
+            )
+        """)
+
+    def _migrate_secondary_indexes(self, cursor: sqlite3.Cursor) -> None:
+        for statement in _SECONDARY_INDEXES:
+            cursor.execute(statement)
+
+    def _migrate_search_index(self, cursor: sqlite3.Cursor) -> None:
+        # Full-text index over post text and its analysis, keyed by the
+        # raw_posts rowid and kept in sync by the triggers below
+        cursor.execute("""
+            CREATE VIRTUAL TABLE IF NOT EXISTS search_index USING fts5 (
+                title, body, problems, reasoning
+            )
+        """)
+        for statement in _SEARCH_TRIGGERS:
+            cursor.execute(statement)
+
+        self._backfill_search_index(cursor)
+
+    def _migrate_failed_signals(self, cursor: sqlite3.Cursor) -> None:
+        # Placeholder scores of failed LLM analyses, which are never reused
+        self._add_column_if_not_exists(cursor, "signals", "failed", "INTEGER DEFAULT 0")
+        cursor.execute(
+            "UPDATE signals SET failed = 1 WHERE score = 0 AND reasoning LIKE 'Analysis failed:%'"
+        )
+
+    def _backfill_content_hashes(self, cursor: sqlite3.Cursor) -> None:
+        """Hash posts stored before content_hash existed, so they can be reused."""
+        cursor.execute(
+            "SELECT id, title, body FROM raw_posts WHERE content_hash IS NULL"
+        )
+        rows = cursor.fetchall()
+        if not rows:
+            return
+        cursor.executemany(
+            "UPDATE raw_posts SET content_hash = ? WHERE id = ?",
+            [(compute_content_hash(row["title"], row["body"]), row["id"]) for row in rows],
+        )
+
+    def _backfill_terms(self, cursor: sqlite3.Cursor) -> None:
+        """Index the terms of posts stored before the term index existed."""
+        cursor.execute("""
+            SELECT id, source, title, body, created_at FROM raw_posts
+            WHERE id NOT IN (SELECT post_id FROM post_terms)
+        """)
+        rows = cursor.fetchall()
+        if not rows:
+            return
+        self._write_terms(
+            cursor,
+            [
+                (
+                    row["id"],
+                    row["source"],
+                    datetime.fromisoformat(row["created_at"]),
+                    index_terms(row["title"], row["body"]),
+                )
+                for row in rows
+            ],
+        )
+
+    def _backfill_term_rollups(self, cursor: sqlite3.Cursor) -> None:
+        """Build the term rollups for a term index that predates them."""
+        cursor.execute("SELECT 1 FROM post_terms LIMIT 1")
+        if not cursor.fetchone():
+            return
+        for table in ("term_daily_counts", "term_document_counts"):
+            cursor.execute(f"SELECT 1 FROM {table} LIMIT 1")
+            if not cursor.fetchone():
+                self.rebuild_term_rollups()
+                return
+
+    def _backfill_search_index(self, cursor: sqlite3.Cursor) -> None:
+        """Index posts stored before the search index existed."""
+        cursor.execute("SELECT 1 FROM search_index LIMIT 1")
+        if cursor.fetchone():
+            return
+        cursor.execute(f"INSERT INTO search_index (rowid, title, body, problems, reasoning) {_SEARCH_ROWS}")
+
+    @_writes
+    def rebuild_term_rollups(self) -> int:
+        """Recompute the daily counts and document frequencies from the term index.
+
+        Returns the number of daily count rows.
+        """
+        conn = self._get_connection()
+        conn.execute("DELETE FROM term_daily_counts")
+        conn.execute("""
+            INSERT INTO term_daily_counts (term, source, day, count)
+            SELECT term, source, substr(created_at, 1, 10), COUNT(*)
+            FROM post_terms
+            GROUP BY term, source, substr(created_at, 1, 10)
+        """)
+        conn.execute("DELETE FROM term_document_counts")
+        conn.execute("""
+            INSERT INTO term_document_counts (term, documents)
+            SELECT term, COUNT(*) FROM post_terms GROUP BY term
+        """)
+        conn.execute("""
+            INSERT OR REPLACE INTO corpus_stats (name, value)
+            SELECT 'documents', COUNT(DISTINCT post_id) FROM post_terms
+        """)
+        return conn.execute("SELECT COUNT(*) FROM term_daily_counts").fetchone()[0]
+
+    def _write_terms(
+        self,
+        cursor: sqlite3.Cursor,
+        posts: List[tuple[str, str, datetime, set]],
+    ) -> None:
+        """Re-index (post_id, source, created_at, terms) entries, adjusting the rollups by the difference."""
+        latest = {post_id: (source, created_at, terms) for post_id, source, created_at, terms in posts}
+        old_rows: Dict[str, set] = {post_id: set() for post_id in latest}
+        for chunk in _chunks(list(latest)):
+            cursor.execute(
+                f"""
+                SELECT post_id, term, source, created_at FROM post_terms
+                WHERE post_id IN ({", ".join("?" * len(chunk))})
+                """,
+                chunk,
+            )
+            for post_id, term, source, created in cursor.fetchall():
+                old_rows[post_id].add((term, source, created))
+
+        deleted, inserted = [], []
+        day_deltas: Counter = Counter()
+        document_deltas: Counter = Counter()
+        corpus_delta = 0
+        for post_id, (source, created_at, terms) in latest.items():
+            old = old_rows[post_id]
+            created = _utc_iso(created_at)
+            new = {(term, source, created) for term in terms}
+            if old == new:
+                continue
+
+            for term, src, old_created in old - new:
+                deleted.append((term, src, old_created, post_id))
+                day_deltas[(term, src, old_created[:10])] -= 1
+            for term, src, new_created in new - old:
+                inserted.append((term, src, new_created, post_id))
+                day_deltas[(term, src, new_created[:10])] += 1
+
+            old_terms = {term for term, _, _ in old}
+            for term in old_terms - terms:
+                document_deltas[term] -= 1
+            for term in terms - old_terms:
+                document_deltas[term] += 1
+            if bool(old_terms) != bool(terms):
+                corpus_delta += 1 if terms else -1
+
+        cursor.executemany(
+            "DELETE FROM post_terms WHERE term = ? AND source = ? AND created_at = ? AND post_id = ?",
+            deleted,
+        )
+        cursor.executemany(
+            "INSERT OR IGNORE INTO post_terms (term, source, created_at, post_id) VALUES (?, ?, ?, ?)",
+            inserted,
+        )
+
+        day_changes = [key + (delta,) for key, delta in day_deltas.items() if delta]
+        cursor.executemany(
+            """
+            INSERT INTO term_daily_counts (term, source, day, count) VALUES (?, ?, ?, ?)
+            ON CONFLICT (term, source, day) DO UPDATE SET count = count + excluded.count
+            """,
+            day_changes,
+        )
+        cursor.executemany(
+            "DELETE FROM term_daily_counts WHERE term = ? AND source = ? AND day = ? AND count <= 0",
+            [change[:3] for change in day_changes if change[3] < 0],
+        )
+
+        document_changes = [(term, delta) for term, delta in document_deltas.items() if delta]
+        cursor.executemany(
+            """
+            INSERT INTO term_document_counts (term, documents) VALUES (?, ?)
+            ON CONFLICT (term) DO UPDATE SET documents = documents + excluded.documents
+            """,
+            document_changes,
+        )
+        cursor.executemany(
+            "DELETE FROM term_document_counts WHERE term = ? AND documents <= 0",
+            [(term,) for term, delta in document_changes if delta < 0],
+        )
+        if corpus_delta:
+            cursor.execute(
+                """
+                INSERT INTO corpus_stats (name, value) VALUES ('documents', ?)
+                ON CONFLICT (name) DO UPDATE SET value = value + excluded.value
+                """,
+                (corpus_delta,),
+            )
+
+    def count_posts_with_terms(
+        self,
+        terms: List[str],
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None,
+        source: Optional[str] = None,
+        exclude_post_id: Optional[str] = None,
+    ) -> int:
+        """Count posts containing any of ``terms``, created in [since, until)."""
+        if not terms:
+            return 0
+        query = f"""
+            SELECT COUNT(DISTINCT post_id) FROM post_terms
+            WHERE term IN ({", ".join("?" * len(terms))})
+        """
+        params: List[Any] = list(terms)
+        if source:
+            query += " AND source = ?"
+            params.append(source)
+        if since:
+            query += " AND created_at >= ?"
+            params.append(_utc_iso(since))
+        if until:
+            query += " AND created_at < ?"
+            params.append(_utc_iso(until))
+        if exclude_post_id:
+            query += " AND post_id != ?"
+            params.append(exclude_post_id)
+
+        conn = self._get_connection()
+        return conn.execute(query, params).fetchone()[0]
+
+    def sum_term_counts(
+        self,
+        terms: List[str],
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None,
+        source: Optional[str] = None,
+        exclude_post_id: Optional[str] = None,
+    ) -> int:
+        """Mentions of ``terms`` on UTC days in [since, until), from the daily rollups.
+
+        A post mentioning two of the terms counts twice. ``exclude_post_id``
+        subtracts that post's own mentions.
+        """
+        if not terms:
+            return 0
+        conditions = [f"term IN ({', '.join('?' * len(terms))})"]
+        params: List[Any] = list(terms)
+        if source:
+            conditions.append("source = ?")
+            params.append(source)
+        if since:
+            conditions.append("day >= ?")
+            params.append(_utc_day(since))
+        if until:
+            conditions.append("day < ?")
+            params.append(_utc_day(until))
+        where = " AND ".join(conditions)
+
+        conn = self._get_connection()
+        total = conn.execute(
+            f"SELECT COALESCE(SUM(count), 0) FROM term_daily_counts WHERE {where}", params
+        ).fetchone()[0]
+        if exclude_post_id:
+            own = conn.execute(
+                f"""
+                SELECT COUNT(*) FROM (
+                    SELECT term, source, substr(created_at, 1, 10) AS day
+                    FROM post_terms WHERE post_id = ?
+                ) WHERE {where}
+                """,
+                [exclude_post_id] + params,
+            ).fetchone()[0]
+            total -= own
+        return total
+
+    def get_sources_with_terms(
+        self,
+        terms: List[str],
+        since: Optional[datetime] = None,
+        exclude_source: Optional[str] = None,
+    ) -> set:
+        """Sources mentioning any of ``terms`` on or after the UTC day of ``since``."""
+        if not terms:
+            return set()
+        query = f"""
+            SELECT DISTINCT source FROM term_daily_counts
+            WHERE term IN ({", ".join("?" * len(terms))})
+        """
+        params: List[Any] = list(terms)
+        if since:
+            query += " AND day >= ?"
+            params.append(_utc_day(since))
+        if exclude_source:
+            query += " AND source != ?"
+            params.append(exclude_source)
+
+        conn = self._get_connection()
+        return {row[0] for row in conn.execute(query, params).fetchall()}
+
+    def get_document_frequencies(self, terms: List[str]) -> tuple:
+        """({term: posts containing it}, number of indexed posts), for TF-IDF."""
+        conn = self._get_connection()
+        frequencies: Dict[str, int] = {}
+        for chunk in _chunks(sorted(set(terms))):
+            frequencies.update(
+                conn.execute(
+                    f"""
+                    SELECT term, documents FROM term_document_counts
+                    WHERE term IN ({", ".join("?" * len(chunk))})
+                    """,
+                    chunk,
+                ).fetchall()
+            )
+        row = conn.execute(
+            "SELECT value FROM corpus_stats WHERE name = 'documents'"
+        ).fetchone()
+        return frequencies, row[0] if row else 0
+
+    def get_term_daily_counts(
+        self, terms: List[str], since: Optional[datetime] = None
+    ) -> List[tuple]:
+        """(term, source, day, count) rollup rows for ``terms``, for batch scoring."""
+        rows = []
+        conn = self._get_connection()
+        for chunk in _chunks(sorted(set(terms))):
+            query = f"""
+                SELECT term, source, day, count FROM term_daily_counts
+                WHERE term IN ({", ".join("?" * len(chunk))})
+            """
+            params: List[Any] = list(chunk)
+            if since:
+                query += " AND day >= ?"
+                params.append(_utc_day(since))
+            rows.extend(
+                (term, source, date.fromisoformat(day), count)
+                for term, source, day, count in conn.execute(query, params)
+            )
+        return rows
+
+    def get_post_terms(self, post_ids: List[str]) -> Dict[str, List[tuple]]:
+        """Indexed (term, source, day) rows of each post, keyed by post id."""
+        result: Dict[str, List[tuple]] = {}
+        conn = self._get_connection()
+        for chunk in _chunks(list(post_ids)):
+            for post_id, term, source, created_at in conn.execute(
+                f"""
+                SELECT post_id, term, source, created_at FROM post_terms
+                WHERE post_id IN ({", ".join("?" * len(chunk))})
+                """,
+                chunk,
+            ):
+                result.setdefault(post_id, []).append(
+                    (term, source, date.fromisoformat(created_at[:10]))
+                )
+        return result
+
+    def get_rising_terms(
+        self,
+        days: int = 30,
+        source: Optional[str] = None,
+        limit: int = 10,
+        min_count: int = 3,
+    ) -> List[Dict[str, Any]]:
+        """Fastest-rising terms per source: mentions in the last ``days`` vs the ``days`` before.
+
+        Growth is (recent + 1) / (previous + 1); only terms with at least
+        ``min_count`` recent mentions are ranked. Reads only the rollups.
+        """
+        now = datetime.now(timezone.utc)
+        recent_start = _utc_day(now - timedelta(days=days))
+        previous_start = _utc_day(now - timedelta(days=2 * days))
+        source_filter = "AND source = ?" if source else ""
+        params: List[Any] = [recent_start, recent_start, previous_start]
+        if source:
+            params.append(source)
+        params += [min_count, limit]
+
+        conn = self._get_connection()
+        rows = conn.execute(
+            f"""
+            SELECT term, source, recent, previous, growth FROM (
+                SELECT term, source, recent, previous,
+                       (recent + 1.0) / (previous + 1.0) AS growth,
+                       ROW_NUMBER() OVER (
+                           PARTITION BY source
+                           ORDER BY (recent + 1.0) / (previous + 1.0) DESC, recent DESC, term
+                       ) AS rank
+                FROM (
+                    SELECT term, source,
+                           SUM(CASE WHEN day >= ? THEN count ELSE 0 END) AS recent,
+                           SUM(CASE WHEN day < ? THEN count ELSE 0 END) AS previous
+                    FROM term_daily_counts
+                    WHERE day >= ? {source_filter}
+                    GROUP BY term, source
+                )
+                WHERE recent >= ?
+            )
+            WHERE rank <= ?
+            ORDER BY source, growth DESC, recent DESC, term
+            """,
+            params,
+        ).fetchall()
+        return [dict(row) for row in rows]
+
+    def _backfill_fingerprints(self, cursor: sqlite3.Cursor) -> None:
+        """Fingerprint posts stored before the near-duplicate index existed.
+
+        Each becomes its own canonical post; later posts link to them.
+        """
+        cursor.execute("""
+            SELECT p.id, p.title, p.body FROM raw_posts p
+            LEFT JOIN post_fingerprints f ON f.post_id = p.id
+            WHERE f.post_id IS NULL
+        """)
+        rows = cursor.fetchall()
+        if not rows:
+            return
+        for row in rows:
+            signature = content_minhash(row["title"], row["body"])
+            self._write_fingerprint(cursor, row["id"], signature, row["id"])
+
+    def _write_fingerprint(
+        self,
+        cursor: sqlite3.Cursor,
+        post_id: str,
+        signature: Optional[tuple],
+        canonical_id: str,
+        old_signature: Optional[tuple] = None,
+    ) -> None:
+        if old_signature:
+            # Bucket rows are keyed by (band, bucket), so delete them by key
+            cursor.executemany(
+                "DELETE FROM post_lsh_buckets WHERE band = ? AND bucket = ? AND post_id = ?",
+                [
+                    (band, bucket, post_id)
+                    for band, bucket in enumerate(lsh_buckets(old_signature))
+                ],
+            )
+        cursor.execute(
+            "INSERT OR REPLACE INTO post_fingerprints (post_id, signature, canonical_id) VALUES (?, ?, ?)",
+            (post_id, pack_signature(signature) if signature else None, canonical_id),
+        )
+        if signature:
+            cursor.executemany(
+                "INSERT OR IGNORE INTO post_lsh_buckets (band, bucket, post_id) VALUES (?, ?, ?)",
+                [
+                    (band, bucket, post_id)
+                    for band, bucket in enumerate(lsh_buckets(signature))
+                ],
+            )
+
+    def _find_canonical(
+        self,
+        cursor: sqlite3.Cursor,
+        signature: tuple,
+        exclude_id: str,
+        threshold: float = DEFAULT_SIMILARITY,
+    ) -> Optional[str]:
+        """Canonical id of the most similar stored post at or above ``threshold``."""
+        buckets = lsh_buckets(signature)
+        candidates = " UNION ".join(
+            "SELECT post_id FROM post_lsh_buckets WHERE band = ? AND bucket = ?"
+            for _ in buckets
+        )
+        cursor.execute(
+            f"""
+            SELECT f.post_id, f.signature, f.canonical_id
+            FROM ({candidates}) c
+            JOIN post_fingerprints f ON f.post_id = c.post_id
+        """,
+            [value for band, bucket in enumerate(buckets) for value in (band, bucket)],
+        )
+
+        best = None
+        for row in cursor.fetchall():
+            if row["post_id"] == exclude_id:
+                continue
+            similarity = estimate_similarity(signature, unpack_signature(row["signature"]))
+            if similarity >= threshold and (best is None or similarity > best[0]):
+                best = (similarity, row["canonical_id"])
+        return best[1] if best else None
+
+    def _index_fingerprint(self, cursor: sqlite3.Cursor, post: ScrapedPost) -> None:
+        """Add or refresh a post in the near-duplicate index, linking it to its canonical post."""
+        signature = content_minhash(post.title, post.body)
+        cursor.execute(
+            "SELECT signature FROM post_fingerprints WHERE post_id = ?", (post.id,)
+        )
+        existing = cursor.fetchone()
+        packed = pack_signature(signature) if signature else None
+        if existing is not None and existing["signature"] == packed:
+            return
+
+        canonical_id = post.id
+        if signature:
+            canonical_id = self._find_canonical(cursor, signature, post.id) or post.id
+        old_signature = (
+            unpack_signature(existing["signature"])
+            if existing is not None and existing["signature"]
+            else None
+        )
+        self._write_fingerprint(cursor, post.id, signature, canonical_id, old_signature)
+
+    def find_near_duplicates(
+        self, posts: List[ScrapedPost], threshold: float = DEFAULT_SIMILARITY
+    ) -> Dict[str, str]:
+        conn = self._get_connection()
+        cursor = conn.cursor()
+        duplicates = {}
+        for post in posts:
+            signature = content_minhash(post.title, post.body)
+            if signature is None:
+                continue
+            canonical_id = self._find_canonical(cursor, signature, post.id, threshold)
+            if canonical_id and canonical_id != post.id:
+                duplicates[post.id] = canonical_id
+        return duplicates
+
+    def get_canonical_id(self, post_id: str) -> Optional[str]:
+        conn = self._get_connection()
+        cursor = conn.cursor()
+        cursor.execute(
+            "SELECT canonical_id FROM post_fingerprints WHERE post_id = ?", (post_id,)
+        )
+        row = cursor.fetchone()
+        return row["canonical_id"] if row else None
+
+    def explain_queries(self) -> List[Dict[str, Any]]:
+        """Query plan of every HOT_QUERIES entry.
+
+        Each result has the query ``name``, its ``plan`` lines and ``full_scan``,
+        which is True if SQLite scans a table without an index (full-text
+        lookups count as indexed) or sorts the result in a temporary B-tree.
+        """
+        conn = self._get_connection()
+        results = []
+        for name, sql, params in HOT_QUERIES:
+            plan = [
+                row["detail"]
+                for row in conn.execute(f"EXPLAIN QUERY PLAN {sql}", params)
+            ]
+            full_scan = any(
+                (
+                    line.startswith("SCAN ")
+                    and " USING " not in line
+                    and " VIRTUAL TABLE INDEX " not in line
+                )
+                or "TEMP B-TREE" in line
+                for line in plan
+            )
+            results.append({"name": name, "plan": plan, "full_scan": full_scan})
+        return results
 
     def _add_column_if_not_exists(
         self,
@@ -212,95 +1354,162 @@ class SQLiteProvider(StorageProvider):
             cursor.execute(
                 f"ALTER TABLE {table_name} ADD COLUMN {column_name} {column_type}"
             )
-            print(f"Added column {column_name} to table {table_name}")  # For debugging
+            logger.info(f"Added column {column_name} to table {table_name}")
+
+    def _post_row(self, post: ScrapedPost) -> tuple:
+        return (
+            post.id,
+            post.source,
+            post.title,
+            post.body,
+            post.author,
+            post.url,
+            post.upvotes,
+            post.comments_count,
+            post.created_at.isoformat(),
+            post.subreddit,
+            json.dumps(post.metadata),
+            post.channel,
+            post.sentiment_label,
+            post.sentiment_intensity,
+            post.content_hash,
+        )
 
     def save_post(self, post: ScrapedPost) -> None:
+        self.save_posts([post])
+
+    @_writes
+    def save_posts(self, posts: List[ScrapedPost]) -> None:
+        """Save many posts in one transaction, keeping the search indexes current."""
+        if not posts:
+            return
         conn = self._get_connection()
         cursor = conn.cursor()
 
-        cursor.execute(
+        cursor.executemany(
             """
             INSERT OR REPLACE INTO raw_posts 
-            (id, source, title, body, author, url, upvotes, comments_count, created_at, subreddit, metadata, channel, sentiment_label, sentiment_intensity)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            (id, source, title, body, author, url, upvotes, comments_count, created_at, subreddit, metadata, channel, sentiment_label, sentiment_intensity, content_hash)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
         """,
-            (
-                post.id,
-                post.source,
-                post.title,
-                post.body,
-                post.author,
-                post.url,
-                post.upvotes,
-                post.comments_count,
-                post.created_at.isoformat(),
-                post.subreddit,
-                json.dumps(post.metadata),
-                post.channel,
-                post.sentiment_label,
-                post.sentiment_intensity,
-            ),
+            [self._post_row(post) for post in posts],
+        )
+        for post in posts:
+            self._index_fingerprint(cursor, post)
+        self._write_terms(
+            cursor,
+            [
+                (post.id, post.source, post.created_at, index_terms(post.title, post.body))
+                for post in posts
+            ],
+        )
+
+    def _signal_row(self, post_id: str, pain_info: PainScore) -> tuple:
+        return (
+            post_id,
+            pain_info.score,
+            pain_info.reasoning,
+            json.dumps(pain_info.detected_problems),
+            json.dumps(pain_info.suggested_solutions),
+            pain_info.validation_score,
+            pain_info.engagement_score,
+            pain_info.recency_score,
+            pain_info.composite_value,
+            datetime.now().isoformat(),
+            pain_info.sentiment_label,
+            pain_info.sentiment_intensity,
+            int(pain_info.failed),
         )
-        conn.commit()
 
     def save_signal(self, post_id: str, pain_info: PainScore) -> None:
-        conn = self._get_connection()
-        cursor = conn.cursor()
+        self.save_signals({post_id: pain_info})
 
-        cursor.execute(
+    @_writes
+    def save_signals(self, signals: Dict[str, PainScore]) -> None:
+        """Save many signals, keyed by post id, in one transaction."""
+        if not signals:
+            return
+        conn = self._get_connection()
+        conn.executemany(
             """
             INSERT OR REPLACE INTO signals 
             (post_id, score, reasoning, detected_problems, suggested_solutions, 
              validation_score, engagement_score, recency_score, composite_value, analyzed_at,
-             sentiment_label, sentiment_intensity)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+             sentiment_label, sentiment_intensity, failed)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
         """,
-            (
-                post_id,
-                pain_info.score,
-                pain_info.reasoning,
-                json.dumps(pain_info.detected_problems),
-                json.dumps(pain_info.suggested_solutions),
-                pain_info.validation_score,
-                pain_info.engagement_score,
-                pain_info.recency_score,
-                pain_info.composite_value,
-                datetime.now().isoformat(),
-                pain_info.sentiment_label,
-                pain_info.sentiment_intensity,
-            ),
+            [self._signal_row(post_id, pain) for post_id, pain in signals.items()],
         )
-        conn.commit()
+
+    def _row_to_signal(self, row: sqlite3.Row) -> PainScore:
+        signal = dict(zip(_SIGNAL_COLUMNS, row))
+        signal["detected_problems"] = _loads(signal["detected_problems"], list)
+        signal["suggested_solutions"] = _loads(signal["suggested_solutions"], list)
+        for name in (
+            "engagement_score",
+            "validation_score",
+            "recency_score",
+            "composite_value",
+            "sentiment_intensity",
+        ):
+            signal[name] = signal[name] or 0.0
+        signal["failed"] = bool(signal["failed"])
+        return _trusted(PainScore, signal)
 
     def get_signal(self, post_id: str) -> Optional[PainScore]:
         conn = self._get_connection()
         cursor = conn.cursor()
-        cursor.execute("SELECT * FROM signals WHERE post_id = ?", (post_id,))
+        cursor.execute(_SIGNAL_SQL, (post_id,))
         row = cursor.fetchone()
 
         if not row:
             return None
 
-        return PainScore(
-            score=row["score"],
-            reasoning=row["reasoning"],
-            detected_problems=json.loads(row["detected_problems"])
-            if row["detected_problems"]
-            else [],
-            suggested_solutions=json.loads(row["suggested_solutions"])
-            if row["suggested_solutions"]
-            else [],
-            validation_score=row["validation_score"] or 0.0,
-            engagement_score=row["engagement_score"] or 0.0,
-            recency_score=row["recency_score"] or 0.0,
-            composite_value=row["composite_value"] or 0.0,
-            sentiment_label=row["sentiment_label"]
-            if "sentiment_label" in row.keys()
-            else None,
-            sentiment_intensity=row["sentiment_intensity"]
-            if "sentiment_intensity" in row.keys()
-            else 0.0,
-        )
+        return self._row_to_signal(row)
+
+    def get_signals(self, post_ids: List[str]) -> Dict[str, PainScore]:
+        conn = self._get_connection()
+        cursor = conn.cursor()
+        signals = {}
+        for chunk in _chunks(list(post_ids)):
+            placeholders = ", ".join("?" * len(chunk))
+            cursor.execute(
+                f"""
+                SELECT {_select(_SIGNAL_COLUMNS)}, post_id FROM signals
+                WHERE post_id IN ({placeholders})
+                """,
+                chunk,
+            )
+            for row in cursor:
+                signals[row["post_id"]] = self._row_to_signal(row)
+        return signals
+
+    def get_content_hashes(self, post_ids: List[str]) -> Dict[str, Optional[str]]:
+        conn = self._get_connection()
+        cursor = conn.cursor()
+        hashes = {}
+        for chunk in _chunks(list(post_ids)):
+            placeholders = ", ".join("?" * len(chunk))
+            cursor.execute(
+                f"""
+                SELECT p.id, p.content_hash FROM raw_posts p
+                JOIN signals s ON s.post_id = p.id
+                WHERE p.id IN ({placeholders})
+            """,
+                chunk,
+            )
+            for row in cursor.fetchall():
+                hashes[row["id"]] = row["content_hash"]
+        return hashes
+
+    def _row_to_post(self, row: sqlite3.Row) -> ScrapedPost:
+        post = dict(zip(_POST_COLUMNS, row))
+        post["created_at"] = datetime.fromisoformat(post["created_at"])
+        post["channel"] = post["channel"] or None
+        post["sentiment_label"] = post["sentiment_label"] or None
+        post["sentiment_intensity"] = post["sentiment_intensity"] or 0.0
+        post["metadata"] = _loads(post["metadata"], dict)
+        return _trusted(ScrapedPost, post)
 
     def get_posts(
         self, limit: int = 100, source: Optional[str] = None
@@ -310,126 +1519,252 @@ class SQLiteProvider(StorageProvider):
 
         if source:
             cursor.execute(
-                "SELECT * FROM raw_posts WHERE source = ? ORDER BY created_at DESC LIMIT ?",
+                _POSTS_SQL.format(join="", where="WHERE p.source = ?") + " LIMIT ?",
                 (source, limit),
             )
         else:
-            cursor.execute(
-                "SELECT * FROM raw_posts ORDER BY created_at DESC LIMIT ?", (limit,)
-            )
-        rows = cursor.fetchall()
+            cursor.execute(_POSTS_SQL.format(join="", where="") + " LIMIT ?", (limit,))
+        return [self._row_to_post(row) for row in cursor]
 
-        posts = []
-        for row in rows:
-            posts.append(
-                ScrapedPost(
-                    id=row["id"],
-                    source=row["source"],
-                    title=row["title"],
-                    body=row["body"],
-                    author=row["author"],
-                    url=row["url"],
-                    upvotes=row["upvotes"],
-                    comments_count=row["comments_count"],
-                    created_at=datetime.fromisoformat(row["created_at"]),
-                    subreddit=row["subreddit"],
-                    channel=row["channel"] if row["channel"] else None,
-                    sentiment_label=row["sentiment_label"]
-                    if row["sentiment_label"]
-                    else None,
-                    sentiment_intensity=row["sentiment_intensity"]
-                    if row["sentiment_intensity"]
-                    else 0.0,
-                    metadata=json.loads(row["metadata"]) if row["metadata"] else {},
-                )
+    def get_posts_by_ids(self, post_ids: List[str]) -> Dict[str, ScrapedPost]:
+        conn = self._get_connection()
+        cursor = conn.cursor()
+        posts = {}
+        for chunk in _chunks(list(post_ids)):
+            placeholders = ", ".join("?" * len(chunk))
+            cursor.execute(
+                f"SELECT {_select(_POST_COLUMNS)} FROM raw_posts WHERE id IN ({placeholders})",
+                chunk,
             )
+            for row in cursor:
+                posts[row["id"]] = self._row_to_post(row)
         return posts
 
-    def save_lead(self, lead: Lead) -> None:
+    def _stream(
+        self, sql: str, params: tuple, hydrate: Any, chunk_size: int
+    ) -> Iterator[Any]:
+        """Hydrate the rows of ``sql`` ``chunk_size`` at a time from one cursor.
+
+        SQLite steps the query as rows are fetched, so only one chunk is in
+        memory at a time. The cursor reads one snapshot of the database
+        until the iterator is exhausted or closed.
+        """
+        cursor = self._get_connection().cursor()
+        try:
+            cursor.execute(sql, params)
+            while True:
+                rows = cursor.fetchmany(chunk_size)
+                if not rows:
+                    return
+                for row in rows:
+                    yield hydrate(row)
+        finally:
+            cursor.close()
+
+    def iter_posts(
+        self,
+        source: Optional[str] = None,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None,
+        analyzed_only: bool = False,
+        chunk_size: int = 500,
+    ) -> Iterator[ScrapedPost]:
+        where, params = _where("created_at", source, since, until, table="p")
+        join = _ANALYZED_JOIN if analyzed_only else ""
+        return self._stream(
+            _POSTS_SQL.format(join=join, where=where),
+            tuple(params),
+            self._row_to_post,
+            chunk_size,
+        )
+
+    def count_posts(
+        self,
+        source: Optional[str] = None,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None,
+        analyzed_only: bool = False,
+    ) -> int:
+        where, params = _where("created_at", source, since, until, table="p")
+        join = "JOIN signals s ON s.post_id = p.id" if analyzed_only else ""
+        return self._get_connection().execute(
+            f"SELECT COUNT(*) FROM raw_posts p {join} {where}", params
+        ).fetchone()[0]
+
+    def search_posts(
+        self,
+        query: str,
+        source: Optional[str] = None,
+        since: Optional[str] = None,
+        limit: int = 50,
+        order: str = "rank",
+    ) -> List[Dict[str, Any]]:
+        """Full-text search over post titles, bodies and their analysis.
+
+        ``query`` uses FTS5 syntax: words, "quoted phrases", OR, NOT, prefix*.
+        ``since`` is an ISO date or datetime (naive values are taken as UTC);
+        only posts created at or after that instant match. Results are ordered
+        by BM25 relevance (``order="rank"``) or newest first
+        (``order="recent"``). Each result has the ``post``, its ``rank``
+        (higher is more relevant) and a highlighted ``snippet``. Raises
+        ValueError if the query is not valid FTS5 or ``since`` is not ISO.
+        """
+        conditions, params = _filters(
+            "created_at",
+            source,
+            datetime.fromisoformat(since) if since else None,
+            table="p",
+        )
+        conditions.insert(0, "search_index MATCH ?")
+        params.insert(0, query)
+        # FTS5's rank column is bm25() and lets the index return rows in order
+        order_sql = "p.created_at DESC" if order == "recent" else "search_index.rank"
         conn = self._get_connection()
-        cursor = conn.cursor()
+        try:
+            rows = conn.execute(
+                _SEARCH_SQL.format(where=" AND ".join(conditions), order=order_sql),
+                (*params, limit),
+            ).fetchall()
+        except sqlite3.OperationalError as e:
+            raise ValueError(f"Invalid search query '{query}': {e}") from e
+        return [
+            {
+                "post": self._row_to_post(row),
+                "rank": row["search_rank"],
+                "snippet": row["search_snippet"],
+            }
+            for row in rows
+        ]
 
-        if lead.id:
-            # Update existing lead
-            cursor.execute(
-                """
-                UPDATE leads SET 
-                    post_id = ?, source = ?, author = ?, content_snippet = ?, 
-                    intent_score = ?, sentiment_label = ?, sentiment_intensity = ?, 
-                    contact_url = ?, verified_profiles = ?, status = ?, created_at = ?
-                WHERE id = ?
+    def get_scored_post_ids(self, source: Optional[str] = None) -> List[str]:
+        """Ids of every analyzed post, in the order get_posts_with_signals pages."""
+        conn = self._get_connection()
+        cursor = conn.cursor()
+        source_filter = "WHERE p.source = ?" if source else ""
+        cursor.execute(
+            f"""
+            SELECT p.id FROM raw_posts p
+            JOIN signals s ON s.post_id = p.id
+            {source_filter}
+            ORDER BY p.id
             """,
-                (
-                    lead.post_id,
-                    lead.source,
-                    lead.author,
-                    lead.content_snippet,
-                    lead.intent_score,
-                    lead.sentiment_label,
-                    lead.sentiment_intensity,
-                    lead.contact_url,
-                    json.dumps(lead.verified_profiles),
-                    lead.status,
-                    lead.created_at.isoformat(),
-                    lead.id,
-                ),
-            )
-        else:
-            # Insert new lead
-            cursor.execute(
-                """
-                INSERT INTO leads (post_id, source, author, content_snippet, intent_score, sentiment_label, sentiment_intensity, contact_url, verified_profiles, status, created_at)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            (source,) if source else (),
+        )
+        return [row["id"] for row in cursor.fetchall()]
+
+    def get_posts_with_signals(
+        self,
+        limit: int = 500,
+        after_id: Optional[str] = None,
+        source: Optional[str] = None,
+    ) -> List[tuple[ScrapedPost, PainScore]]:
+        """One page of analyzed posts with their signals, ordered by post id.
+
+        Pass the last id of the previous page as ``after_id`` to walk the whole
+        table without OFFSET scans.
+        """
+        conn = self._get_connection()
+        cursor = conn.cursor()
+        conditions, params = [], []
+        if after_id is not None:
+            conditions.append("p.id > ?")
+            params.append(after_id)
+        if source:
+            conditions.append("p.source = ?")
+            params.append(source)
+        where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+        cursor.execute(
+            f"""
+            SELECT {_select(_POST_COLUMNS, "p")} FROM raw_posts p
+            JOIN signals s ON s.post_id = p.id
+            {where}
+            ORDER BY p.id
+            LIMIT ?
             """,
-                (
-                    lead.post_id,
-                    lead.source,
-                    lead.author,
-                    lead.content_snippet,
-                    lead.intent_score,
-                    lead.sentiment_label,
-                    lead.sentiment_intensity,
-                    lead.contact_url,
-                    json.dumps(lead.verified_profiles),
-                    lead.status,
-                    lead.created_at.isoformat(),
-                ),
-            )
-        conn.commit()
+            (*params, limit),
+        )
+        posts = [self._row_to_post(row) for row in cursor]
+        signals = self.get_signals([post.id for post in posts])
+        return [(post, signals[post.id]) for post in posts if post.id in signals]
+
+    def _lead_row(self, lead: Lead) -> tuple:
+        return (
+            lead.post_id,
+            lead.source,
+            lead.author,
+            lead.content_snippet,
+            lead.intent_score,
+            lead.sentiment_label,
+            lead.sentiment_intensity,
+            lead.contact_url,
+            json.dumps(lead.verified_profiles),
+            lead.status,
+            lead.created_at.isoformat(),
+        )
+
+    def save_lead(self, lead: Lead) -> None:
+        self.save_leads([lead])
+
+    @_writes
+    def save_leads(self, leads: List[Lead]) -> None:
+        """Insert new leads and update existing ones (those with an id) in one transaction."""
+        if not leads:
+            return
+        conn = self._get_connection()
+        cursor = conn.cursor()
+
+        # Update existing leads
+        cursor.executemany(
+            """
+            UPDATE leads SET 
+                post_id = ?, source = ?, author = ?, content_snippet = ?, 
+                intent_score = ?, sentiment_label = ?, sentiment_intensity = ?, 
+                contact_url = ?, verified_profiles = ?, status = ?, created_at = ?
+            WHERE id = ?
+        """,
+            [self._lead_row(lead) + (lead.id,) for lead in leads if lead.id],
+        )
+        # Insert new leads
+        cursor.executemany(
+            """
+            INSERT INTO leads (post_id, source, author, content_snippet, intent_score, sentiment_label, sentiment_intensity, contact_url, verified_profiles, status, created_at)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+        """,
+            [self._lead_row(lead) for lead in leads if not lead.id],
+        )
+
+    def _row_to_lead(self, row: sqlite3.Row) -> Lead:
+        lead = dict(zip(_LEAD_COLUMNS, row))
+        lead["source"] = lead["source"] or "reddit"
+        lead["sentiment_label"] = lead["sentiment_label"] or None
+        lead["sentiment_intensity"] = lead["sentiment_intensity"] or 0.0
+        lead["verified_profiles"] = _loads(lead["verified_profiles"], dict)
+        lead["created_at"] = datetime.fromisoformat(lead["created_at"])
+        return _trusted(Lead, lead)
 
     def get_leads(self, limit: Optional[int] = 100) -> List[Lead]:
         conn = self._get_connection()
         cursor = conn.cursor()
         limit_sql = f"LIMIT {limit}" if limit is not None else ""
-        cursor.execute(f"SELECT * FROM leads ORDER BY created_at DESC {limit_sql}")
-        rows = cursor.fetchall()
+        cursor.execute(f"{_LEADS_SQL.format(where='')} {limit_sql}")
+        return [self._row_to_lead(row) for row in cursor]
 
-        leads = []
-        for row in rows:
-            leads.append(
-                Lead(
-                    id=row["id"],
-                    post_id=row["post_id"],
-                    source=row["source"] if row["source"] else "reddit",
-                    author=row["author"],
-                    content_snippet=row["content_snippet"],
-                    intent_score=row["intent_score"],
-                    sentiment_label=row["sentiment_label"]
-                    if row["sentiment_label"]
-                    else None,
-                    sentiment_intensity=row["sentiment_intensity"]
-                    if row["sentiment_intensity"]
-                    else 0.0,
-                    contact_url=row["contact_url"],
-                    verified_profiles=json.loads(row["verified_profiles"])
-                    if "verified_profiles" in row.keys() and row["verified_profiles"]
-                    else {},
-                    status=row["status"],
-                    created_at=datetime.fromisoformat(row["created_at"]),
-                )
-            )
-        return leads
+    def iter_leads(
+        self,
+        source: Optional[str] = None,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None,
+        chunk_size: int = 500,
+    ) -> Iterator[Lead]:
+        where, params = _where("created_at", source, since, until)
+        return self._stream(
+            _LEADS_SQL.format(where=where),
+            tuple(params),
+            self._row_to_lead,
+            chunk_size,
+        )
 
+    @_writes
     def save_report(self, report: ValidationReport) -> None:
         conn = self._get_connection()
         cursor = conn.cursor()
@@ -454,76 +1789,79 @@ class SQLiteProvider(StorageProvider):
                 report.generated_at.isoformat(),
             ),
         )
-        conn.commit()
+
+    def _row_to_report(self, row: sqlite3.Row) -> ValidationReport:
+        report = dict(zip(_REPORT_COLUMNS, row))
+        report["source"] = report["source"] or "reddit"
+        report["competitors"] = _loads(report["competitors"], list)
+        report["swot_analysis"] = _loads(report["swot_analysis"], dict)
+        report["next_steps"] = _loads(report["next_steps"], list)
+        report["corroborating_sources"] = _loads(report["corroborating_sources"], list)
+        report["corroborating_post_ids"] = _loads(report["corroborating_post_ids"], list)
+        report["generated_at"] = datetime.fromisoformat(report["generated_at"])
+        return _trusted(ValidationReport, report)
 
     def get_reports(self, limit: Optional[int] = None) -> List[ValidationReport]:
         conn = self._get_connection()
         cursor = conn.cursor()
         limit_sql = f"LIMIT {limit}" if limit is not None else ""
-        cursor.execute(
-            f"SELECT * FROM validation_reports ORDER BY generated_at DESC {limit_sql}"
-        )
-        rows = cursor.fetchall()
+        cursor.execute(f"{_REPORTS_SQL.format(where='')} {limit_sql}")
+        return [self._row_to_report(row) for row in cursor]
 
-        reports = []
-        for row in rows:
-            reports.append(
-                ValidationReport(
-                    post_id=row["post_id"],
-                    source=row["source"] if row["source"] else "reddit",
-                    idea_summary=row["idea_summary"],
-                    market_size_estimate=row["market_size_estimate"],
-                    competitors=json.loads(row["competitors"]),
-                    swot_analysis=json.loads(row["swot_analysis"]),
-                    validation_verdict=row["validation_verdict"],
-                    next_steps=json.loads(row["next_steps"]),
-                    corroborating_sources=json.loads(
-                        row["corroborating_sources"]
-                        if row["corroborating_sources"]
-                        else "[]"
-                    ),
-                    corroborating_post_ids=json.loads(
-                        row["corroborating_post_ids"]
-                        if row["corroborating_post_ids"]
-                        else "[]"
-                    ),
-                    generated_at=datetime.fromisoformat(row["generated_at"]),
-                )
-            )
-        return reports
+    def iter_reports(
+        self,
+        source: Optional[str] = None,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None,
+        chunk_size: int = 500,
+    ) -> Iterator[ValidationReport]:
+        where, params = _where("generated_at", source, since, until)
+        return self._stream(
+            _REPORTS_SQL.format(where=where),
+            tuple(params),
+            self._row_to_report,
+            chunk_size,
+        )
 
     def get_post_by_id(self, post_id: str) -> Optional[ScrapedPost]:
         conn = self._get_connection()
         cursor = conn.cursor()
-        cursor.execute("SELECT * FROM raw_posts WHERE id = ?", (post_id,))
+        cursor.execute(_POST_BY_ID_SQL, (post_id,))
         row = cursor.fetchone()
 
         if not row:
             return None
 
-        return ScrapedPost(
-            id=row["id"],
-            source=row["source"],
-            title=row["title"],
-            body=row["body"],
-            author=row["author"],
-            url=row["url"],
-            upvotes=row["upvotes"],
-            comments_count=row["comments_count"],
-            created_at=datetime.fromisoformat(row["created_at"]),
-            subreddit=row["subreddit"],
-            channel=row["channel"] if row["channel"] else None,
-            sentiment_label=row["sentiment_label"] if row["sentiment_label"] else None,
-            sentiment_intensity=row["sentiment_intensity"]
-            if row["sentiment_intensity"]
-            else 0.0,
-            metadata=json.loads(row["metadata"]) if row["metadata"] else {},
+        return self._row_to_post(row)
+
+    def _score_row(self, score: OpportunityScore) -> tuple:
+        return (
+            score.post_id,
+            score.source,
+            score.final_score,
+            score.pain_intensity,
+            score.engagement_norm,
+            score.validation_evidence,
+            score.sentiment_intensity,
+            score.recency,
+            score.trend_momentum,
+            score.market_signal,
+            score.cross_source_bonus,
+            json.dumps(score.dimensions),
+            json.dumps(score.weights),
+            score.computed_at.isoformat(),
         )
 
     def save_opportunity_score(self, score: OpportunityScore) -> None:
+        self.save_opportunity_scores([score])
+
+    @_writes
+    def save_opportunity_scores(self, scores: List[OpportunityScore]) -> None:
+        """Save many opportunity scores in one transaction."""
+        if not scores:
+            return
         conn = self._get_connection()
-        cursor = conn.cursor()
-        cursor.execute(
+        conn.executemany(
             """
             INSERT OR REPLACE INTO opportunity_scores 
             (post_id, source, final_score, pain_intensity, engagement_norm, validation_evidence, 
@@ -531,64 +1869,251 @@ class SQLiteProvider(StorageProvider):
              dimensions, weights, computed_at)
             VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
         """,
-            (
-                score.post_id,
-                score.source,
-                score.final_score,
-                score.pain_intensity,
-                score.engagement_norm,
-                score.validation_evidence,
-                score.sentiment_intensity,
-                score.recency,
-                score.trend_momentum,
-                score.market_signal,
-                score.cross_source_bonus,
-                json.dumps(score.dimensions),
-                json.dumps(score.weights),
-                score.computed_at.isoformat(),
-            ),
+            [self._score_row(score) for score in scores],
         )
-        conn.commit()
 
     def get_opportunity_scores(
-        self, limit: int = 100, min_score: float = 0.0
+        self, limit: int = 100, min_score: float = 0.0, source: Optional[str] = None
+    ) -> List[OpportunityScore]:
+        conn = self._get_connection()
+        cursor = conn.cursor()
+        where = "WHERE final_score >= ? AND source = ?" if source else "WHERE final_score >= ?"
+        params = [min_score] + ([source] if source else []) + [limit]
+        cursor.execute(_SCORES_SQL.format(where=where) + " LIMIT ?", tuple(params))
+        return [self._row_to_score(row) for row in cursor]
+
+    def iter_scores(
+        self,
+        source: Optional[str] = None,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None,
+        chunk_size: int = 500,
+    ) -> Iterator[OpportunityScore]:
+        where, params = _where("computed_at", source, since, until)
+        return self._stream(
+            _SCORES_SQL.format(where=where),
+            tuple(params),
+            self._row_to_score,
+            chunk_size,
+        )
+
+    def get_reweighted_scores(
+        self,
+        weights: Dict[str, float],
+        limit: int = 100,
+        min_score: float = 0.0,
+        source: Optional[str] = None,
     ) -> List[OpportunityScore]:
+        """Top stored scores re-ranked under ``weights``, best first.
+
+        The final score is recomputed in SQL from the saved dimension columns
+        plus the cross-source bonus, so nothing is rescored. Returned scores
+        carry the new final score and weights.
+        """
+        expression = " + ".join(
+            f"? * COALESCE({name}, 0.0)" for name in _SCORE_DIMENSIONS
+        )
         conn = self._get_connection()
         cursor = conn.cursor()
+        source_filter = "WHERE source = ?" if source else ""
+        params = [float(weights.get(name, 0.0)) for name in _SCORE_DIMENSIONS]
+        params += [source] if source else []
+        params += [min_score, limit]
         cursor.execute(
+            f"""
+            SELECT * FROM (
+                SELECT {_select(_SCORE_COLUMNS)},
+                       MAX(0.0, MIN(1.0, {expression} + COALESCE(cross_source_bonus, 0.0)))
+                           AS reweighted_score
+                FROM opportunity_scores
+                {source_filter}
+            )
+            WHERE reweighted_score >= ?
+            ORDER BY reweighted_score DESC
+            LIMIT ?
+            """,
+            tuple(params),
+        )
+        scores = []
+        for row in cursor.fetchall():
+            score = self._row_to_score(row)
+            score.final_score = row["reweighted_score"]
+            score.weights = dict(weights)
+            scores.append(score)
+        return scores
+
+    def get_scored_view(
+        self, limit: int = 100, min_score: float = 0.0, source: Optional[str] = None
+    ) -> List[tuple[OpportunityScore, ScrapedPost, Optional[PainScore]]]:
+        """Top scores joined with their posts and signals in one query."""
+        # Score, post and signal columns come back side by side and are split
+        # by position
+        post_start = len(_SCORE_COLUMNS)
+        signal_start = post_start + len(_POST_COLUMNS)
+        signal_end = signal_start + len(_SIGNAL_COLUMNS)
+        conn = self._get_connection()
+        cursor = conn.cursor()
+        source_filter = "AND os.source = ?" if source else ""
+        params = [min_score] + ([source] if source else []) + [limit]
+        cursor.execute(_SCORED_VIEW_SQL.format(source_filter=source_filter), tuple(params))
+        return [
+            (
+                self._row_to_score(row),
+                self._row_to_post(row[post_start:signal_start]),
+                self._row_to_signal(row[signal_start:signal_end])
+                if row["signal_post_id"] is not None
+                else None,
+            )
+            for row in cursor
+        ]
+
+    def _row_to_score(self, row: sqlite3.Row) -> OpportunityScore:
+        score = dict(zip(_SCORE_COLUMNS, row))
+        score["dimensions"] = _loads(score["dimensions"], dict)
+        score["weights"] = _loads(score["weights"], dict)
+        score["computed_at"] = datetime.fromisoformat(score["computed_at"])
+        return _trusted(OpportunityScore, score)
+
+    # --- Discovery runs ---
+    @_writes
+    def create_run(
+        self,
+        run_id: str,
+        targets: List[str] | Dict[str, List[str]],
+        min_score: float = 0.0,
+        limit_per_target: Optional[int] = None,
+    ) -> None:
+        conn = self._get_connection()
+        now = datetime.now().isoformat()
+        conn.execute(
+            """
+            INSERT INTO discovery_runs
+            (run_id, targets, min_score, limit_per_target, status, created_at, updated_at)
+            VALUES (?, ?, ?, ?, 'running', ?, ?)
+        """,
+            (run_id, json.dumps(targets), min_score, limit_per_target, now, now),
+        )
+
+    def _row_to_run(self, row: sqlite3.Row) -> Dict[str, Any]:
+        run = dict(row)
+        run["targets"] = json.loads(row["targets"])
+        return run
+
+    def get_run(self, run_id: str) -> Optional[Dict[str, Any]]:
+        conn = self._get_connection()
+        row = conn.execute(
+            "SELECT * FROM discovery_runs WHERE run_id = ?", (run_id,)
+        ).fetchone()
+        return self._row_to_run(row) if row else None
+
+    def list_runs(self, limit: int = 20) -> List[Dict[str, Any]]:
+        """Most recent runs, with how many of their posts reached each stage."""
+        conn = self._get_connection()
+        rows = conn.execute(
             """
-            SELECT * FROM opportunity_scores 
-            WHERE final_score >= ? 
-            ORDER BY final_score DESC 
+            SELECT r.*,
+                   COUNT(p.post_id) AS posts,
+                   SUM(CASE WHEN p.status != 'scraped' THEN 1 ELSE 0 END) AS analyzed
+            FROM discovery_runs r
+            LEFT JOIN discovery_run_posts p ON p.run_id = r.run_id
+            GROUP BY r.run_id
+            ORDER BY r.created_at DESC
             LIMIT ?
         """,
-            (min_score, limit),
+            (limit,),
+        ).fetchall()
+        return [self._row_to_run(row) for row in rows]
+
+    @_writes
+    def set_run_status(self, run_id: str, status: str) -> None:
+        conn = self._get_connection()
+        conn.execute(
+            "UPDATE discovery_runs SET status = ?, updated_at = ? WHERE run_id = ?",
+            (status, datetime.now().isoformat(), run_id),
         )
-        rows = cursor.fetchall()
 
-        scores = []
-        for row in rows:
-            scores.append(
-                OpportunityScore(
-                    post_id=row["post_id"],
-                    source=row["source"],
-                    final_score=row["final_score"],
-                    pain_intensity=row["pain_intensity"],
-                    engagement_norm=row["engagement_norm"],
-                    validation_evidence=row["validation_evidence"],
-                    sentiment_intensity=row["sentiment_intensity"],
-                    recency=row["recency"],
-                    trend_momentum=row["trend_momentum"],
-                    market_signal=row["market_signal"],
-                    cross_source_bonus=row["cross_source_bonus"],
-                    dimensions=json.loads(row["dimensions"]),
-                    weights=json.loads(row["weights"]),
-                    computed_at=datetime.fromisoformat(row["computed_at"]),
-                )
+    @_writes
+    def mark_run_target_scraped(self, run_id: str, scraper: str, target: str) -> None:
+        conn = self._get_connection()
+        conn.execute(
+            "INSERT OR IGNORE INTO discovery_run_targets (run_id, scraper, target) VALUES (?, ?, ?)",
+            (run_id, scraper, target),
+        )
+
+    def get_run_targets(self, run_id: str) -> List[tuple[str, str]]:
+        """(scraper, target) pairs whose scrape finished during the run."""
+        conn = self._get_connection()
+        rows = conn.execute(
+            "SELECT scraper, target FROM discovery_run_targets WHERE run_id = ?",
+            (run_id,),
+        ).fetchall()
+        return [(row["scraper"], row["target"]) for row in rows]
+
+    @_writes
+    def save_run_posts(self, run_id: str, posts: List[ScrapedPost]) -> None:
+        """Checkpoint freshly scraped posts; posts already in the run are left alone."""
+        conn = self._get_connection()
+        now = datetime.now().isoformat()
+        conn.executemany(
+            """
+            INSERT OR IGNORE INTO discovery_run_posts (run_id, post_id, post, status, updated_at)
+            VALUES (?, ?, ?, 'scraped', ?)
+        """,
+            [(run_id, post.id, post.model_dump_json(), now) for post in posts],
+        )
+
+    @_writes
+    def update_run_posts(
+        self, run_id: str, updates: List[tuple[str, str, Optional[PainScore]]]
+    ) -> None:
+        """Record the stage reached by each (post_id, status, pain) in ``updates``."""
+        conn = self._get_connection()
+        now = datetime.now().isoformat()
+        conn.executemany(
+            """
+            UPDATE discovery_run_posts
+            SET status = ?, pain = COALESCE(?, pain), updated_at = ?
+            WHERE run_id = ? AND post_id = ?
+        """,
+            [
+                (status, pain.model_dump_json() if pain else None, now, run_id, post_id)
+                for post_id, status, pain in updates
+            ],
+        )
+
+    def get_run_posts(
+        self, run_id: str
+    ) -> List[tuple[ScrapedPost, str, Optional[PainScore]]]:
+        conn = self._get_connection()
+        rows = conn.execute(
+            "SELECT post, status, pain FROM discovery_run_posts WHERE run_id = ?",
+            (run_id,),
+        ).fetchall()
+        return [
+            (
+                ScrapedPost.model_validate_json(row["post"]),
+                row["status"],
+                PainScore.model_validate_json(row["pain"]) if row["pain"] else None,
             )
-        return scores
+            for row in rows
+        ]
+
+    # Ordered schema migrations; append new steps, never reorder or edit
+    # released ones. PRAGMA user_version records how many have run.
+    _MIGRATIONS = (
+        ("core tables", _migrate_core_tables),
+        ("near-duplicate index", _migrate_near_duplicate_index),
+        ("term index and rollups", _migrate_term_index),
+        ("discovery runs", _migrate_discovery_runs),
+        ("secondary indexes", _migrate_secondary_indexes),
+        ("full-text search index", _migrate_search_index),
+        ("failed analyses", _migrate_failed_signals),
+    )
 
     def close(self):
-        if self._conn:
-            self._conn.close()
-            self._conn = None
+        with self._connections_lock:
+            connections, self._connections = self._connections, []
+        for conn in connections:
+            conn.close()
+        self._writer = None
+        self._readers = threading.local()
@@ -33,7 +33,7 @@ def test_discover_with_target_g2(mock_registry):
     """Test discover command with --source and --target flags."""
     with patch("copilot.cli.main.DiscoveryModule") as mock_mod:
         instance = mock_mod.return_value
-        instance.discover.return_value = []
+        instance.discover_stream.return_value = iter([])
 
         # We need to catch the console.status output which often isn't in stdout in tests
         # or just check that it called discover correctly
@@ -42,9 +42,20 @@ def test_discover_with_target_g2(mock_registry):
         assert result.exit_code == 0
 
         # Verify it was called with targets dict
-        mock_mod.return_value.discover.assert_called_once_with(
-            {"g2": ["slack"]}, min_score=0.0
-        )
+        mock_mod.return_value.discover_stream.assert_called_once()
+        args, kwargs = mock_mod.return_value.discover_stream.call_args
+        assert args == ({"g2": ["slack"]},)
+        assert kwargs["min_score"] == 0.0
+        assert kwargs["run_id"]
+
+
+def test_discover_resume_unknown_run(mock_registry):
+    mock_registry.get_storage.return_value.get_run.return_value = None
+
+    result = runner.invoke(app, ["discover", "--resume", "nope"])
+
+    assert result.exit_code == 1
+    assert "No discovery run 'nope' found" in result.stdout
 
 
 def test_rank_command(mock_registry):
@@ -61,8 +72,7 @@ def test_rank_command(mock_registry):
         created_at=datetime.now(timezone.utc),
     )
     storage.get_posts.return_value = [post]
-    storage.get_post_by_id.return_value = post  # Fix: mock get_post_by_id
-    storage.get_signal.return_value = PainScore(score=0.5, reasoning="test")
+    storage.get_signals.return_value = {"test_id": PainScore(score=0.5, reasoning="test")}
 
     with patch("copilot.cli.main.ScoringModule") as mock_scoring:
         scoring_instance = mock_scoring.return_value
@@ -75,6 +85,78 @@ def test_rank_command(mock_registry):
         assert result.exit_code == 0
         # assert "Re-ranking posts" in result.stdout  # Inside status spinner, not captured
         assert "Top 20 Re-Ranked" in result.stdout
+        # One batched signal read, and the rows render from the loaded posts
+        storage.get_signals.assert_called_once_with(["test_id"])
+        storage.get_post_by_id.assert_not_called()
+
+
+def test_rank_persist_rescores_db_and_reads_top_n(mock_registry):
+    storage = mock_registry.get_storage.return_value
+    post = ScrapedPost(
+        id="test_id",
+        source="reddit",
+        title="Stored winner",
+        author="user",
+        url="url",
+        upvotes=1,
+        comments_count=1,
+        created_at=datetime.now(timezone.utc),
+    )
+    storage.get_scored_view.return_value = [
+        (OpportunityScore(post_id="test_id", source="reddit", final_score=0.9), post, None)
+    ]
+
+    with patch("copilot.cli.main.ScoringModule") as mock_scoring:
+        scoring_instance = mock_scoring.return_value
+        scoring_instance.rescore_all.return_value = 42
+
+        result = runner.invoke(
+            app,
+            ["rank", "--persist", "--chunk-size", "100", "--workers", "4", "--top", "5"],
+        )
+
+        assert result.exit_code == 0
+        assert scoring_instance.rescore_all.call_args.kwargs["chunk_size"] == 100
+        assert scoring_instance.rescore_all.call_args.kwargs["workers"] == 4
+        scoring_instance.compute_scores_for_posts.assert_not_called()
+        storage.get_scored_view.assert_called_once_with(limit=5, source=None)
+        storage.get_post_by_id.assert_not_called()
+        assert "Saved 42 opportunity scores" in result.stdout
+        assert "Stored winner" in result.stdout
+
+
+def test_rank_reweights_stored_scores(mock_registry):
+    storage = mock_registry.get_storage.return_value
+    storage.get_posts_by_ids.return_value = {
+        "test_id": ScrapedPost(
+            id="test_id",
+            source="reddit",
+            title="Traction winner",
+            author="user",
+            url="url",
+            upvotes=1,
+            comments_count=1,
+            created_at=datetime.now(timezone.utc),
+        )
+    }
+
+    with patch("copilot.cli.main.ScoringModule") as mock_scoring:
+        scoring_instance = mock_scoring.return_value
+        scoring_instance.get_top_opportunities.return_value = [
+            OpportunityScore(post_id="test_id", source="reddit", final_score=0.6)
+        ]
+
+        result = runner.invoke(app, ["rank", "--weights", "traction"])
+
+        assert result.exit_code == 0
+        assert "traction weights" in result.stdout
+        assert "Traction winner" in result.stdout
+        kwargs = scoring_instance.get_top_opportunities.call_args.kwargs
+        assert kwargs["weights"]["engagement_norm"] == 0.35
+        scoring_instance.compute_scores_for_posts.assert_not_called()
+
+        result = runner.invoke(app, ["rank", "--weights", "no-such-profile"])
+        assert result.exit_code == 1
 
 
 def test_sentiment_command(mock_registry):
@@ -91,19 +173,85 @@ def test_sentiment_command(mock_registry):
         created_at=datetime.now(timezone.utc),
     )
     storage.get_posts.return_value = [post]
-    storage.get_signal.return_value = None  # Force analysis
+    storage.get_signals.return_value = {}  # Force analysis
 
     with patch("copilot.cli.main.get_discovery_module") as mock_get_discovery:
         discovery_instance = mock_get_discovery.return_value
-        discovery_instance.analyze_pain_intensity.return_value = PainScore(
-            score=0.5,
-            reasoning="test",
-            sentiment_label="neutral",
-            sentiment_intensity=0.2,
-        )
+        discovery_instance.analyze_posts.return_value = [
+            PainScore(
+                score=0.5,
+                reasoning="test",
+                sentiment_label="neutral",
+                sentiment_intensity=0.2,
+            )
+        ]
 
         result = runner.invoke(app, ["sentiment", "--limit", "1"])
 
         assert result.exit_code == 0
         # assert "Analyzing sentiment" in result.stdout # Inside status spinner
         assert "Successfully analyzed and updated 1 posts" in result.stdout
+
+
+def test_trends_command(mock_registry):
+    storage = mock_registry.get_storage.return_value
+    storage.rebuild_term_rollups.return_value = 12
+    storage.get_rising_terms.return_value = [
+        {"term": "invoice", "source": "reddit", "recent": 4, "previous": 1, "growth": 2.5}
+    ]
+
+    result = runner.invoke(app, ["trends", "--backfill", "--source", "reddit"])
+
+    assert result.exit_code == 0
+    assert "Rebuilt 12 daily term counts" in result.stdout
+    assert "invoice" in result.stdout
+    storage.get_rising_terms.assert_called_once_with(
+        days=30, source="reddit", limit=10, min_count=3
+    )
+
+
+def test_search_command(mock_registry):
+    storage = mock_registry.get_storage.return_value
+    post = ScrapedPost(
+        id="s1",
+        source="reddit",
+        title="Invoice reminders",
+        author="user",
+        url="url",
+        upvotes=1,
+        comments_count=1,
+        created_at=datetime(2025, 3, 1, tzinfo=timezone.utc),
+    )
+    storage.search_posts.return_value = [
+        {"post": post, "rank": 1.5, "snippet": "[Invoice] reminders"}
+    ]
+
+    result = runner.invoke(
+        app, ["search", "invoice", "--source", "reddit", "--since", "2025-01-01"]
+    )
+
+    assert result.exit_code == 0
+    assert "[Invoice] reminders" in result.stdout
+    storage.search_posts.assert_called_once_with(
+        "invoice", source="reddit", since="2025-01-01T00:00:00", limit=20, order="rank"
+    )
+
+    storage.search_posts.side_effect = ValueError("Invalid search query")
+    result = runner.invoke(app, ["search", '"oops'])
+    assert result.exit_code == 1
+
+
+def test_db_explain_command(mock_registry):
+    storage = mock_registry.get_storage.return_value
+    storage.explain_queries.return_value = [
+        {"name": "get_posts", "plan": ["SCAN raw_posts USING INDEX idx"], "full_scan": False},
+        {"name": "get_leads", "plan": ["SCAN leads"], "full_scan": True},
+    ]
+
+    result = runner.invoke(app, ["db", "explain"])
+    assert result.exit_code == 0
+    assert "get_posts" in result.stdout
+    assert "1 queries scan or sort a table: get_leads" in result.stdout
+
+    result = runner.invoke(app, ["db", "explain", "--strict"])
+    assert result.exit_code == 1
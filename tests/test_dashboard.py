@@ -0,0 +1,108 @@
+import json
+
+import pytest
+
+pytest.importorskip("fastapi")
+
+from fastapi import HTTPException
+
+from copilot.dashboard import api
+
+
+def test_score_expression_rejects_file_paths(tmp_path):
+    config = tmp_path / "config.json"
+    config.write_text(json.dumps({"groq_api_key": "secret"}))
+
+    with pytest.raises(HTTPException) as excinfo:
+        api.score_expression(str(config))
+
+    assert excinfo.value.status_code == 400
+    assert "groq_api_key" not in excinfo.value.detail
+
+
+def test_score_expression_accepts_configured_profiles(monkeypatch):
+    monkeypatch.setitem(
+        api.config_manager._config, "weight_profiles", {"mine": {"recency": 1.0}}
+    )
+
+    sql, params = api.score_expression("mine")
+    assert "os.recency" in sql
+    assert params[list(api.WEIGHTS).index("recency")] == 1.0
+    assert api.score_expression('{"pain_intensity": 1}')[1][0] == 1.0
+    assert api.score_expression(None) == ("os.final_score", [])
+
+
+@pytest.fixture
+def dashboard_db(tmp_path, monkeypatch):
+    from copilot.providers.storage.sqlite_provider import SQLiteProvider
+
+    db_path = str(tmp_path / "dashboard.db")
+    storage = SQLiteProvider(db_path=db_path)
+    storage.initialize()
+    monkeypatch.setattr(api, "DB_PATH", db_path)
+    monkeypatch.setattr(api, "_storage", None)
+    yield storage
+    if api._storage is not None:
+        api._storage.close()
+    storage.close()
+
+
+def test_search_uses_the_storage_query(dashboard_db):
+    import asyncio
+    from datetime import datetime, timezone
+
+    from copilot.models.schemas import ScrapedPost
+
+    dashboard_db.save_post(
+        ScrapedPost(
+            id="s1",
+            source="reddit",
+            title="Invoice reminders are painful",
+            author="a",
+            url="u",
+            upvotes=1,
+            comments_count=0,
+            created_at=datetime.now(timezone.utc),
+            subreddit="saas",
+        )
+    )
+
+    [hit] = asyncio.run(api.search("invoice"))
+    assert (hit["id"], hit["display_channel"]) == ("s1", "r/saas")
+    assert "[Invoice]" in hit["snippet"]
+
+    with pytest.raises(HTTPException) as excinfo:
+        asyncio.run(api.search('"unbalanced'))
+    assert excinfo.value.status_code == 400
+
+
+def test_trends_use_the_storage_rollup(dashboard_db):
+    import asyncio
+    from datetime import datetime, timedelta, timezone
+
+    from copilot.models.schemas import ScrapedPost
+
+    def post(post_id, days_old, title):
+        return ScrapedPost(
+            id=post_id,
+            source="reddit",
+            title=title,
+            author="a",
+            url="u",
+            upvotes=1,
+            comments_count=0,
+            created_at=datetime.now(timezone.utc) - timedelta(days=days_old),
+        )
+
+    for i in range(3):
+        dashboard_db.save_post(post(f"new{i}", 1, "Invoice reminders"))
+    dashboard_db.save_post(post("old0", 40, "Invoice exports"))
+
+    trends = asyncio.run(api.get_trends(days=30, min_count=2))
+    expected = dashboard_db.get_rising_terms(days=30, min_count=2)
+    assert trends["reddit"] == [
+        {k: r[k] for k in ("term", "recent", "previous", "growth")} for r in expected
+    ]
+    assert {"term": "invoice", "recent": 3, "previous": 1}.items() <= next(
+        t for t in trends["reddit"] if t["term"] == "invoice"
+    ).items()
@@ -51,9 +51,9 @@ def test_discover_with_storage(discovery_module, mock_scraper, mock_llm, mock_st
     results = discovery_module.discover(["test-sub"])
 
     assert len(results) == 1
-    mock_storage.save_post.assert_called_once_with(post1)
-    mock_storage.save_signal.assert_called_once()
-    assert mock_storage.save_signal.call_args[0][0] == "1"
+    mock_storage.save_posts.assert_called_once_with([post1])
+    mock_storage.save_signals.assert_called_once()
+    assert list(mock_storage.save_signals.call_args[0][0]) == ["1"]
 
 
 def test_fetch_potential_pains(discovery_module, mock_scraper):
@@ -196,3 +196,314 @@ def test_analyze_pain_intensity_error(discovery_module, mock_llm):
         assert len(results) == 1
         # Use pytest.approx for float comparison
         assert results[0][1].composite_value == pytest.approx(0.82)
+
+
+def _timed_scraper(name, delay, posts=None, error=None):
+    import time
+
+    scraper = MagicMock()
+    scraper.name = name
+
+    def scrape(target, limit=100, **kwargs):
+        time.sleep(delay)
+        if error:
+            raise error
+        return posts or []
+
+    scraper.scrape.side_effect = scrape
+    return scraper
+
+
+def _post(post_id, source="reddit"):
+    return ScrapedPost(
+        id=post_id,
+        source=source,
+        title=f"Post {post_id}",
+        author="user1",
+        url="url",
+        upvotes=10,
+        comments_count=5,
+        created_at=datetime.now(),
+    )
+
+
+def test_fetch_potential_pains_runs_scrapers_concurrently(mock_llm):
+    import time
+
+    scrapers = [
+        _timed_scraper("reddit", 0.3, [_post("r1")]),
+        _timed_scraper("hackernews", 0.3, [_post("h1", "hackernews")]),
+        _timed_scraper("g2", 0.3, error=RuntimeError("boom")),
+    ]
+    module = DiscoveryModule(scraper=scrapers, llm=mock_llm)
+
+    start = time.monotonic()
+    posts = module.fetch_potential_pains(
+        {"reddit": ["saas"], "hackernews": ["ask"], "g2": ["slack"]}
+    )
+    elapsed = time.monotonic() - start
+
+    assert sorted(p.id for p in posts) == ["h1", "r1"]
+    assert elapsed < 0.8
+
+
+def test_fetch_potential_pains_deadline_abandons_slow_provider(mock_llm):
+    scrapers = [
+        _timed_scraper("reddit", 0.0, [_post("r1")]),
+        _timed_scraper("hackernews", 2.0, [_post("h1", "hackernews")]),
+    ]
+    module = DiscoveryModule(scraper=scrapers, llm=mock_llm)
+    module.scrape_deadline = 0.3
+
+    posts = module.fetch_potential_pains({"reddit": ["saas"], "hackernews": ["ask"]})
+
+    assert [p.id for p in posts] == ["r1"]
+
+
+def test_analyze_posts_batches_requests(mock_llm):
+    from copilot.providers.llm.mock import MockLLMProvider
+
+    posts = [_post(str(i)) for i in range(5)]
+    llm = MockLLMProvider()
+    module = DiscoveryModule(scraper=MagicMock(), llm=llm)
+    module.llm_batch_size = 2
+
+    calls = []
+    original = llm.complete_batch
+
+    def spy(items, instructions, **kwargs):
+        calls.append(list(items))
+        return original(items, instructions, **kwargs)
+
+    llm.complete_batch = spy
+    scores = module.analyze_posts(posts)
+
+    assert [score.score for score in scores] == [0.85] * 5
+    assert sorted(calls) == [["0", "1"], ["2", "3"]]  # the last post goes alone
+
+
+def test_analyze_pain_batch_falls_back_to_single_calls(mock_llm):
+    posts = [_post("1"), _post("2")]
+    module = DiscoveryModule(scraper=MagicMock(), llm=mock_llm)
+    mock_llm.complete_batch.side_effect = ValueError("not JSON")
+    mock_llm.complete.return_value = json.dumps({"score": 0.4, "reasoning": "ok"})
+
+    scores = module.analyze_pain_batch(posts)
+
+    assert [score.score for score in scores] == [0.4, 0.4]
+    assert mock_llm.complete.call_count == 2
+
+
+def test_discover_reuses_signals_of_unchanged_posts(tmp_path, mock_llm):
+    from copilot.providers.storage.sqlite_provider import SQLiteProvider
+
+    storage = SQLiteProvider(db_path=str(tmp_path / "copilot.db"))
+    scraper = MagicMock()
+    module = DiscoveryModule(scraper=scraper, llm=mock_llm, storage=storage)
+    mock_llm.complete.return_value = json.dumps(
+        {"score": 0.9, "reasoning": "Good", "validation_score": 0.9}
+    )
+
+    scraper.scrape.return_value = [_post("1"), _post("2")]
+    module.discover(["saas"], min_score=0.0)
+    assert mock_llm.complete.call_count == 2
+    assert (module.last_run_stats.new, module.last_run_stats.reused) == (2, 0)
+
+    edited = _post("2").model_copy(update={"body": "Edited with more detail"})
+    scraper.scrape.return_value = [_post("1"), edited, _post("3")]
+    results = module.discover(["saas"], min_score=0.0)
+
+    stats = module.last_run_stats
+    assert (stats.scraped, stats.new, stats.changed, stats.reused) == (3, 1, 1, 1)
+    assert mock_llm.complete.call_count == 4
+    assert {post.id for post, _ in results} == {"1", "2", "3"}
+    storage.close()
+
+
+def test_discover_retries_posts_whose_analysis_failed(tmp_path, mock_llm):
+    from copilot.providers.storage.sqlite_provider import SQLiteProvider
+
+    storage = SQLiteProvider(db_path=str(tmp_path / "copilot.db"))
+    scraper = MagicMock()
+    scraper.scrape.return_value = [_post("1")]
+    module = DiscoveryModule(scraper=scraper, llm=mock_llm, storage=storage)
+
+    mock_llm.complete.side_effect = RuntimeError("boom")
+    module.discover(["saas"], min_score=0.0)
+    assert storage.get_signal("1").failed
+
+    mock_llm.complete.side_effect = None
+    mock_llm.complete.return_value = json.dumps({"score": 0.9, "reasoning": "Good"})
+    mock_llm.complete.reset_mock()
+    [(_, pain)] = module.discover(["saas"], min_score=0.0)
+
+    assert mock_llm.complete.call_count == 1
+    assert (module.last_run_stats.reused, module.last_run_stats.retried) == (0, 1)
+    assert (pain.score, pain.failed) == (0.9, False)
+    assert not storage.get_signal("1").failed
+    storage.close()
+
+
+def test_discover_stream_yields_before_slow_scrapers_finish(mock_llm):
+    import time
+
+    scrapers = [
+        _timed_scraper("reddit", 0.0, [_post("r1")]),
+        _timed_scraper("hackernews", 1.0, [_post("h1", "hackernews")]),
+    ]
+    module = DiscoveryModule(scraper=scrapers, llm=mock_llm)
+    mock_llm.complete.return_value = json.dumps({"score": 0.9, "reasoning": "Good"})
+
+    start = time.monotonic()
+    stream = module.discover_stream({"reddit": ["saas"], "hackernews": ["ask"]}, min_score=0.0)
+    post, pain = next(stream)
+    elapsed = time.monotonic() - start
+    stream.close()
+
+    assert post.id == "r1"
+    assert pain.composite_value > 0
+    assert elapsed < 0.5
+
+
+def test_discover_stream_small_queue_does_not_stall(mock_llm):
+    posts = [_post(str(i)) for i in range(20)]
+    module = DiscoveryModule(scraper=_timed_scraper("reddit", 0.0, posts), llm=mock_llm)
+    module.stream_queue_size = 3
+    module.llm_batch_size = 1
+    mock_llm.complete.return_value = json.dumps({"score": 0.9, "reasoning": "Good"})
+
+    results = list(module.discover_stream(["saas"], min_score=0.0))
+
+    assert sorted(int(post.id) for post, _ in results) == list(range(20))
+    assert module.last_run_stats.new == 20
+
+
+def test_discover_stream_deadline_keeps_scrapes_finished_under_backpressure(mock_llm):
+    import time
+
+    scraper = MagicMock()
+    scraper.name = "reddit"
+
+    def scrape(target, limit=100, **kwargs):
+        time.sleep(0.05)
+        return [_post(f"{target}{i}") for i in range(6)]
+
+    scraper.scrape.side_effect = scrape
+    module = DiscoveryModule(scraper=scraper, llm=mock_llm)
+    module.scraper_concurrency = 1
+    module.stream_queue_size = 2
+    module.llm_batch_size = 1
+    module.llm_concurrency = 1
+    module.scrape_deadline = 0.3
+
+    def slow_complete(*args, **kwargs):
+        time.sleep(0.1)
+        return json.dumps({"score": 0.9, "reasoning": "Good"})
+
+    mock_llm.complete.side_effect = slow_complete
+
+    # Scrapes finish one by one, long before the deadline, while the slow LLM
+    # holds the stream up well past it
+    results = list(module.discover_stream(["a", "b", "c"], min_score=0.0))
+
+    assert len(results) == 18
+
+
+def test_discover_reuses_pain_score_of_near_duplicates(tmp_path, mock_llm):
+    from copilot.providers.storage.sqlite_provider import SQLiteProvider
+
+    body = (
+        "We are a five person agency and keep losing track of unpaid invoices. "
+        "Is there a simple tool that sends reminders automatically?"
+    )
+    original = _post("r1").model_copy(update={"title": "Chasing unpaid invoices", "body": body})
+    crosspost = original.model_copy(update={"id": "r2", "subreddit": "startups"})
+    mirror = original.model_copy(update={"id": "h1", "source": "hackernews", "body": body + " Thanks!"})
+
+    storage = SQLiteProvider(db_path=str(tmp_path / "copilot.db"))
+    scraper = MagicMock()
+    module = DiscoveryModule(scraper=scraper, llm=mock_llm, storage=storage)
+    mock_llm.complete.return_value = json.dumps({"score": 0.9, "reasoning": "Good"})
+
+    # Same run: the crosspost waits for the original's analysis
+    scraper.scrape.return_value = [original, crosspost]
+    results = module.discover(["saas"], min_score=0.0)
+    assert mock_llm.complete.call_count == 1
+    assert {post.id for post, _ in results} == {"r1", "r2"}
+    assert module.last_run_stats.duplicates == 1
+
+    # Later run: the mirror matches the stored canonical post
+    scraper.scrape.return_value = [mirror]
+    [(post, pain)] = module.discover(["saas"], min_score=0.0)
+    assert mock_llm.complete.call_count == 1
+    assert pain.score == 0.9
+    assert storage.get_canonical_id("h1") == "r1"
+    storage.close()
+
+
+def test_discover_stream_resumes_run_from_checkpoint(tmp_path, mock_llm):
+    from copilot.providers.storage.sqlite_provider import SQLiteProvider
+
+    storage = SQLiteProvider(db_path=str(tmp_path / "copilot.db"))
+    outage = {"active": True}
+
+    def scrape(target, limit=100, **kwargs):
+        if target == "b" and outage["active"]:
+            raise ConnectionError("network down")
+        return [_post(f"{target}1"), _post(f"{target}2")]
+
+    scraper = MagicMock()
+    scraper.name = "reddit"
+    scraper.scrape.side_effect = scrape
+    module = DiscoveryModule(scraper=scraper, llm=mock_llm, storage=storage)
+    mock_llm.complete.return_value = json.dumps({"score": 0.9, "reasoning": "Good"})
+
+    first = list(module.discover_stream({"reddit": ["a", "b"]}, min_score=0.0, run_id="run1"))
+    assert sorted(post.id for post, _ in first) == ["a1", "a2"]
+    assert storage.get_run_targets("run1") == [("reddit", "a")]
+
+    outage["active"] = False
+    scraper.scrape.reset_mock()
+    mock_llm.complete.reset_mock()
+    resumed = list(module.discover_stream({"reddit": ["a", "b"]}, min_score=0.0, run_id="run1"))
+
+    assert [call.kwargs["target"] for call in scraper.scrape.call_args_list] == ["b"]
+    assert mock_llm.complete.call_count == 2  # only b1 and b2
+    assert sorted(post.id for post, _ in resumed) == ["a1", "a2", "b1", "b2"]
+    assert module.last_run_stats.resumed == 2
+
+    [run] = storage.list_runs()
+    assert (run["status"], run["posts"], run["analyzed"]) == ("completed", 4, 4)
+    storage.close()
+
+
+def test_discover_stream_resume_retries_failed_analyses(tmp_path, mock_llm):
+    from copilot.providers.storage.sqlite_provider import SQLiteProvider
+
+    storage = SQLiteProvider(db_path=str(tmp_path / "copilot.db"))
+    scraper = MagicMock()
+    scraper.name = "reddit"
+    scraper.scrape.return_value = [_post("1"), _post("2")]
+    module = DiscoveryModule(scraper=scraper, llm=mock_llm, storage=storage)
+
+    def rate_limited(prompt, **kwargs):
+        if "Post 2" in prompt:
+            raise RuntimeError("rate limited")
+        return json.dumps({"score": 0.9, "reasoning": "Good"})
+
+    mock_llm.complete.side_effect = rate_limited
+    list(module.discover_stream({"reddit": ["a"]}, min_score=0.0, run_id="run1"))
+    assert {post.id: status for post, status, _ in storage.get_run_posts("run1")} == {
+        "1": "done",
+        "2": "scraped",
+    }
+
+    mock_llm.complete.side_effect = None
+    mock_llm.complete.return_value = json.dumps({"score": 0.8, "reasoning": "Good"})
+    mock_llm.complete.reset_mock()
+    resumed = list(module.discover_stream({"reddit": ["a"]}, min_score=0.0, run_id="run1"))
+
+    assert mock_llm.complete.call_count == 1  # only post 2
+    assert {post.id: pain.score for post, pain in resumed} == {"1": 0.9, "2": 0.8}
+    assert module.last_run_stats.resumed == 1
+    storage.close()
@@ -49,3 +49,173 @@ def test_ollama_complete(mock_post):
 
     assert result == "ollama response"
     mock_post.assert_called_once()
+
+
+@patch("requests.post")
+def test_groq_rate_limit_raises_with_retry_after(mock_post):
+    from copilot.providers.llm.rate_limit import RateLimitError
+
+    mock_response = MagicMock()
+    mock_response.status_code = 429
+    mock_response.headers = {"Retry-After": "7"}
+    mock_post.return_value = mock_response
+
+    provider = GroqProvider()
+    provider.configure({"api_key": "test-key"})
+    with pytest.raises(RateLimitError) as exc_info:
+        provider.complete("hello")
+
+    assert exc_info.value.retry_after == 7.0
+    mock_post.assert_called_once()
+
+
+def test_rate_limited_provider_backs_off_and_recovers():
+    from copilot.providers.llm.rate_limit import (
+        AIMDRateLimiter,
+        RateLimitedLLMProvider,
+        RateLimitError,
+    )
+
+    inner = MagicMock()
+    inner.name = "groq"
+    inner.complete.side_effect = [RateLimitError("slow down", retry_after=0.0), "ok"]
+
+    limiter = AIMDRateLimiter(rate_per_minute=600, burst=2)
+    provider = RateLimitedLLMProvider(inner, limiter)
+
+    assert provider.complete("hello") == "ok"
+    assert provider.name == "groq"
+    assert inner.complete.call_count == 2
+    # Halved on the 429, then additively increased on success
+    assert limiter.rate == 300 + limiter.increase
+
+
+def test_rate_limited_provider_gives_up_after_max_retries():
+    from copilot.providers.llm.rate_limit import (
+        AIMDRateLimiter,
+        RateLimitedLLMProvider,
+        RateLimitError,
+    )
+
+    inner = MagicMock()
+    inner.complete.side_effect = RateLimitError("slow down", retry_after=0.0)
+
+    provider = RateLimitedLLMProvider(
+        inner, AIMDRateLimiter(rate_per_minute=600), max_retries=2
+    )
+    with pytest.raises(RateLimitError):
+        provider.complete("hello")
+    assert inner.complete.call_count == 3
+
+
+def test_complete_batch_parses_results_keyed_by_id():
+    provider = OllamaProvider()
+    response = (
+        '{"results": [{"id": "a", "score": 0.1}, {"id": "b", "score": 0.9},'
+        ' {"id": "zzz", "score": 1.0}]}'
+    )
+    with patch.object(OllamaProvider, "complete", return_value=response) as complete:
+        results = provider.complete_batch({"a": "first", "b": "second"}, "Score it.")
+
+    assert results == {"a": {"score": 0.1}, "b": {"score": 0.9}}
+    prompt = complete.call_args.kwargs["prompt"]
+    assert prompt.startswith("Score it.")
+    assert "### Item id: a" in prompt and "### Item id: b" in prompt
+
+
+def test_complete_batch_rejects_unparseable_response():
+    provider = OllamaProvider()
+    with patch.object(OllamaProvider, "complete", return_value='{"score": 0.5}'):
+        with pytest.raises(ValueError):
+            provider.complete_batch({"a": "first", "b": "second"}, "Score it.")
+
+
+@pytest.fixture
+def llm_cache(tmp_path):
+    from copilot.providers.llm.cache import LLMResponseCache
+
+    cache = LLMResponseCache(db_path=str(tmp_path / "llm_cache.db"))
+    yield cache
+    cache.close()
+
+
+def test_cached_provider_hits_on_identical_prompt(llm_cache):
+    from copilot.providers.llm.cache import CachedLLMProvider
+    from copilot.providers.llm.mock import MockLLMProvider
+
+    inner = MockLLMProvider()
+    with patch.object(MockLLMProvider, "complete", return_value='{"score": 0.5}') as complete:
+        provider = CachedLLMProvider(inner, llm_cache)
+        first = provider.complete("pain point?", system_prompt="sys")
+        second = provider.complete("pain point?", system_prompt="sys")
+        provider.complete("pain point?", system_prompt="other system prompt")
+        provider.complete("pain point?", system_prompt="sys", bypass_cache=True)
+
+    assert first == second == '{"score": 0.5}'
+    assert complete.call_count == 3
+    assert provider.stats()["hits"] == 1
+    assert provider.stats()["misses"] == 3
+
+
+def test_cached_provider_prompt_version_invalidates(llm_cache):
+    from copilot.providers.llm.cache import CachedLLMProvider
+
+    inner = MagicMock()
+    inner.name = "groq"
+    inner.model = "llama"
+    inner.complete.return_value = "answer"
+
+    CachedLLMProvider(inner, llm_cache, prompt_version="1").complete("hello")
+    CachedLLMProvider(inner, llm_cache, prompt_version="1").complete("hello")
+    CachedLLMProvider(inner, llm_cache, prompt_version="2").complete("hello")
+
+    assert inner.complete.call_count == 2
+
+
+def test_llm_cache_ttl_and_size_eviction(tmp_path):
+    from copilot.providers.llm.cache import LLMResponseCache
+
+    cache = LLMResponseCache(db_path=str(tmp_path / "c.db"), max_entries=10)
+    for i in range(15):
+        cache.put(f"k{i}", f"v{i}")
+    assert len(cache) <= 10
+    assert cache.get("k14") == "v14"
+    assert cache.get("k0") is None
+
+    cache.ttl_seconds = -1
+    assert cache.get("k14") is None
+    cache.close()
+
+
+def test_llm_cache_put_does_not_count_the_table(tmp_path):
+    from copilot.providers.llm.cache import LLMResponseCache
+
+    cache = LLMResponseCache(db_path=str(tmp_path / "c.db"), max_entries=10)
+    statements = []
+    cache._get_connection().set_trace_callback(statements.append)
+    for i in range(9):
+        cache.put(f"k{i}", f"v{i}")
+    cache.put("k0", "again")
+    assert not [sql for sql in statements if "COUNT(*)" in sql]
+
+    for i in range(9, 15):
+        cache.put(f"k{i}", f"v{i}")
+    assert len(cache) == cache._entries <= 10
+    cache.close()
+
+
+def test_cached_provider_batch_only_sends_misses(llm_cache):
+    from copilot.providers.llm.cache import CachedLLMProvider
+
+    inner = MagicMock()
+    inner.name = "mock"
+    inner.complete_batch.side_effect = lambda items, instructions, **kw: {
+        item_id: {"score": 0.7} for item_id in items
+    }
+    provider = CachedLLMProvider(inner, llm_cache)
+
+    provider.complete_batch({"a": "one", "b": "two"}, "Score it.")
+    results = provider.complete_batch({"b": "two", "c": "three"}, "Score it.")
+
+    assert results == {"b": {"score": 0.7}, "c": {"score": 0.7}}
+    assert list(inner.complete_batch.call_args.args[0]) == ["c"]
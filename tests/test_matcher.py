@@ -0,0 +1,54 @@
+from copilot.core.config import SAAS_INTENT_KEYWORDS
+from copilot.core.matcher import KeywordMatcher, fts_any_of, keyword_matcher
+
+
+def test_matches_positions_and_tiers_in_one_pass():
+    matcher = KeywordMatcher({"high": ["willing to pay", "API"], "low": ["tutorial"]})
+    text = "Any tutorial? I'm willing to pay for an api"
+
+    matches = list(matcher.finditer(text))
+    assert [(m.keyword, m.tier) for m in matches] == [
+        ("tutorial", "low"),
+        ("willing to pay", "high"),
+        ("API", "high"),
+    ]
+    assert text[matches[1].start : matches[1].end] == "willing to pay"
+
+
+def test_whole_words_only():
+    matcher = KeywordMatcher({"medium": ["vs"], "high": ["API"]})
+    assert not matcher.search("A canvas for rapid prototyping")
+    assert matcher.matched_keywords("Notion vs. Jira") == {"medium": {"vs"}}
+
+
+def test_longest_keyword_wins_on_overlap():
+    matcher = KeywordMatcher({"a": ["looking for"], "b": ["looking for a cofounder"]})
+    assert matcher.matched_keywords("Looking for a cofounder") == {"b": {"looking for a cofounder"}}
+
+
+def test_empty_matcher():
+    matcher = KeywordMatcher({"competitor": []})
+    assert not matcher.search("anything")
+    assert list(matcher.finditer("anything")) == []
+
+
+def test_shared_matcher_is_rebuilt_only_when_keywords_change():
+    first = keyword_matcher(SAAS_INTENT_KEYWORDS)
+    assert keyword_matcher(dict(SAAS_INTENT_KEYWORDS)) is first
+    assert keyword_matcher({"competitor": ["Linear"]}) is not first
+
+
+def test_hundreds_of_competitors():
+    competitors = [f"Tool{i}" for i in range(500)] + ["Linear"]
+    matcher = keyword_matcher({"competitor": competitors})
+    found = matcher.matched_keywords("Switching from Tool42 to linear, Tool4200 is dead")
+    assert found == {"competitor": {"Tool42", "Linear"}}
+
+
+def test_fts_any_of_quotes_each_keyword_as_a_phrase():
+    assert fts_any_of(["looking for", 'say "hi"', " ", "API"]) == (
+        '"looking for" OR "say ""hi""" OR "API"'
+    )
+    assert fts_any_of(["recommend", "looking for"], columns=("title", "body")) == (
+        '{title body}: ("recommend" OR "looking for")'
+    )
@@ -154,6 +154,44 @@ def test_leads_module():
     assert leads[0].intent_score == 0.8
 
 
+def test_leads_module_finds_candidates_with_full_text_search(tmp_path):
+    from copilot.providers.storage.sqlite_provider import SQLiteProvider
+
+    storage = SQLiteProvider(db_path=str(tmp_path / "leads.db"))
+    storage.initialize()
+    for i, title in enumerate(["Looking for a CRM", "Nothing to see", "How do I export?"]):
+        storage.save_post(
+            ScrapedPost(
+                id=f"l{i}",
+                source="reddit",
+                title=title,
+                author="a",
+                url="u",
+                upvotes=1,
+                comments_count=1,
+                created_at=datetime.now(timezone.utc),
+            )
+        )
+
+    # Only the stored analysis mentions an intent keyword: not a candidate
+    storage.save_signal(
+        "l1",
+        PainScore(
+            score=0.5,
+            reasoning="I would recommend a CRM",
+            detected_problems=["looking for a tool"],
+        ),
+    )
+
+    llm = MockLLM()
+    llm.complete = MagicMock(wraps=llm.complete)
+    module = LeadModule(llm, storage)
+    leads = module.scan_for_leads()
+    assert sorted(lead.post_id for lead in leads) == ["l0", "l2"]
+    assert llm.complete.call_count == 2
+    storage.close()
+
+
 def test_validation_module_missing_post():
     llm = MockLLM()
     storage = MockStorage()
@@ -374,6 +412,32 @@ def test_export_module_reports_to_md():
             temp_path.unlink()
 
 
+def test_export_module_streams_from_sqlite(tmp_path):
+    from copilot.providers.storage.sqlite_provider import SQLiteProvider
+
+    storage = SQLiteProvider(db_path=str(tmp_path / "export.db"))
+    storage.initialize()
+    export = ExportModule(storage)
+    assert export.export_leads_to_csv(tmp_path / "empty.csv") == 0
+    assert not (tmp_path / "empty.csv").exists()
+
+    storage.save_leads(
+        [
+            Lead(
+                post_id=f"p{i}",
+                author=f"user{i}",
+                content_snippet="Needs tool",
+                contact_url="http://example.com",
+                intent_score=0.8,
+            )
+            for i in range(1200)
+        ]
+    )
+    assert export.export_leads_to_hubspot_csv(tmp_path / "leads.csv") == 1200
+    assert (tmp_path / "leads.csv").read_text().count("http://example.com") == 1200
+    storage.close()
+
+
 def test_export_module_empty_leads_csv():
     storage = MockStorage()
     export = ExportModule(storage)
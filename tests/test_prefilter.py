@@ -0,0 +1,93 @@
+import json
+from datetime import datetime, timezone
+from unittest.mock import MagicMock
+from copilot.modules.discovery import DiscoveryModule
+from copilot.modules.prefilter import (
+    LexicalPrefilter,
+    labelled_sample_from_storage,
+    lexical_score,
+)
+from copilot.models.schemas import PainScore, ScrapedPost
+
+
+def _post(post_id, title, body=None, source="g2", upvotes=0):
+    return ScrapedPost(
+        id=post_id,
+        source=source,
+        title=title,
+        body=body,
+        author="user",
+        url="url",
+        upvotes=upvotes,
+        comments_count=0,
+        created_at=datetime.now(timezone.utc),
+    )
+
+
+def test_lexical_score_ranks_pain_above_praise():
+    pain = _post("1", "So frustrated with manual invoicing, looking for an alternative to X?")
+    praise = _post("2", "Great product, the team is lovely")
+
+    assert lexical_score(pain) > lexical_score(praise)
+    assert 0.0 <= lexical_score(pain) <= 1.0
+
+
+def test_uncalibrated_prefilter_passes_everything():
+    prefilter = LexicalPrefilter()
+    assert prefilter.passes(_post("1", "Great product"))
+
+
+def test_calibrate_keeps_target_recall_and_reports_savings():
+    positives = [
+        _post(f"p{i}", "Frustrated with this slow, broken tool. Any alternative to it?")
+        for i in range(9)
+    ] + [_post("p9", "Looking for a better tool")]
+    negatives = [_post(f"n{i}", "Nice update, love the new colours") for i in range(10)]
+    labelled = [(p, True) for p in positives] + [(p, False) for p in negatives]
+
+    prefilter = LexicalPrefilter()
+    thresholds = prefilter.calibrate(labelled, target_recall=0.9, min_positives=5)
+
+    assert thresholds["g2"] > lexical_score(negatives[0])
+    [report] = prefilter.evaluate(labelled)
+    assert report.skipped == 11
+    assert report.missed_positives == 1
+    assert report.recall_loss == 0.1
+    assert report.calls_saved_rate == 0.55
+
+
+def test_calibrate_skips_sources_with_too_few_positives():
+    labelled = [(_post("1", "Broken and slow"), True), (_post("2", "Nice"), False)]
+    assert LexicalPrefilter().calibrate(labelled, min_positives=5) == {"g2": 0.0}
+
+
+def test_labelled_sample_leaves_out_failed_analyses():
+    posts = [_post("pain", "Broken"), _post("fine", "Nice"), _post("failed", "Broken")]
+    storage = MagicMock()
+    storage.get_posts.return_value = posts
+    storage.get_signals.return_value = {
+        "pain": PainScore(score=0.9, reasoning="Real pain"),
+        "fine": PainScore(score=0.1, reasoning="Praise"),
+        "failed": PainScore(score=0.0, reasoning="Analysis failed: timeout", failed=True),
+    }
+
+    sample = labelled_sample_from_storage(storage)
+    assert [(post.id, label) for post, label in sample] == [("pain", True), ("fine", False)]
+
+
+def test_discover_counts_prefiltered_posts():
+    scraper = MagicMock()
+    scraper.scrape.return_value = [
+        _post("1", "Frustrated with slow, broken invoicing. Any alternative to it?"),
+        _post("2", "Nice update, love the new colours"),
+    ]
+    llm = MagicMock()
+    llm.complete.return_value = json.dumps({"score": 0.9, "reasoning": "Good"})
+    module = DiscoveryModule(scraper=scraper, llm=llm)
+    module.prefilter = LexicalPrefilter({"g2": 0.2})
+
+    results = module.discover(["slack"], min_score=0.0)
+
+    assert [post.id for post, _ in results] == ["1"]
+    assert module.last_run_stats.prefiltered == 1
+    assert llm.complete.call_count == 1
@@ -8,8 +8,10 @@ from copilot.modules.scoring import (
     calculate_trend_momentum,
     calculate_cross_source_bonus,
     compute_opportunity_score,
+    compute_opportunity_scores,
     ScoringModule,
     WEIGHTS,
+    resolve_weights,
 )
 from copilot.models.schemas import ScrapedPost, PainScore
 from copilot.providers.storage.sqlite_provider import SQLiteProvider
@@ -31,7 +33,8 @@ def storage(temp_db_path):
     """Create storage provider for testing."""
     storage = SQLiteProvider(db_path=temp_db_path)
     storage.initialize()
-    return storage
+    yield storage
+    storage.close()
 
 
 @pytest.fixture
@@ -362,7 +365,209 @@ def test_cross_source_bonus(storage, reddit_post, pain_score):
     assert bonus >= 0.0
 
 
+def _aged_post(post_id, source, days_old, title="Jira is too slow for our team"):
+    return ScrapedPost(
+        id=post_id,
+        source=source,
+        title=title,
+        author="someone",
+        url="url",
+        upvotes=1,
+        comments_count=0,
+        created_at=datetime.now(timezone.utc) - timedelta(days=days_old),
+    )
+
+
+def test_trend_momentum_uses_term_index_beyond_newest_posts(reddit_post, storage):
+    """Older matching posts count even when 1000+ newer posts push them out of get_posts."""
+    for i in range(1001):
+        storage.save_post(_aged_post(f"filler{i}", "reddit", 0, title=f"Unrelated topic {i}"))
+    for i in range(4):
+        storage.save_post(_aged_post(f"recent{i}", "reddit", 5))
+    storage.save_post(_aged_post("older0", "reddit", 45))
+
+    assert storage.count_posts_with_terms(["jira"], source="reddit") == 5
+    # 4 recent vs 1 older matching post: the topic is accelerating
+    assert calculate_trend_momentum(reddit_post, storage) > 0.9
+
+
+def test_cross_source_bonus_uses_term_index(reddit_post, storage):
+    for i in range(5):
+        storage.save_post(_aged_post(f"other{i}", "reddit", 3, title=f"Unrelated topic {i}"))
+    storage.save_post(_aged_post("hn1", "hackernews", 10))
+    storage.save_post(_aged_post("g2_1", "g2", 200))  # outside the 90 day window
+    storage.save_post(_aged_post("r1", "reddit", 1))  # same source, ignored
+
+    assert storage.get_sources_with_terms(
+        ["jira"], since=datetime.now(timezone.utc) - timedelta(days=90), exclude_source="reddit"
+    ) == {"hackernews"}
+    assert calculate_cross_source_bonus(reddit_post, storage) == pytest.approx(0.05)
+
+
+def _batch_fixture(storage):
+    """Posts across every normalizer, star ratings, naive datetimes and ages."""
+    posts = []
+    sources = ["reddit", "hackernews", "g2", "capterra", "producthunt"]
+    for i in range(40):
+        source = sources[i % len(sources)]
+        post = _aged_post(
+            f"batch{i}",
+            source,
+            [0.5, 3.5, 12.5, 45.5, 120.5][i % 5],
+            title=f"Jira alternative {i % 3}, willing to pay for a SaaS API",
+        )
+        post.upvotes = i * 17
+        post.comments_count = i * 3
+        if source in ("g2", "capterra") and i % 2:
+            post.metadata = {"star_rating": (i % 5) + 1}
+        if i % 7 == 0:
+            post.created_at = post.created_at.replace(tzinfo=None)
+        storage.save_post(post)
+        pain = PainScore(
+            score=(i % 10) / 10,
+            reasoning="r",
+            validation_score=(i % 4) / 4,
+            sentiment_intensity=(i % 3) / 3,
+        )
+        posts.append((post, pain))
+    return posts
+
+
+def test_batch_scores_match_per_post_scores(storage):
+    posts_with_pain = _batch_fixture(storage)
+
+    batch = compute_opportunity_scores(posts_with_pain, storage)
+    single = [compute_opportunity_score(p, pain, storage) for p, pain in posts_with_pain]
+
+    assert len(batch) == len(single) == 40
+    for b, s in zip(batch, single):
+        assert b.post_id == s.post_id
+        assert b.final_score == s.final_score
+        assert b.dimensions == s.dimensions
+        assert b.cross_source_bonus == s.cross_source_bonus
+
+
+def test_batch_scores_without_numpy(storage, monkeypatch):
+    import copilot.modules.scoring as scoring
+
+    posts_with_pain = _batch_fixture(storage)
+    expected = [s.final_score for s in compute_opportunity_scores(posts_with_pain, storage)]
+
+    monkeypatch.setattr(scoring, "np", None)
+    fallback = compute_opportunity_scores(posts_with_pain, storage)
+    assert [s.final_score for s in fallback] == expected
+
+
+def test_key_terms_prefer_distinctive_words(storage):
+    """Words found in most stored posts give way to rarer ones under TF-IDF."""
+    for i in range(20):
+        storage.save_post(_aged_post(f"generic{i}", "reddit", 1, title=f"Best tool app {i}"))
+    post = _aged_post("p", "reddit", 0, title="Tool app tool app for dentist scheduling")
+
+    assert extract_key_terms(post)[:2] == ["tool", "app"]
+    frequencies = storage.get_document_frequencies(["tool", "app", "dentist", "scheduling"])
+    assert frequencies == ({"tool": 20, "app": 20}, 20)
+    assert extract_key_terms(post, frequencies)[:2] == ["dentist", "scheduling"]
+
+
+def test_document_frequencies_follow_edits(storage):
+    storage.save_post(_aged_post("a", "reddit", 1, title="Dentist scheduling"))
+    storage.save_post(_aged_post("b", "hackernews", 1, title="Dentist billing"))
+    assert storage.get_document_frequencies(["dentist", "billing"]) == (
+        {"dentist": 2, "billing": 1},
+        2,
+    )
+
+    storage.save_post(_aged_post("b", "hackernews", 1, title="Payroll billing"))
+    assert storage.get_document_frequencies(["dentist", "payroll"]) == (
+        {"dentist": 1, "payroll": 1},
+        2,
+    )
+
+
 def test_weights_sum_to_one():
     """Test that default weights sum to approximately 1.0."""
     total = sum(WEIGHTS.values())
     assert abs(total - 1.0) < 0.01, f"Weights sum to {total}, expected 1.0"
+
+
+def test_compute_scores_for_posts_persists_scores(storage):
+    posts_with_pain = _batch_fixture(storage)
+    module = ScoringModule(storage)
+
+    scores = module.compute_scores_for_posts(posts_with_pain)
+
+    stored = module.get_top_opportunities(limit=100)
+    assert [s.post_id for s in stored] == [s.post_id for s in scores]
+    assert [s.final_score for s in stored] == [s.final_score for s in scores]
+
+
+def test_rescore_all_walks_the_db_in_chunks(storage):
+    posts_with_pain = _batch_fixture(storage)
+    storage.save_signals({post.id: pain for post, pain in posts_with_pain[:35]})
+    module = ScoringModule(storage)
+    progress = []
+
+    total = module.rescore_all(
+        chunk_size=10, progress=lambda done, count: progress.append((done, count))
+    )
+
+    assert total == 35
+    assert progress == [(10, 35), (20, 35), (30, 35), (35, 35)]
+    expected = compute_opportunity_scores(posts_with_pain[:35], storage)
+    stored = {s.post_id: s.final_score for s in storage.get_opportunity_scores(limit=100)}
+    assert stored == {s.post_id: s.final_score for s in expected}
+
+    assert module.rescore_all(chunk_size=10, source="g2") == 7
+
+
+def test_reweighting_stored_scores_matches_rescoring(storage):
+    posts_with_pain = _batch_fixture(storage)
+    module = ScoringModule(storage)
+    module.compute_scores_for_posts(posts_with_pain)
+    traction = resolve_weights("traction")
+
+    reweighted = module.get_top_opportunities(limit=100, weights=traction)
+    rescored = module.compute_scores_for_posts(
+        posts_with_pain, weights=traction, persist=False
+    )
+
+    assert [s.post_id for s in reweighted] == [s.post_id for s in rescored]
+    assert [s.final_score for s in reweighted] == pytest.approx(
+        [s.final_score for s in rescored]
+    )
+    assert reweighted[0].weights == traction
+    # The stored scores are left alone
+    assert module.get_top_opportunities(limit=1)[0].weights == WEIGHTS
+
+
+def test_resolve_weights(tmp_path):
+    assert resolve_weights("default") == WEIGHTS
+    assert resolve_weights("mine", {"mine": {"recency": 1}})["recency"] == 1.0
+    assert resolve_weights('{"pain_intensity": 0.5}')["market_signal"] == 0.0
+
+    profile = tmp_path / "profile.json"
+    profile.write_text('{"trend_momentum": 0.7, "pain_intensity": 0.3}')
+    assert resolve_weights(str(profile))["trend_momentum"] == 0.7
+
+    with pytest.raises(ValueError):
+        resolve_weights("no-such-profile")
+    with pytest.raises(ValueError):
+        resolve_weights('{"virality": 1}')
+    with pytest.raises(ValueError, match="Unknown weight profile"):
+        resolve_weights(str(profile), allow_files=False)
+
+
+def test_parallel_rescore_matches_serial(storage):
+    posts_with_pain = _batch_fixture(storage)
+    storage.save_signals({post.id: pain for post, pain in posts_with_pain})
+    module = ScoringModule(storage)
+
+    module.rescore_all(chunk_size=7)
+    serial = {s.post_id: s.final_score for s in storage.get_opportunity_scores(limit=100)}
+    storage._get_connection().execute("DELETE FROM opportunity_scores")
+    storage._get_connection().commit()
+
+    assert module.rescore_all(chunk_size=7, workers=3) == 40
+    parallel = {s.post_id: s.final_score for s in storage.get_opportunity_scores(limit=100)}
+    assert parallel == serial
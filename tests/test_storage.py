@@ -1,8 +1,14 @@
 import os
 import pytest
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 from copilot.providers.storage.sqlite_provider import SQLiteProvider
-from copilot.models.schemas import ScrapedPost, PainScore
+from copilot.models.schemas import (
+    ScrapedPost,
+    PainScore,
+    Lead,
+    OpportunityScore,
+    ValidationReport,
+)
 
 DB_PATH = "test_founder.db"
 
@@ -78,3 +84,556 @@ def test_sqlite_save_signal(storage):
     assert row is not None
     assert row["score"] == 0.9
     assert "manual data entry" in row["detected_problems"]
+
+def test_sqlite_get_content_hashes_and_signals(storage):
+    post = ScrapedPost(
+        id="p1",
+        source="reddit",
+        title="Invoices",
+        body="Manual entry is slow",
+        author="a",
+        url="u",
+        upvotes=1,
+        comments_count=0,
+        created_at=datetime.now(timezone.utc),
+    )
+    storage.save_post(post)
+    storage.save_post(post.model_copy(update={"id": "p2"}))
+    storage.save_signal("p1", PainScore(score=0.6, reasoning="r"))
+
+    # Only posts that already have a signal are reported
+    assert storage.get_content_hashes(["p1", "p2", "missing"]) == {"p1": post.content_hash}
+    signals = storage.get_signals(["p1", "p2"])
+    assert list(signals) == ["p1"]
+    assert signals["p1"].score == 0.6
+
+def test_sqlite_links_near_duplicates_to_canonical_post(storage):
+    body = (
+        "We are a five person agency and keep losing track of unpaid invoices. "
+        "Is there a simple tool that sends reminders automatically?"
+    )
+    original = ScrapedPost(
+        id="r1",
+        source="reddit",
+        title="How do you chase unpaid invoices?",
+        body=body,
+        author="a",
+        url="u",
+        upvotes=1,
+        comments_count=0,
+        created_at=datetime.now(timezone.utc),
+    )
+    crosspost = original.model_copy(update={"id": "r2", "body": body + " Thanks!"})
+    unrelated = original.model_copy(
+        update={
+            "id": "r3",
+            "title": "Launching my Rust side project",
+            "body": "Feedback on the landing page and pricing welcome, it is free during beta.",
+        }
+    )
+
+    storage.save_post(original)
+    storage.save_post(crosspost)
+
+    assert storage.get_canonical_id("r2") == "r1"
+    assert storage.find_near_duplicates([crosspost, unrelated]) == {"r2": "r1"}
+
+    # Rewriting a post re-indexes it under its new content
+    storage.save_post(unrelated.model_copy(update={"id": "r2"}))
+    assert storage.get_canonical_id("r2") == "r2"
+    assert storage.find_near_duplicates([unrelated]) == {"r3": "r2"}
+
+def _term_post(post_id, source, days_old, title):
+    return ScrapedPost(
+        id=post_id,
+        source=source,
+        title=title,
+        author="a",
+        url="u",
+        upvotes=1,
+        comments_count=0,
+        created_at=datetime.now(timezone.utc) - timedelta(days=days_old),
+    )
+
+def test_sqlite_term_rollups_follow_edits(storage):
+    storage.save_post(_term_post("t1", "reddit", 2, "Invoice reminders are painful"))
+    storage.save_post(_term_post("t2", "reddit", 3, "Invoice exports broken"))
+    storage.save_post(_term_post("t3", "reddit", 40, "Invoice tooling is slow"))
+
+    since = datetime.now(timezone.utc) - timedelta(days=30)
+    assert storage.sum_term_counts(["invoice"], since=since, source="reddit") == 2
+    assert storage.sum_term_counts(["invoice", "exports"], since=since) == 3
+    assert storage.sum_term_counts(["invoice"], since=since, exclude_post_id="t1") == 1
+
+    # Editing a post moves its mentions; rebuilding from the index agrees
+    storage.save_post(_term_post("t2", "reddit", 3, "Payroll exports broken"))
+    assert storage.sum_term_counts(["invoice"], since=since) == 1
+    before = sorted(map(tuple, storage._get_connection().execute("SELECT * FROM term_daily_counts")))
+    storage.rebuild_term_rollups()
+    after = sorted(map(tuple, storage._get_connection().execute("SELECT * FROM term_daily_counts")))
+    assert before == after
+
+def test_sqlite_rebuilt_term_rollups_are_committed(storage):
+    storage.save_post(_term_post("t1", "reddit", 2, "Invoice reminders are painful"))
+    with storage.transaction():
+        storage._get_connection().execute("DELETE FROM term_daily_counts")
+
+    rows = storage.rebuild_term_rollups()
+    assert rows > 0
+
+    reader = SQLiteProvider(db_path=DB_PATH)
+    assert reader._get_connection().execute("SELECT COUNT(*) FROM term_daily_counts").fetchone()[0] == rows
+    reader.close()
+
+def test_sqlite_rising_terms_per_source(storage):
+    for i in range(4):
+        storage.save_post(_term_post(f"new{i}", "reddit", 1, "Invoice reminders"))
+    storage.save_post(_term_post("old0", "reddit", 40, "Invoice reminders"))
+    storage.save_post(_term_post("old1", "reddit", 45, "Reminders everywhere"))
+    storage.save_post(_term_post("hn0", "hackernews", 1, "Invoice invoice"))
+
+    rising = storage.get_rising_terms(days=30, min_count=2)
+    assert [(r["source"], r["term"], r["recent"], r["previous"]) for r in rising] == [
+        ("reddit", "invoice", 4, 1),
+        ("reddit", "reminders", 4, 2),
+    ]
+    assert storage.get_rising_terms(days=30, source="hackernews", min_count=1)[0]["term"] == "invoice"
+
+def test_sqlite_bulk_saves_in_one_transaction(storage):
+    posts = [_term_post(f"b{i}", "reddit", 1, f"Invoice reminder {i}") for i in range(50)]
+    with storage.transaction():
+        storage.save_posts(posts)
+        storage.save_signals({p.id: PainScore(score=0.5, reasoning="r") for p in posts})
+        storage.save_leads(
+            [Lead(post_id="b1", author="a", content_snippet="s", intent_score=0.9, contact_url="u")]
+        )
+        storage.save_opportunity_scores(
+            [OpportunityScore(post_id="b1", source="reddit", final_score=0.7)]
+        )
+
+    assert len(storage.get_posts(limit=100)) == 50
+    assert len(storage.get_signals([p.id for p in posts])) == 50
+    assert storage.sum_term_counts(["invoice"]) == 50
+    lead = storage.get_leads()[0]
+    assert storage.get_opportunity_scores()[0].final_score == 0.7
+
+    # Leads with an id are updated in place
+    lead.status = "contacted"
+    storage.save_leads([lead])
+    assert [l.status for l in storage.get_leads()] == ["contacted"]
+
+def test_sqlite_transaction_rolls_back_on_error(storage):
+    storage.save_post(_term_post("keep", "reddit", 1, "Kept post"))
+    with pytest.raises(RuntimeError):
+        with storage.transaction():
+            storage.save_posts([_term_post("lost", "reddit", 1, "Lost post")])
+            with storage.transaction():
+                storage.save_signal("lost", PainScore(score=0.5, reasoning="r"))
+            raise RuntimeError("boom")
+
+    assert [p.id for p in storage.get_posts()] == ["keep"]
+    assert storage.get_signal("lost") is None
+    assert storage.sum_term_counts(["lost"]) == 0
+
+
+def test_sqlite_pages_posts_with_signals(storage):
+    posts = [_term_post(f"s{i:02d}", "reddit" if i % 2 else "g2", 1, "t") for i in range(12)]
+    storage.save_posts(posts)
+    storage.save_signals({p.id: PainScore(score=0.5, reasoning="r") for p in posts[:9]})
+
+    first = storage.get_posts_with_signals(limit=5)
+    second = storage.get_posts_with_signals(limit=5, after_id=first[-1][0].id)
+    assert [p.id for p, _ in first + second] == [f"s{i:02d}" for i in range(9)]
+    assert all(pain.score == 0.5 for _, pain in first + second)
+    assert [p.id for p, _ in storage.get_posts_with_signals(source="g2")] == [
+        "s00", "s02", "s04", "s06", "s08"
+    ]
+
+    storage.save_opportunity_scores(
+        [OpportunityScore(post_id=p.id, source=p.source, final_score=i / 20) for i, p in enumerate(posts)]
+    )
+    assert [s.post_id for s in storage.get_opportunity_scores(limit=2, source="g2")] == ["s10", "s08"]
+
+
+def test_sqlite_read_only_connection(storage):
+    storage.save_post(_term_post("r1", "reddit", 1, "Invoice reminders"))
+    storage.save_signal("r1", PainScore(score=0.5, reasoning="r"))
+
+    reader = SQLiteProvider(db_path=DB_PATH, read_only=True)
+    assert reader.get_scored_post_ids() == ["r1"]
+    with pytest.raises(Exception, match="readonly"):
+        reader.save_signal("r1", PainScore(score=0.9, reasoning="r"))
+    reader.close()
+
+
+def test_sqlite_wal_readers_and_writer_across_threads(storage):
+    import threading
+
+    assert storage._get_connection().execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+    storage.save_post(_term_post("w0", "reddit", 1, "Invoice reminders"))
+
+    errors = []
+    seen = []
+
+    def write(start):
+        try:
+            for i in range(start, start + 20):
+                storage.save_post(_term_post(f"w{i}", "reddit", 1, "Invoice reminders"))
+        except Exception as e:
+            errors.append(e)
+
+    def read():
+        try:
+            for _ in range(20):
+                seen.append(len(storage.get_posts(limit=1000)))
+        except Exception as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=write, args=(start,)) for start in (1, 21)]
+    threads += [threading.Thread(target=read) for _ in range(3)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert errors == []
+    assert min(seen) >= 1
+    assert len(storage.get_posts(limit=1000)) == 41
+    assert storage.sum_term_counts(["invoice"]) == 41
+
+
+def test_sqlite_transaction_reads_its_own_writes(storage):
+    with storage.transaction():
+        storage.save_post(_term_post("t1", "reddit", 1, "Invoice reminders"))
+        assert storage.get_post_by_id("t1") is not None
+
+
+def test_sqlite_hot_queries_use_indexes(storage):
+    assert [r["name"] for r in storage.explain_queries() if r["full_scan"]] == []
+
+    storage._get_connection().execute("DROP INDEX idx_leads_created_at")
+    reader = SQLiteProvider(db_path=DB_PATH)
+    assert [r["name"] for r in reader.explain_queries() if r["full_scan"]] == [
+        "get_leads",
+        "iter_leads since",
+    ]
+    reader.close()
+
+
+class _RecordingConnection:
+    """Connection or cursor proxy that records the SQL it is asked to run."""
+
+    def __init__(self, target, statements):
+        self._target = target
+        self._statements = statements
+
+    def execute(self, sql, *args):
+        self._statements.add(" ".join(sql.split()))
+        return self._target.execute(sql, *args)
+
+    def cursor(self):
+        return _RecordingConnection(self._target.cursor(), self._statements)
+
+    def __iter__(self):
+        return iter(self._target)
+
+    def __getattr__(self, name):
+        return getattr(self._target, name)
+
+
+def test_sqlite_hot_queries_are_the_queries_methods_run(storage, monkeypatch):
+    from copilot.providers.storage.sqlite_provider import HOT_QUERIES
+
+    statements = set()
+    connection = storage._get_connection()
+    monkeypatch.setattr(
+        storage, "_get_connection", lambda: _RecordingConnection(connection, statements)
+    )
+    since = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    storage.get_posts()
+    storage.get_posts(source="reddit")
+    storage.get_post_by_id("id")
+    storage.get_signal("id")
+    storage.search_posts("invoice")
+    storage.get_opportunity_scores(min_score=0.5)
+    storage.get_opportunity_scores(min_score=0.5, source="reddit")
+    storage.get_leads(limit=100)
+    storage.get_reports(limit=100)
+    list(storage.iter_posts(source="reddit", since=since, analyzed_only=True))
+    list(storage.iter_leads(since=since))
+    list(storage.iter_reports(since=since))
+    list(storage.iter_scores(source="reddit"))
+    storage.get_scored_view()
+
+    for name, sql, _ in HOT_QUERIES:
+        if not name.startswith("dashboard "):
+            assert " ".join(sql.split()) in statements, name
+
+
+def test_sqlite_scored_view_joins_posts_signals_and_scores(storage):
+    posts = [_term_post(f"v{i}", "reddit" if i % 2 else "g2", 1, "Invoice reminders") for i in range(4)]
+    storage.save_posts(posts)
+    storage.save_signals({"v1": PainScore(score=0.8, reasoning="why", sentiment_label="frustrated")})
+    storage.save_opportunity_scores(
+        [OpportunityScore(post_id=p.id, source=p.source, final_score=i / 10) for i, p in enumerate(posts)]
+        + [OpportunityScore(post_id="gone", source="reddit", final_score=0.9)]
+    )
+
+    view = storage.get_scored_view(limit=10, min_score=0.1)
+    assert [(score.post_id, post.id) for score, post, _ in view] == [
+        ("v3", "v3"), ("v2", "v2"), ("v1", "v1")
+    ]
+    assert view[2][2].sentiment_label == "frustrated"
+    assert view[2][1].source == "reddit"
+    assert view[0][2] is None
+    assert [score.post_id for score, _, _ in storage.get_scored_view(source="g2")] == ["v2", "v0"]
+
+    assert sorted(storage.get_posts_by_ids(["v0", "v3", "missing"])) == ["v0", "v3"]
+
+
+def test_sqlite_search_index_follows_posts_and_signals(storage):
+    storage.save_posts(
+        [
+            _term_post("f1", "reddit", 1, "Invoice reminders are painful"),
+            _term_post("f2", "g2", 40, "Invoice software review"),
+            _term_post("f3", "reddit", 2, "Scheduling for dentists"),
+        ]
+    )
+
+    hits = storage.search_posts("invoice")
+    assert sorted(hit["post"].id for hit in hits) == ["f1", "f2"]
+    assert "[Invoice]" in hits[0]["snippet"]
+    assert [h["post"].id for h in storage.search_posts("invoice", source="g2")] == ["f2"]
+    since = (datetime.now(timezone.utc) - timedelta(days=10)).date().isoformat()
+    assert [h["post"].id for h in storage.search_posts("invoice", since=since)] == ["f1"]
+    assert [h["post"].id for h in storage.search_posts("invoice", order="recent")] == ["f1", "f2"]
+
+    # Re-saving a post replaces its indexed text
+    storage.save_post(_term_post("f1", "reddit", 1, "Payroll exports"))
+    assert [h["post"].id for h in storage.search_posts("invoice")] == ["f2"]
+    assert [h["post"].id for h in storage.search_posts("payroll")] == ["f1"]
+
+    # Signals make the analysis searchable, and survive the post being re-saved
+    storage.save_signal(
+        "f3", PainScore(score=0.5, reasoning="No-show calls", detected_problems=["double booking"])
+    )
+    assert [h["post"].id for h in storage.search_posts('"double booking"')] == ["f3"]
+    storage.save_post(_term_post("f3", "reddit", 2, "Scheduling for dentists"))
+    assert [h["post"].id for h in storage.search_posts("booking")] == ["f3"]
+
+    with pytest.raises(ValueError):
+        storage.search_posts('"unbalanced')
+
+
+def test_sqlite_search_index_backfills_existing_posts(storage):
+    storage.save_post(_term_post("old", "reddit", 1, "Invoice reminders"))
+    storage._get_connection().execute("DELETE FROM search_index")
+    # A database from before schema versioning replays every migration
+    storage._get_connection().execute("PRAGMA user_version = 0")
+    storage._get_connection().commit()
+
+    reopened = SQLiteProvider(db_path=DB_PATH)
+    reopened.initialize()
+    assert [h["post"].id for h in reopened.search_posts("invoice")] == ["old"]
+    reopened.close()
+
+
+def test_sqlite_migration_flags_failed_analyses(storage):
+    storage.save_post(_term_post("ok", "reddit", 1, "Invoice reminders"))
+    storage.save_post(_term_post("bad", "reddit", 1, "Invoice exports"))
+    storage.save_signals(
+        {
+            "ok": PainScore(score=0.4, reasoning="Analysis failed: a quote, not an error"),
+            # Stored before the failed flag existed
+            "bad": PainScore(score=0.0, reasoning="Analysis failed: rate limited"),
+        }
+    )
+    storage._get_connection().execute("PRAGMA user_version = 0")
+    storage._get_connection().commit()
+
+    reopened = SQLiteProvider(db_path=DB_PATH)
+    reopened.initialize()
+    assert {k: v.failed for k, v in reopened.get_signals(["ok", "bad"]).items()} == {
+        "ok": False,
+        "bad": True,
+    }
+    reopened.close()
+
+
+def test_sqlite_migrations_record_schema_version(storage):
+    assert storage.schema_version() == len(SQLiteProvider._MIGRATIONS)
+    rows = storage._get_connection().execute(
+        "SELECT version, name FROM schema_version ORDER BY version"
+    ).fetchall()
+    assert [(row["version"], row["name"]) for row in rows] == [
+        (number, name) for number, (name, _) in enumerate(SQLiteProvider._MIGRATIONS, start=1)
+    ]
+
+
+def test_sqlite_current_schema_skips_migrations(storage, monkeypatch):
+    reopened = SQLiteProvider(db_path=DB_PATH)
+    monkeypatch.setattr(
+        SQLiteProvider, "_migrate", lambda self, conn: pytest.fail("migrated a current schema")
+    )
+    reopened.initialize()
+    reopened.initialize()
+    reopened.close()
+
+
+def test_sqlite_migrates_legacy_database(tmp_path):
+    import sqlite3
+
+    db_path = tmp_path / "legacy.db"
+    conn = sqlite3.connect(db_path)
+    conn.execute(
+        "CREATE TABLE leads (id INTEGER PRIMARY KEY AUTOINCREMENT, post_id TEXT,"
+        " contact_url TEXT, status TEXT, created_at TEXT)"
+    )
+    conn.execute(
+        "INSERT INTO leads (post_id, contact_url, status, created_at)"
+        " VALUES ('p1', 'https://example.com', 'new', '2024-01-01T00:00:00')"
+    )
+    conn.commit()
+    conn.close()
+
+    provider = SQLiteProvider(db_path=str(db_path))
+    provider.initialize()
+    assert provider.schema_version() == len(SQLiteProvider._MIGRATIONS)
+    columns = {
+        row["name"] for row in provider._get_connection().execute("PRAGMA table_info(leads)")
+    }
+    assert {"author", "content_snippet", "intent_score"} <= columns
+    provider.close()
+
+
+def test_sqlite_reads_round_trip_without_revalidation(storage):
+    post = _term_post("r1", "reddit", 1, "Invoice reminders")
+    post.metadata = {"flair": "Question", "awards": [1, 2]}
+    signal = PainScore(score=0.8, reasoning="Manual", detected_problems=["late invoices"])
+    lead = Lead(
+        post_id="r1",
+        author="founder",
+        content_snippet="Looking for a tool",
+        intent_score=0.9,
+        contact_url="https://example.com",
+        verified_profiles={"github": "https://github.com/founder"},
+    )
+    report = ValidationReport(
+        post_id="r1",
+        idea_summary="Invoice chasing",
+        market_size_estimate="Large",
+        competitors=[{"name": "Chaser", "url": "https://chaser.example"}],
+        swot_analysis={"strengths": ["Simple"]},
+        validation_verdict="Go",
+        next_steps=["Interview users"],
+    )
+    score = OpportunityScore(
+        post_id="r1", source="reddit", final_score=0.7, dimensions={"recency": 0.5}
+    )
+    storage.save_post(post)
+    storage.save_signal("r1", signal)
+    storage.save_lead(lead)
+    storage.save_report(report)
+    storage.save_opportunity_score(score)
+
+    assert storage.get_post_by_id("r1") == post
+    assert storage.get_signal("r1") == signal
+    stored_lead = storage.get_leads()[0]
+    assert stored_lead.model_dump(exclude={"id"}) == lead.model_dump(exclude={"id"})
+    assert storage.get_reports() == [report]
+    assert storage.get_opportunity_scores() == [score]
+
+    # Read models behave like validated ones
+    stored = storage.get_posts()[0]
+    assert stored.model_dump() == post.model_dump()
+    stored.title = "Edited"
+    assert storage.get_posts()[0].title == "Invoice reminders"
+    assert ScrapedPost.model_validate_json(stored.model_dump_json()).title == "Edited"
+
+
+def test_sqlite_iterators_stream_with_source_and_time_filters(storage):
+    now = datetime.now(timezone.utc)
+    storage.save_posts(
+        [_term_post(f"i{i}", "reddit" if i % 2 else "g2", i, "Invoice reminders") for i in range(10)]
+    )
+    storage.save_signals({f"i{i}": PainScore(score=0.5, reasoning="why") for i in range(0, 10, 3)})
+    storage.save_leads(
+        [
+            Lead(
+                post_id=f"i{i}",
+                source="reddit" if i % 2 else "g2",
+                author="a",
+                content_snippet="s",
+                intent_score=0.7,
+                contact_url="u",
+                created_at=now - timedelta(days=i),
+            )
+            for i in range(5)
+        ]
+    )
+    storage.save_opportunity_scores(
+        [
+            OpportunityScore(post_id=f"i{i}", source="reddit", final_score=i / 10)
+            for i in range(5)
+        ]
+    )
+
+    # Newest first, across several chunks
+    assert [p.id for p in storage.iter_posts(chunk_size=3)] == [f"i{i}" for i in range(10)]
+    assert [p.id for p in storage.iter_posts(source="g2", chunk_size=2)] == [
+        "i0", "i2", "i4", "i6", "i8"
+    ]
+    since, until = now - timedelta(days=5, hours=12), now - timedelta(days=1, hours=12)
+    assert [p.id for p in storage.iter_posts(since=since, until=until)] == [
+        "i2", "i3", "i4", "i5"
+    ]
+    assert [p.id for p in storage.iter_posts(analyzed_only=True)] == ["i0", "i3", "i6", "i9"]
+    assert storage.count_posts(analyzed_only=True) == 4
+    assert storage.count_posts(source="reddit", since=since, until=until) == 2
+
+    assert [l.post_id for l in storage.iter_leads(source="reddit", chunk_size=1)] == ["i1", "i3"]
+    assert [l.post_id for l in storage.iter_leads(since=now - timedelta(days=1, hours=12))] == [
+        "i0", "i1"
+    ]
+    assert [s.post_id for s in storage.iter_scores(chunk_size=2)] == [
+        "i4", "i3", "i2", "i1", "i0"
+    ]
+    assert list(storage.iter_reports(source="g2")) == []
+
+
+def test_sqlite_time_filters_compare_instants_across_offsets(storage):
+    boundary = datetime(2026, 3, 1, 12, 0, tzinfo=timezone.utc)
+    stamps = {
+        # 11:30 UTC, but sorts after the boundary as text
+        "east_before": datetime(2026, 3, 1, 16, 30, tzinfo=timezone(timedelta(hours=5))),
+        # 13:00 UTC, but sorts before the boundary as text
+        "west_after": datetime(2026, 3, 1, 5, 0, tzinfo=timezone(timedelta(hours=-8))),
+        "naive_after": datetime(2026, 3, 1, 12, 0, 0, 500000),
+        "utc_before": boundary - timedelta(milliseconds=1),
+    }
+    storage.save_posts(
+        [
+            ScrapedPost(
+                id=post_id,
+                source="reddit",
+                title="Invoice reminders",
+                author="a",
+                url="u",
+                upvotes=1,
+                comments_count=0,
+                created_at=created_at,
+            )
+            for post_id, created_at in stamps.items()
+        ]
+    )
+
+    assert sorted(p.id for p in storage.iter_posts(since=boundary)) == ["naive_after", "west_after"]
+    assert sorted(p.id for p in storage.iter_posts(until=boundary)) == ["east_before", "utc_before"]
+    assert storage.count_posts(since=boundary.replace(tzinfo=None)) == 2
+
+    # Search agrees with the iterators on what "since" means
+    hits = storage.search_posts("invoice", since=boundary.isoformat())
+    assert sorted(h["post"].id for h in hits) == ["naive_after", "west_after"]
+    assert len(storage.search_posts("invoice", since="2026-03-02")) == 0
+    with pytest.raises(ValueError):
+        storage.search_posts("invoice", since="last tuesday")
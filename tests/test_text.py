@@ -0,0 +1,43 @@
+from copilot.core.text import (
+    NearDuplicateIndex,
+    content_minhash,
+    estimate_similarity,
+    minhash,
+    normalize_text,
+)
+
+QUESTION = (
+    "What do you use to track invoices for a small agency? "
+    "We are drowning in spreadsheets and manual reminders every month."
+)
+
+
+def test_normalize_text_drops_urls_and_punctuation():
+    assert normalize_text("Check https://x.com/a NOW!!  ok?") == "check now ok"
+
+
+def test_minhash_ignores_formatting_changes():
+    reformatted = QUESTION.upper().replace(" ", "  ") + " https://reddit.com/r/saas"
+    assert minhash(QUESTION) == minhash(reformatted)
+
+
+def test_minhash_similarity_tracks_overlap():
+    edited = QUESTION + " Thanks in advance!"
+    other = (
+        "Show HN: a tiny Rust crate for parsing TOML files without allocations, "
+        "feedback on the API very welcome."
+    )
+    assert estimate_similarity(minhash(QUESTION), minhash(edited)) >= 0.8
+    assert estimate_similarity(minhash(QUESTION), minhash(other)) < 0.2
+
+
+def test_short_text_has_no_fingerprint():
+    assert content_minhash("Help?", None) is None
+
+
+def test_index_finds_near_duplicate():
+    index = NearDuplicateIndex(threshold=0.8)
+    index.add("t3_a", minhash(QUESTION))
+
+    assert index.find(minhash(QUESTION + " Thanks!")) == "t3_a"
+    assert index.find(minhash("Launching my Rust side project, feedback on pricing welcome")) is None